@@ -1,17 +1,414 @@
-"""Main program."""
+"""Main program.
 
-from maze_solver_with_python.core.models import Maze, Point, Window
+``maze`` alone opens a window and animates a maze; the sub-commands run
+headlessly. Each sub-command imports what only it needs, the process pool,
+the benchmark suite, the image exporters or :mod:`tkinter`, when it runs,
+so a headless run only pays for the modules it uses and works without Tk.
+"""
 
+import argparse
+import json
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Optional
 
-def main() -> None:
-    """Main app."""
-    win = Window(800, 600)
-    p1 = Point(50, 50)
+from maze_solver_with_python.core.models import Maze, Point
 
-    m = Maze(p1, 10, 14, 50, 50, win)
+OUTPUT_FORMATS = ("summary", "json", "maze", "png", "ppm", "svg")
+"""Formats accepted by ``maze solve --format``."""
+
+
+def seed_range(text: str) -> range:
+    """Parse ``START:STOP`` (or a bare count) into a range of seeds.
+
+    Args:
+        text (str): Command-line value.
+
+    Returns:
+        range: The seeds, ``STOP`` excluded.
+
+    Raises:
+        argparse.ArgumentTypeError: If *text* is not a valid range.
+    """
+    start, _, stop = text.rpartition(":")
+    try:
+        return range(int(start or 0), int(stop))
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError("Expected START:STOP or COUNT.") from exc
+
+
+def positive_int(text: str) -> int:
+    """Parse a whole number of at least 1.
+
+    Args:
+        text (str): Command-line value.
+
+    Returns:
+        int: The number.
+
+    Raises:
+        argparse.ArgumentTypeError: If *text* is not a positive int.
+    """
+    try:
+        value = int(text)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError("Expected a whole number.") from exc
+    if value < 1:
+        raise argparse.ArgumentTypeError("Must be at least 1.")
+    return value
+
+
+def size_list(text: str) -> list[int]:
+    """Parse a comma-separated list of maze sides.
+
+    Args:
+        text (str): Command-line value, e.g. ``50,100,300``.
+
+    Returns:
+        list[int]: The sides.
+
+    Raises:
+        argparse.ArgumentTypeError: If *text* is not a list of positive ints.
+    """
+    try:
+        sizes = [int(part) for part in text.split(",")]
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError("Expected comma-separated sizes.") from exc
+    if any(size < 1 for size in sizes):
+        raise argparse.ArgumentTypeError("Sizes must be positive.")
+    return sizes
+
+
+def add_maze_arguments(parser: argparse.ArgumentParser, rows: int, cols: int) -> None:
+    """Add the options describing a single maze to *parser*.
+
+    Args:
+        parser (argparse.ArgumentParser): Parser to extend.
+        rows (int): Default number of rows.
+        cols (int): Default number of columns.
+    """
+    parser.add_argument("--rows", type=positive_int, default=rows)
+    parser.add_argument("--cols", type=positive_int, default=cols)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--generator", default="dfs")
+    parser.add_argument(
+        "--braid", type=float, default=0.0, help="share of dead ends to open"
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser.
+
+    Returns:
+        argparse.ArgumentParser: Parser with one sub-command per mode.
+    """
+    parser = argparse.ArgumentParser(prog="maze", description="Maze solver.")
+    commands = parser.add_subparsers(dest="command")
+
+    gui = commands.add_parser("gui", help="animate a maze in a window (default)")
+    add_maze_arguments(gui, rows=10, cols=14)
+    gui.add_argument(
+        "--cell-size", type=positive_int, default=50, help="pixels per cell"
+    )
+
+    solve = commands.add_parser("solve", help="generate and solve one maze headlessly")
+    add_maze_arguments(solve, rows=50, cols=50)
+    solve.add_argument("--solver", default="bfs")
+    solve.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default=None,
+        help="output format; defaults to the --output suffix, else summary",
+    )
+    solve.add_argument(
+        "--output", type=Path, default=None, help="write here instead of stdout"
+    )
+    solve.add_argument(
+        "--scale", type=int, default=4, help="image pixels per cell, at least 2"
+    )
+
+    batch = commands.add_parser("batch", help="generate and solve many mazes")
+    batch.add_argument("seeds", type=seed_range, help="START:STOP or COUNT")
+    batch.add_argument("--rows", type=positive_int, default=50)
+    batch.add_argument("--cols", type=positive_int, default=50)
+    batch.add_argument("--generator", default="dfs")
+    batch.add_argument("--solver", default="bfs")
+    batch.add_argument("--workers", type=positive_int, default=None)
+    batch.add_argument("--executor", choices=("process", "thread"), default="process")
+    batch.add_argument(
+        "--output", type=Path, default=None, help="directory for <seed>.maze files"
+    )
+
+    bench = commands.add_parser("bench", help="time generation, solving and drawing")
+    bench.add_argument(
+        "--sizes",
+        type=size_list,
+        default=None,
+        help="comma-separated maze sides; three standard sizes by default",
+    )
+    bench.add_argument("--repeats", type=positive_int, default=5)
+    bench.add_argument("--generator", default="dfs")
+    bench.add_argument("--solver", default="bfs")
+    bench.add_argument(
+        "--phases",
+        nargs="+",
+        default=None,
+        help="phases to run; all by default",
+    )
+    bench.add_argument("--output", type=Path, default=None, help="write JSON here")
+    bench.add_argument(
+        "--compare", type=Path, default=None, help="baseline JSON to check against"
+    )
+    bench.add_argument(
+        "--tolerance", type=float, default=0.1, help="allowed slowdown (0.1 = 10%%)"
+    )
+
+    serve = commands.add_parser("serve", help="serve mazes over HTTP")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8080)
+    serve.add_argument("--workers", type=positive_int, default=None)
+    serve.add_argument("--executor", choices=("process", "thread"), default="process")
+    serve.add_argument("--cache-size", type=positive_int, default=256)
+    serve.add_argument(
+        "--cache-mb", type=positive_int, default=64, help="cache budget in MiB"
+    )
+    return parser
+
+
+def run_serve(args: argparse.Namespace) -> None:
+    """Run the ``serve`` sub-command until interrupted.
+
+    Args:
+        args (argparse.Namespace): Parsed ``serve`` arguments.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    import asyncio
+
+    # pylint: disable-next=import-outside-toplevel
+    from maze_solver_with_python.core.server import serve
+
+    print(f"Serving mazes on http://{args.host}:{args.port}/")
+    try:
+        asyncio.run(
+            serve(
+                args.host,
+                args.port,
+                args.workers,
+                args.executor,
+                args.cache_size,
+                args.cache_mb * 1024 * 1024,
+            )
+        )
+    except KeyboardInterrupt:
+        pass
+
+
+def run_bench(args: argparse.Namespace) -> int:
+    """Run the ``bench`` sub-command and print a results table.
+
+    Args:
+        args (argparse.Namespace): Parsed ``bench`` arguments.
+
+    Returns:
+        int: ``1`` if ``--compare`` found regressions, else ``0``.
+
+    Raises:
+        SystemExit: If a phase is not one of the benchmark phases or the
+            ``--compare`` baseline cannot be read.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from maze_solver_with_python.core.bench import (
+        DEFAULT_SIZES,
+        PHASES,
+        compare,
+        dump_results,
+        format_table,
+        load_results,
+        run_benchmarks,
+    )
+
+    phases = PHASES if args.phases is None else args.phases
+    unknown = [phase for phase in phases if phase not in PHASES]
+    if unknown:
+        raise SystemExit(
+            f"Unknown phase: {unknown[0]}. Choose from {', '.join(PHASES)}."
+        )
+    baseline = None
+    if args.compare is not None:
+        try:
+            baseline = load_results(args.compare)
+        except (OSError, ValueError) as exc:
+            raise SystemExit(f"Cannot read {args.compare}: {exc}") from None
+    sizes = DEFAULT_SIZES if args.sizes is None else args.sizes
+    results = run_benchmarks(sizes, args.repeats, args.generator, args.solver, phases)
+    print(format_table(results))
+    if args.output is not None:
+        dump_results(results, args.output)
+    if baseline is None:
+        return 0
+    regressions = compare(results, baseline, args.tolerance)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    if not regressions:
+        print(f"No regressions against {args.compare}.")
+    return 1 if regressions else 0
+
+
+def run_batch(args: argparse.Namespace) -> None:
+    """Run the ``batch`` sub-command, printing one line per seed.
+
+    Args:
+        args (argparse.Namespace): Parsed ``batch`` arguments.
+
+    Raises:
+        SystemExit: If the generator or solver is not a registered name.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from maze_solver_with_python.core.batch import generate_batch
+
+    try:
+        results = generate_batch(
+            args.seeds,
+            args.rows,
+            args.cols,
+            generator=args.generator,
+            solver=args.solver,
+            workers=args.workers,
+            executor=args.executor,
+        )
+    except ValueError as exc:
+        raise SystemExit(str(exc)) from None
+    if args.output is not None:
+        args.output.mkdir(parents=True, exist_ok=True)
+    for result in results:
+        if args.output is not None:
+            (args.output / f"{result.seed}.maze").write_bytes(result.layout)
+        print(
+            f"seed={result.seed} path={len(result.path)}"
+            f" generate={result.generate_seconds * 1e3:.2f}ms"
+            f" solve={result.solve_seconds * 1e3:.2f}ms"
+        )
+
+
+def run_solve(args: argparse.Namespace) -> None:
+    """Run the ``solve`` sub-command: build, solve and write one maze.
+
+    Args:
+        args (argparse.Namespace): Parsed ``solve`` arguments.
+
+    Raises:
+        SystemExit: If a binary format is requested without ``--output``,
+            ``--scale`` is below 2, or the generator, solver or braid is
+            invalid.
+    """
+    if args.scale < 2:
+        raise SystemExit("--scale must be at least 2.")
+    fmt = args.format
+    if fmt is None:
+        suffix = "" if args.output is None else args.output.suffix.lstrip(".")
+        fmt = suffix.lower() if suffix.lower() in OUTPUT_FORMATS else "summary"
+    if fmt in ("maze", "png", "ppm", "svg") and args.output is None:
+        raise SystemExit(f"--format {fmt} needs --output.")
+
+    try:
+        maze = Maze(
+            Point(0, 0),
+            args.rows,
+            args.cols,
+            1,
+            1,
+            seed=args.seed,
+            generator=args.generator,
+            braid=args.braid,
+        )
+        if fmt in ("png", "ppm", "svg"):
+            maze.export(args.output, args.solver, scale=args.scale, fmt=fmt)
+            return
+        result = maze.find_path(args.solver)
+    except ValueError as exc:
+        raise SystemExit(str(exc)) from None
+    if fmt == "maze":
+        maze.save(args.output)
+        return
+    if fmt == "json":
+        text = json.dumps(
+            {
+                "rows": args.rows,
+                "cols": args.cols,
+                "seed": args.seed,
+                "generator": args.generator,
+                "solver": args.solver,
+                "expanded": result.expanded,
+                "path": result.path,
+            }
+        )
+    else:
+        text = (
+            f"rows={args.rows} cols={args.cols} seed={args.seed}"
+            f" path={len(result.path)} expanded={result.expanded}"
+        )
+    if args.output is None:
+        print(text)
+    else:
+        args.output.write_text(text + "\n", encoding="utf-8")
+
+
+def run_gui(args: Optional[argparse.Namespace] = None) -> None:
+    """Open a window and animate generating and solving a maze.
+
+    Args:
+        args (argparse.Namespace | None): Parsed ``gui`` arguments; defaults
+            to a 10 × 14 maze of 50-pixel cells.
+
+    Raises:
+        SystemExit: If the generator or braid is invalid.
+    """
+    if args is None:
+        args = build_parser().parse_args(["gui"])
+    # pylint: disable-next=import-outside-toplevel
+    from maze_solver_with_python.core.models import Window
+
+    margin = args.cell_size
+    win = Window(
+        args.cols * args.cell_size + 2 * margin, args.rows * args.cell_size + 2 * margin
+    )
+    try:
+        m = Maze(
+            Point(margin, margin),
+            args.rows,
+            args.cols,
+            args.cell_size,
+            args.cell_size,
+            win,
+            seed=args.seed,
+            generator=args.generator,
+            braid=args.braid,
+        )
+    except ValueError as exc:
+        raise SystemExit(str(exc)) from None
     m.solve()
     win.wait_for_close()
 
 
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Main app.
+
+    Args:
+        argv (Sequence[str] | None): Arguments; defaults to ``sys.argv[1:]``.
+    """
+    args = build_parser().parse_args(argv)
+    if args.command == "batch":
+        run_batch(args)
+    elif args.command == "bench":
+        sys.exit(run_bench(args))
+    elif args.command == "solve":
+        run_solve(args)
+    elif args.command == "serve":
+        run_serve(args)
+    else:
+        run_gui(args if args.command == "gui" else None)
+
+
 if __name__ == "__main__":
     main()
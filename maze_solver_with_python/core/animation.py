@@ -0,0 +1,217 @@
+"""Module defining frame-budgeted animation playback.
+
+Generation and solving run at full speed and queue their drawing operations
+into an :class:`AnimationScheduler`, one *step* at a time (a step is what used
+to be followed by a fixed ``time.sleep(0.05)``). Playback then applies a fixed
+number of steps per frame from a timer such as :meth:`tkinter.Misc.after`, so
+the window stays responsive and the animation speed no longer depends on how
+long the algorithm takes.
+
+The queue has a frame budget. When more steps are waiting than
+:attr:`~AnimationScheduler.max_frames` frames can show, the pending steps are
+collapsed into one holding only the latest operation per target, so a long
+run queues at most one operation per cell or segment and playback jumps ahead
+rather than lagging minutes behind.
+"""
+
+from collections import deque
+from collections.abc import Callable
+from typing import Any, Optional
+
+Op = tuple[Callable[..., object], tuple[Any, ...]]
+"""A queued drawing call: a function and its positional arguments."""
+
+
+class AnimationScheduler:
+    """Queue drawing steps and play them back at a target frame rate.
+
+    Attributes:
+        fps (float): Target frames per second during playback.
+        steps_per_frame (int): Steps applied per frame.
+        instant (bool): When ``True`` operations run as soon as they are
+            pushed, so only the finished state is ever shown.
+        max_frames (int | None): Most frames of steps kept queued; ``None``
+            keeps every step.
+    """
+
+    __slots__ = (
+        "_queue",
+        "_steps",
+        "fps",
+        "instant",
+        "max_frames",
+        "playing",
+        "steps_per_frame",
+    )
+
+    def __init__(
+        self,
+        fps: float = 60.0,
+        steps_per_frame: int = 1,
+        instant: bool = False,
+        max_frames: Optional[int] = 600,
+    ) -> None:
+        """Initialize an idle scheduler with nothing queued.
+
+        Args:
+            fps (float): Target frames per second during playback.
+            steps_per_frame (int): Steps applied per frame.
+            instant (bool): Skip animation and apply operations immediately.
+            max_frames (int | None): Frame budget of the queue; once more
+                than ``max_frames * steps_per_frame`` steps are pending they
+                are collapsed (see :meth:`collapse`). Defaults to ten seconds
+                at 60 frames per second; ``None`` never collapses.
+
+        Raises:
+            ValueError: If *fps*, *steps_per_frame* or *max_frames* is not
+                positive.
+        """
+        if fps <= 0:
+            raise ValueError("fps must be positive.")
+        if steps_per_frame < 1:
+            raise ValueError("steps_per_frame must be at least 1.")
+        if max_frames is not None and max_frames < 1:
+            raise ValueError("max_frames must be at least 1.")
+        self.fps = fps
+        self.steps_per_frame = steps_per_frame
+        self.instant = instant
+        self.max_frames = max_frames
+        self.playing = False
+        # Operations in order; ``None`` marks the end of a step.
+        self._queue: deque[Optional[Op]] = deque()
+        self._steps = 0
+
+    @property
+    def interval_ms(self) -> int:
+        """Delay between frames in whole milliseconds (at least 1).
+
+        Returns:
+            int: ``round(1000 / fps)``.
+        """
+        return max(1, round(1000 / self.fps))
+
+    @property
+    def pending(self) -> int:
+        """Number of queued steps, an unfinished trailing step included.
+
+        Returns:
+            int: Steps left to play.
+        """
+        trailing = bool(self._queue) and self._queue[-1] is not None
+        return self._steps + trailing
+
+    def push(self, func: Callable[..., object], *args: Any) -> None:
+        """Queue ``func(*args)`` as part of the current step.
+
+        Arguments are captured now, so callers must pass the state to show
+        (such as a wall mask) rather than something read back later. The last
+        argument must be that state and the others must be hashable and name
+        what it applies to, as :meth:`collapse` keeps one call per target.
+
+        Args:
+            func (Callable[..., object]): Drawing call to make.
+            *args (Any): Its positional arguments.
+        """
+        if self.instant:
+            func(*args)
+        else:
+            self._queue.append((func, args))
+
+    def end_step(self) -> None:
+        """Close the current step; empty steps are dropped.
+
+        Collapses the queue when the step takes it over the frame budget.
+        """
+        if self._queue and self._queue[-1] is not None:
+            self._queue.append(None)
+            self._steps += 1
+            if (
+                self.max_frames is not None
+                and self._steps > self.max_frames * self.steps_per_frame
+            ):
+                self.collapse()
+
+    def collapse(self) -> None:
+        """Merge every pending step into one showing only the final state.
+
+        An operation's target is its function and every argument but the
+        last. Only the latest operation per target is kept, in the order of
+        those last writes, so applying the merged step leaves the canvas
+        exactly as replaying every step would.
+        """
+        latest: dict[tuple[Callable[..., object], tuple[Any, ...]], Op] = {}
+        for op in self._queue:
+            if op is not None:
+                key = (op[0], op[1][:-1])
+                latest.pop(key, None)
+                latest[key] = op
+        trailing = bool(self._queue) and self._queue[-1] is not None
+        self._queue = deque(latest.values())
+        self._steps = 0
+        if self._queue and not trailing:
+            self._queue.append(None)
+            self._steps = 1
+
+    def advance(self, steps: Optional[int] = None) -> int:
+        """Apply up to *steps* queued steps.
+
+        Args:
+            steps (int | None): Steps to apply; defaults to
+                :attr:`steps_per_frame`.
+
+        Returns:
+            int: Number of steps applied.
+        """
+        if steps is None:
+            steps = self.steps_per_frame
+        queue = self._queue
+        done = 0
+        while queue and done < steps:
+            op = queue.popleft()
+            if op is None:
+                self._steps -= 1
+                done += 1
+            else:
+                op[0](*op[1])
+                if not queue:
+                    done += 1  # an unfinished trailing step
+        return done
+
+    def drain(self) -> int:
+        """Apply every queued step at once.
+
+        Returns:
+            int: Number of steps applied.
+        """
+        return self.advance(self.pending)
+
+    def play(
+        self, after: Callable[..., object], on_frame: Callable[[], object]
+    ) -> None:
+        """Start timer-driven playback unless it is running or idle.
+
+        Every :attr:`interval_ms` a frame applies :attr:`steps_per_frame`
+        steps and calls *on_frame*; playback stops when the queue empties and
+        a later :meth:`play` restarts it.
+
+        Args:
+            after (Callable[..., object]): Timer with the signature of
+                :meth:`tkinter.Misc.after`: ``after(ms, func, *args)``.
+            on_frame (Callable[[], object]): Called after each frame's steps,
+                typically to flush the renderer.
+        """
+        if self.playing or not self._queue:
+            return
+        self.playing = True
+        after(self.interval_ms, self._frame, after, on_frame)
+
+    def _frame(
+        self, after: Callable[..., object], on_frame: Callable[[], object]
+    ) -> None:
+        """Play one frame and schedule the next while steps remain."""
+        self.advance()
+        on_frame()
+        if self._queue:
+            after(self.interval_ms, self._frame, after, on_frame)
+        else:
+            self.playing = False
@@ -0,0 +1,296 @@
+"""Module defining the built-in performance benchmark behind ``maze bench``.
+
+Each phase of the maze pipeline is timed headlessly on square mazes of
+several sizes:
+
+=============  ==============================================================
+Phase          What is timed
+=============  ==============================================================
+``generate``   Building a :class:`~maze_solver_with_python.core.models.Maze`
+``solve``      :meth:`Maze.solve` (the depth-first solver)
+``find_path``  :meth:`Maze.find_path` with the chosen solver
+``draw``       Drawing every cell through ``Cell.draw`` to a null window
+``export``     Rasterising the maze and its solution and encoding a PNG
+=============  ==============================================================
+
+Every phase is run several times to get latency percentiles, then once more
+under :mod:`tracemalloc` for its peak memory, so tracing never skews the
+timings. Results round-trip through JSON, and :func:`compare` flags the ones
+that got slower or hungrier than a stored baseline.
+"""
+
+import json
+import os
+import platform
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from maze_solver_with_python.core.export import encode_png, rasterize
+from maze_solver_with_python.core.models import Line, Maze, Point
+
+PHASES = ("generate", "solve", "find_path", "draw", "export")
+"""Benchmark phases, in the order they run."""
+
+DEFAULT_SIZES = (50, 100, 300)
+"""Default maze sides; each maze is ``side`` × ``side`` cells."""
+
+FORMAT_VERSION = 1
+
+_RESOLUTION = time.get_clock_info("perf_counter").resolution
+
+
+@dataclass(frozen=True)
+class PhaseResult:
+    """Timings of one phase at one maze size.
+
+    Attributes:
+        phase (str): One of :data:`PHASES`.
+        cells (int): Number of cells in the maze.
+        runs (int): Number of timed runs.
+        p50_ms (float): Median run time in milliseconds.
+        p90_ms (float): 90th percentile run time in milliseconds.
+        p99_ms (float): 99th percentile run time in milliseconds.
+        cells_per_sec (float): ``cells`` divided by the median run time, or
+            by the timer resolution if the median is shorter.
+        peak_kib (float): Peak traced memory of one run in KiB.
+    """
+
+    phase: str
+    cells: int
+    runs: int
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+    cells_per_sec: float
+    peak_kib: float
+
+
+class _NullWindow:
+    """Window stand-in that accepts drawing calls and discards them."""
+
+    def draw_line(
+        self, line: Line, fill_color: str = "black", visible: bool = True
+    ) -> None:
+        """Discard a line."""
+
+    def draw_cell(self, x1: int, y1: int, x2: int, y2: int, mask: int) -> None:
+        """Discard a cell."""
+
+    def step(self) -> None:
+        """Discard an animation step."""
+
+
+def percentile(samples: Sequence[float], q: float) -> float:
+    """Return the nearest-rank *q*-th percentile of *samples*.
+
+    Args:
+        samples (Sequence[float]): Values in any order.
+        q (float): Percentile between ``0`` and ``100``.
+
+    Returns:
+        float: The smallest sample with at least *q* percent of the samples
+        at or below it.
+    """
+    ordered = sorted(samples)
+    rank = max(1, -(-len(ordered) * q // 100))
+    return ordered[int(rank) - 1]
+
+
+def _phase_runner(
+    phase: str, side: int, generator: str, solver: str
+) -> Callable[[int], object]:
+    """Return a callable running *phase* once for a given seed."""
+
+    def build(seed: int) -> Maze:
+        return Maze(Point(0, 0), side, side, 1, 1, seed=seed, generator=generator)
+
+    if phase == "generate":
+        return build
+    maze = build(0)
+    if phase == "solve":
+        return lambda seed: maze.solve()
+    if phase == "find_path":
+        return lambda seed: maze.find_path(solver)
+    if phase == "draw":
+        maze.win = _NullWindow()  # type: ignore[assignment]
+        return lambda seed: maze._draw_all_cells()
+    path = maze.find_path(solver).path
+    return lambda seed: encode_png(rasterize(maze._grid, path))
+
+
+def run_phase(
+    phase: str, side: int, repeats: int, generator: str = "dfs", solver: str = "bfs"
+) -> PhaseResult:
+    """Time one phase on a ``side`` × ``side`` maze.
+
+    Args:
+        phase (str): One of :data:`PHASES`.
+        side (int): Rows and columns of the maze.
+        repeats (int): Number of timed runs.
+        generator (str): Generator used to build the mazes.
+        solver (str): Solver used by ``find_path`` and ``export``.
+
+    Returns:
+        PhaseResult: The timings.
+
+    Raises:
+        ValueError: If *phase* is unknown or *repeats* is less than 1.
+    """
+    if phase not in PHASES:
+        raise ValueError("Unknown phase.")
+    if repeats < 1:
+        raise ValueError("repeats must be at least 1.")
+    run = _phase_runner(phase, side, generator, solver)
+    samples = []
+    for seed in range(repeats):
+        start = time.perf_counter()
+        run(seed)
+        samples.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        run(repeats)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    cells = side * side
+    p50 = percentile(samples, 50)
+    return PhaseResult(
+        phase=phase,
+        cells=cells,
+        runs=repeats,
+        p50_ms=p50 * 1e3,
+        p90_ms=percentile(samples, 90) * 1e3,
+        p99_ms=percentile(samples, 99) * 1e3,
+        # A run faster than the clock can tell counts as one clock tick, so
+        # the rate stays finite and the file stays standard JSON.
+        cells_per_sec=cells / max(p50, _RESOLUTION),
+        peak_kib=peak / 1024,
+    )
+
+
+def run_benchmarks(
+    sizes: Iterable[int] = DEFAULT_SIZES,
+    repeats: int = 5,
+    generator: str = "dfs",
+    solver: str = "bfs",
+    phases: Iterable[str] = PHASES,
+) -> list[PhaseResult]:
+    """Time every phase at every size.
+
+    Args:
+        sizes (Iterable[int]): Maze sides to run.
+        repeats (int): Timed runs per phase and size.
+        generator (str): Generator used to build the mazes.
+        solver (str): Solver used by ``find_path`` and ``export``.
+        phases (Iterable[str]): Phases to run, from :data:`PHASES`.
+
+    Returns:
+        list[PhaseResult]: One result per size and phase, sizes outermost.
+    """
+    phases = tuple(phases)
+    return [
+        run_phase(phase, side, repeats, generator, solver)
+        for side in sizes
+        for phase in phases
+    ]
+
+
+def dump_results(results: Iterable[PhaseResult], path: str | os.PathLike[str]) -> None:
+    """Write *results* to *path* as JSON, with the interpreter and platform.
+
+    Args:
+        results (Iterable[PhaseResult]): Results to save.
+        path (str | os.PathLike[str]): Destination file.
+    """
+    document = {
+        "version": FORMAT_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": [asdict(result) for result in results],
+    }
+    text = json.dumps(document, indent=2, allow_nan=False)
+    Path(path).write_text(text + "\n", encoding="utf-8")
+
+
+def load_results(path: str | os.PathLike[str]) -> list[PhaseResult]:
+    """Read results written by :func:`dump_results`.
+
+    Args:
+        path (str | os.PathLike[str]): File to read.
+
+    Returns:
+        list[PhaseResult]: The stored results.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file is not a benchmark result file.
+    """
+    document = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(document, dict) or document.get("version") != FORMAT_VERSION:
+        raise ValueError("Not a benchmark result file.")
+    try:
+        return [PhaseResult(**entry) for entry in document["results"]]
+    except (KeyError, TypeError) as exc:
+        raise ValueError("Not a benchmark result file.") from exc
+
+
+def compare(
+    current: Iterable[PhaseResult],
+    baseline: Iterable[PhaseResult],
+    tolerance: float = 0.1,
+) -> list[str]:
+    """Return a message for every result worse than its baseline.
+
+    Results are matched by phase and cell count; unmatched ones are skipped.
+    A result regresses when its median time or peak memory exceeds the
+    baseline's by more than *tolerance*.
+
+    Args:
+        current (Iterable[PhaseResult]): Fresh results.
+        baseline (Iterable[PhaseResult]): Stored results.
+        tolerance (float): Allowed relative slowdown, e.g. ``0.1`` for 10%.
+
+    Returns:
+        list[str]: Human-readable regressions; empty when there are none.
+    """
+    previous = {(result.phase, result.cells): result for result in baseline}
+    regressions = []
+    for result in current:
+        before = previous.get((result.phase, result.cells))
+        if before is None:
+            continue
+        for field, unit in (("p50_ms", "ms"), ("peak_kib", "KiB")):
+            old, new = getattr(before, field), getattr(result, field)
+            if new > old * (1 + tolerance):
+                change = f"{new / old - 1:+.0%}" if old else "new"
+                regressions.append(
+                    f"{result.phase} at {result.cells:,} cells: {field} "
+                    f"{old:.2f} -> {new:.2f} {unit} ({change})"
+                )
+    return regressions
+
+
+def format_table(results: Iterable[PhaseResult]) -> str:
+    """Return *results* as an aligned text table.
+
+    Args:
+        results (Iterable[PhaseResult]): Results to show.
+
+    Returns:
+        str: One header line and one line per result.
+    """
+    lines = [
+        f"{'phase':<10} {'cells':>9}  {'p50 ms':>9}  {'p90 ms':>9}  {'p99 ms':>9}"
+        f"  {'cells/s':>12}  {'peak KiB':>9}"
+    ]
+    for r in results:
+        lines.append(
+            f"{r.phase:<10} {r.cells:>9,}  {r.p50_ms:>9.2f}  {r.p90_ms:>9.2f}"
+            f"  {r.p99_ms:>9.2f}  {r.cells_per_sec:>12,.0f}  {r.peak_kib:>9,.0f}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,181 @@
+"""Module defining a cache of solver results keyed by maze content.
+
+A key is :func:`fingerprint` of the grid and the start and goal cells,
+followed by the solver name, so any two mazes with the same wall layout share
+entries however they were built or loaded. :class:`SolveCache` keeps recent
+results in memory with least-recently-used eviction and can also persist
+them to a directory, so they survive restarts and can be shared between
+processes.
+
+A :class:`SolveCache` may be shared between threads: the in-memory tier is
+guarded by a lock, and each disk write goes to its own temporary file that is
+renamed into place, so concurrent writers, threads or processes, never leave
+a partial or interleaved file.
+"""
+
+import hashlib
+import os
+import struct
+import threading
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from maze_solver_with_python.core.grid import WallGrid
+from maze_solver_with_python.core.solvers import SolveResult
+
+_KEY_HEADER = struct.Struct("<IIII")
+_EXPANDED = struct.Struct("<Q")
+_SUFFIX = ".path"
+
+
+def fingerprint(grid: WallGrid, start: int, goal: int) -> str:
+    """Return a content hash of *grid*'s walls and the *start* and *goal*.
+
+    Args:
+        grid (WallGrid): The maze.
+        start (int): Flat index of the start cell.
+        goal (int): Flat index of the goal cell.
+
+    Returns:
+        str: 64 hexadecimal digits of SHA-256.
+    """
+    digest = hashlib.sha256(_KEY_HEADER.pack(grid.num_cols, grid.num_rows, start, goal))
+    digest.update(bytes(grid.walls))
+    return digest.hexdigest()
+
+
+class SolveCache:
+    """A bounded LRU of :class:`SolveResult` objects with an optional disk tier.
+
+    Results are returned as stored, so callers must not modify them. All
+    methods are safe to call from several threads at once.
+
+    Attributes:
+        maxsize (int): Most results kept in memory.
+        directory (Path | None): Where results are also written, if anywhere.
+        hits (int): Lookups answered from memory or disk.
+        misses (int): Lookups that found nothing.
+    """
+
+    __slots__ = ("_entries", "_lock", "directory", "hits", "maxsize", "misses")
+
+    def __init__(
+        self, maxsize: int = 1024, directory: Optional[str | os.PathLike[str]] = None
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            maxsize (int): Most results kept in memory.
+            directory (str | os.PathLike[str] | None): Directory for the disk
+                tier, created if missing; ``None`` keeps results in memory
+                only.
+
+        Raises:
+            ValueError: If *maxsize* is less than 1.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+        self.maxsize = maxsize
+        self.directory = None if directory is None else Path(directory)
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, SolveResult] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[SolveResult]:
+        """Return the result stored under *key*, or ``None``.
+
+        A result found only on disk is promoted into memory.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            SolveResult | None: The cached result, if any.
+        """
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+        if self.directory is not None:
+            result = self._read(self.directory / (key + _SUFFIX))
+        with self._lock:
+            if result is None:
+                self.misses += 1
+            else:
+                self._remember(key, result)
+                self.hits += 1
+        return result
+
+    def put(self, key: str, result: SolveResult) -> None:
+        """Store *result* under *key*, evicting the least recently used.
+
+        Args:
+            key (str): Cache key.
+            result (SolveResult): Result to keep.
+        """
+        with self._lock:
+            self._remember(key, result)
+        if self.directory is not None:
+            self._write(self.directory / (key + _SUFFIX), result)
+
+    def clear(self) -> None:
+        """Drop every in-memory result and reset the counters.
+
+        Files in the disk tier are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def _remember(self, key: str, result: SolveResult) -> None:
+        """Add *result* to the in-memory LRU; the caller holds the lock."""
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    @staticmethod
+    def _write(path: Path, result: SolveResult) -> None:
+        """Write *result* to *path* atomically.
+
+        The temporary file gets a unique name, so threads and processes
+        writing the same key never share one.
+        """
+        # pylint: disable-next=import-outside-toplevel
+        import tempfile
+
+        coords = array("I", [v for cell in result.path for v in cell])
+        with tempfile.NamedTemporaryFile(
+            dir=path.parent, prefix=f"{path.name}.", suffix=".tmp", delete=False
+        ) as tmp:
+            tmp.write(_EXPANDED.pack(result.expanded) + coords.tobytes())
+        try:
+            os.replace(tmp.name, path)
+        except OSError:
+            os.unlink(tmp.name)
+            raise
+
+    @staticmethod
+    def _read(path: Path) -> Optional[SolveResult]:
+        """Return the result stored in *path*, or ``None`` if it is unusable."""
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        size = _EXPANDED.size
+        if len(data) < size or (len(data) - size) % 8:
+            return None
+        coords = array("I")
+        coords.frombytes(data[size:])
+        (expanded,) = _EXPANDED.unpack_from(data)
+        return SolveResult(list(zip(coords[0::2], coords[1::2])), expanded)
@@ -0,0 +1,135 @@
+"""Module defining distance fields and the maze metrics derived from them.
+
+A :class:`DistanceField` holds the number of steps from the nearest source
+cell to every cell, computed by one breadth-first sweep. It stores them in a
+flat ``array`` of C ints in the grid's column-major order and exposes that
+buffer directly, so ``memoryview(field)`` or ``numpy.asarray(field)`` share
+the memory instead of copying it.
+"""
+
+from array import array
+from collections import deque
+from collections.abc import Iterable
+
+from maze_solver_with_python.core.grid import WallGrid
+
+UNREACHABLE = -1
+"""Distance stored for cells no source can reach."""
+
+
+class DistanceField:
+    """Breadth-first distances from one or more source cells.
+
+    Attributes:
+        num_cols (int): Number of columns of the grid.
+        num_rows (int): Number of rows of the grid.
+        sources (tuple[int, ...]): Flat indices the sweep started from.
+        values (array): Distance of each cell by flat index, or
+            :data:`UNREACHABLE`.
+    """
+
+    __slots__ = ("num_cols", "num_rows", "sources", "values")
+
+    def __init__(self, grid: WallGrid, sources: Iterable[int]) -> None:
+        """Run the sweep.
+
+        Args:
+            grid (WallGrid): The maze walls.
+            sources (Iterable[int]): Flat indices of the cells at distance 0.
+
+        Raises:
+            ValueError: If *sources* is empty.
+        """
+        self.num_cols = grid.num_cols
+        self.num_rows = grid.num_rows
+        self.sources = tuple(dict.fromkeys(sources))
+        if not self.sources:
+            raise ValueError("At least one source is required.")
+        values = array("i", [UNREACHABLE]) * len(grid)
+        for idx in self.sources:
+            values[idx] = 0
+        open_neighbors = grid.open_neighbors
+        queue = deque(self.sources)
+        while queue:
+            idx = queue.popleft()
+            step = values[idx] + 1
+            for n in open_neighbors(idx):
+                if values[n] == UNREACHABLE:
+                    values[n] = step
+                    queue.append(n)
+        self.values = values
+
+    def __buffer__(self, flags: int) -> memoryview:
+        return memoryview(self.values)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, cell: tuple[int, int]) -> int:
+        i, j = cell
+        if not (0 <= i < self.num_cols and 0 <= j < self.num_rows):
+            raise IndexError("Cell out of range.")
+        return self.values[i * self.num_rows + j]
+
+    def farthest(self) -> tuple[tuple[int, int], int]:
+        """Return the reachable cell farthest from every source.
+
+        Ties go to the lowest flat index.
+
+        Returns:
+            tuple[tuple[int, int], int]: ``(col, row)`` of the cell and its
+            distance.
+        """
+        values = self.values
+        distance = max(values)
+        return divmod(values.index(distance), self.num_rows), distance
+
+    def reachable(self) -> int:
+        """Return how many cells some source can reach.
+
+        Returns:
+            int: Number of cells whose distance is not :data:`UNREACHABLE`.
+        """
+        return len(self.values) - self.values.count(UNREACHABLE)
+
+
+def diameter(grid: WallGrid, start: int = 0) -> tuple[int, int, int]:
+    """Return the two cells furthest apart in the region of *start*.
+
+    Sweeps twice: from *start* to the farthest cell *a*, then from *a* to the
+    farthest cell *b*. On a perfect maze the path from *a* to *b* is the
+    longest one; with loops it is a lower bound.
+
+    Args:
+        grid (WallGrid): The maze walls.
+        start (int): Flat index of any cell in the region to measure.
+
+    Returns:
+        tuple[int, int, int]: Flat indices of *a* and *b* and the number of
+        steps between them.
+    """
+    field = DistanceField(grid, (start,))
+    a = field.values.index(max(field.values))
+    field = DistanceField(grid, (a,))
+    length = max(field.values)
+    return a, field.values.index(length), length
+
+
+def count_dead_ends(grid: WallGrid) -> int:
+    """Return the number of cells with exactly one open neighbour.
+
+    The entrance and exit openings on the border do not count as open.
+    Grids with a ``dead_ends`` batch query, such as
+    :class:`~maze_solver_with_python.core.numpy_grid.NumpyWallGrid`, use it.
+
+    Args:
+        grid (WallGrid): The maze walls.
+
+    Returns:
+        int: The number of dead ends.
+    """
+    batch = getattr(grid, "dead_ends", None)
+    if batch is not None:
+        return len(batch())
+    open_neighbors = grid.open_neighbors
+    return sum(len(open_neighbors(idx)) == 1 for idx in range(len(grid)))
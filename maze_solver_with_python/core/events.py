@@ -0,0 +1,140 @@
+"""Module defining the event stream emitted by maze generation and solving.
+
+An event is three integers ``(kind, a, b)`` passed positionally to every
+subscribed listener, so emitting one allocates nothing:
+
+================  ==================  =============================================
+Kind              ``a``               ``b``
+================  ==================  =============================================
+``WALL_REMOVED``  flat cell index     wall bit removed (the neighbour's opposite
+                                      wall is removed too when it exists)
+``WALL_ADDED``    flat cell index     wall bit added (likewise on both sides)
+``CELL_VISITED``  flat cell index     ``0``
+``MOVE``          flat index from     flat index to
+``BACKTRACK``     flat index from     flat index to (the move being undone)
+================  ==================  =============================================
+
+Flat indices are column-major, as in
+:class:`~maze_solver_with_python.core.grid.WallGrid`. Renderers, recorders
+and analysers subscribe with
+:meth:`Maze.subscribe <maze_solver_with_python.core.models.Maze.subscribe>`;
+when nothing is subscribed no event is produced at all.
+"""
+
+from array import array
+from collections.abc import Callable, Iterator
+from typing import Self
+
+WALL_REMOVED = 0
+CELL_VISITED = 1
+MOVE = 2
+BACKTRACK = 3
+WALL_ADDED = 4
+
+EVENT_NAMES = ("wall_removed", "cell_visited", "move", "backtrack", "wall_added")
+"""Name of each event kind, indexed by kind."""
+
+Listener = Callable[[int, int, int], object]
+"""A callable receiving ``(kind, a, b)`` for each event."""
+
+
+class EventLog:
+    """A listener that records events compactly, three integers per event.
+
+    Logs can be replayed by iterating over them, or written to a file with
+    :meth:`tobytes` and read back with :meth:`frombytes`.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self) -> None:
+        """Initialize an empty log."""
+        self._data = array("q")
+
+    def __call__(self, kind: int, a: int, b: int) -> None:
+        """Record one event.
+
+        Args:
+            kind (int): Event kind.
+            a (int): First payload value.
+            b (int): Second payload value.
+        """
+        self._data.extend((kind, a, b))
+
+    def __len__(self) -> int:
+        return len(self._data) // 3
+
+    def __iter__(self) -> Iterator[tuple[int, int, int]]:
+        data = self._data
+        for pos in range(0, len(data), 3):
+            yield data[pos], data[pos + 1], data[pos + 2]
+
+    def count(self, kind: int) -> int:
+        """Return how many events of *kind* were recorded.
+
+        Args:
+            kind (int): Event kind.
+
+        Returns:
+            int: Number of matching events.
+        """
+        return self._data[0::3].count(kind)
+
+    def tobytes(self) -> bytes:
+        """Return the log as native 64-bit integers.
+
+        Returns:
+            bytes: ``24`` bytes per event.
+        """
+        return self._data.tobytes()
+
+    @classmethod
+    def frombytes(cls, data: bytes) -> Self:
+        """Rebuild a log from :meth:`tobytes` output.
+
+        Args:
+            data (bytes): Serialised events.
+
+        Returns:
+            EventLog: The restored log.
+        """
+        log = cls()
+        log._data.frombytes(data)
+        return log
+
+
+class PathRecorder:
+    """A listener that follows a depth-first solve and keeps its current path.
+
+    Attributes:
+        path (list[int]): Flat indices from the start to the current cell;
+            once the solve succeeds, the path it found.
+        visited (int): Number of ``CELL_VISITED`` events seen.
+    """
+
+    __slots__ = ("path", "visited")
+
+    def __init__(self, start: int) -> None:
+        """Initialize a path holding only *start*.
+
+        Args:
+            start (int): Flat index the solve starts from.
+        """
+        self.path = [start]
+        self.visited = 0
+
+    def __call__(self, kind: int, a: int, b: int) -> None:
+        """Extend the path on ``MOVE`` and shorten it on ``BACKTRACK``.
+
+        Args:
+            kind (int): Event kind.
+            a (int): First payload value.
+            b (int): Second payload value.
+        """
+        del a
+        if kind == MOVE:
+            self.path.append(b)
+        elif kind == BACKTRACK:
+            self.path.pop()
+        elif kind == CELL_VISITED:
+            self.visited += 1
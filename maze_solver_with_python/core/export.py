@@ -0,0 +1,531 @@
+"""Module defining headless export of mazes to PNG, PPM and SVG images.
+
+:func:`rasterize` draws a grid straight into an 8-bit indexed pixel buffer,
+one scanline at a time, with no display and no imaging library. Every pixel
+row inside a row of cells is identical, so each distinct scanline is built
+once, from per-cell byte patterns looked up by wall mask, and repeated. A
+solution path is then merged into straight runs and painted as rectangles.
+
+Pixel geometry, for a *scale* of ``s`` pixels per cell and walls ``w`` pixels
+thick: grid line ``k`` starts at pixel ``margin + k * s``, so the image is
+``2 * margin + num_cols * s + w`` pixels wide (and likewise high). Every grid
+line intersection is drawn as a ``w`` × ``w`` post.
+
+:func:`write_svg` draws the same picture as vectors. Adjacent walls on one
+grid line are merged into a single run (:func:`wall_runs`), so a perfect
+maze needs about half as many segments as it has walls.
+
+:func:`rasterize_distances` draws the same walls over a heatmap, filling
+each cell with a colour for its distance in a
+:class:`~maze_solver_with_python.core.distance.DistanceField`.
+"""
+
+import os
+import re
+import struct
+import zlib
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from itertools import pairwise
+from operator import or_
+from pathlib import Path
+from typing import Optional, TextIO
+
+from maze_solver_with_python.core.grid import BOTTOM, LEFT, RIGHT, TOP, WallGrid
+
+Color = tuple[int, int, int]
+"""An ``(r, g, b)`` colour with 8-bit channels."""
+
+BACKGROUND = 0
+WALL = 1
+PATH = 2
+
+DEFAULT_PALETTE: tuple[Color, Color, Color] = (
+    (255, 255, 255),
+    (30, 30, 30),
+    (220, 50, 50),
+)
+"""Colours of :data:`BACKGROUND`, :data:`WALL` and :data:`PATH` pixels."""
+
+HEAT_LEVELS = 125
+"""Number of heatmap colours, palette indices ``3`` to ``3 + HEAT_LEVELS - 1``."""
+
+HEAT_NEAR: Color = (255, 236, 160)
+"""Heatmap colour of the cells nearest to a source."""
+
+HEAT_FAR: Color = (70, 20, 110)
+"""Heatmap colour of the cells farthest from every source."""
+
+FORMATS = ("png", "ppm", "svg")
+"""Image formats understood by :func:`export_image`."""
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_RUN = re.compile(b"\x01+")
+# _FLAGS[bit] maps a wall mask byte to 1 when *bit* is set, else 0.
+_FLAGS = {
+    bit: bytes(m >> (bit.bit_length() - 1) & 1 for m in range(256))
+    for bit in (TOP, BOTTOM, LEFT, RIGHT)
+}
+# _HIGH[bit] maps a wall mask byte to 128 when *bit* is set, else 0.
+_HIGH = {bit: bytes(128 * f for f in flags) for bit, flags in _FLAGS.items()}
+
+
+@dataclass(frozen=True)
+class Raster:
+    """An 8-bit indexed image.
+
+    Attributes:
+        width (int): Width in pixels.
+        height (int): Height in pixels.
+        pixels (bytearray): Row-major palette indices, ``width * height``
+            bytes.
+        palette (tuple[Color, ...]): Colour of each palette index.
+    """
+
+    width: int
+    height: int
+    pixels: bytearray
+    palette: tuple[Color, ...] = DEFAULT_PALETTE
+
+    def rgb(self) -> bytes:
+        """Expand the pixels to packed 24-bit RGB.
+
+        Returns:
+            bytes: ``3 * width * height`` bytes, row-major.
+        """
+        channels = [bytearray(256) for _ in range(3)]
+        for index, color in enumerate(self.palette):
+            for channel, value in zip(channels, color):
+                channel[index] = value
+        out = bytearray(3 * len(self.pixels))
+        for offset, table in enumerate(channels):
+            out[offset::3] = self.pixels.translate(table)
+        return bytes(out)
+
+
+def _check_geometry(scale: int, wall: int, margin: int) -> None:
+    """Raise ValueError unless walls are thinner than cells and margin >= 0."""
+    if wall < 1 or scale <= wall or margin < 0:
+        raise ValueError("Invalid image geometry.")
+
+
+def _scanline(patterns: Sequence[bytes], masks: bytes, last: bytes) -> bytes:
+    """Return one pixel row: a pattern per cell mask, then the closing post."""
+    return b"".join(map(patterns.__getitem__, masks)) + last
+
+
+def _scanlines(grid: WallGrid, scale: int, wall: int) -> Iterator[tuple[bytes, int]]:
+    """Yield each distinct pixel row of *grid*, margins excluded, with its count."""
+    walls = bytes(grid.walls)
+    rows = grid.num_rows
+    span = scale - wall
+    post = bytes((WALL,)) * wall
+    clear = bytes((BACKGROUND,)) * wall
+    gap = bytes((BACKGROUND,)) * span
+    solid = bytes((WALL,)) * span
+    # Patterns indexed by wall mask: a grid-line row crossing the top of a
+    # cell, and a row through its interior.
+    across = [post + (solid if m & TOP else gap) for m in range(16)]
+    inside = [(post if m & LEFT else clear) + gap for m in range(16)]
+    for j in range(rows):
+        masks = walls[j::rows]
+        yield _scanline(across, masks, post), wall
+        yield _scanline(inside, masks, post if masks[-1] & RIGHT else clear), span
+    bottom = [post + (solid if m & BOTTOM else gap) for m in range(16)]
+    yield _scanline(bottom, walls[rows - 1 :: rows], post), wall
+
+
+def rasterize(
+    grid: WallGrid,
+    path: Sequence[tuple[int, int]] = (),
+    scale: int = 4,
+    wall: int = 1,
+    margin: int = 0,
+) -> Raster:
+    """Draw *grid*, and optionally a path through it, into a :class:`Raster`.
+
+    Args:
+        grid (WallGrid): The maze to draw.
+        path (Sequence[tuple[int, int]]): ``(col, row)`` cells to join with
+            a line, as in :attr:`SolveResult.path
+            <maze_solver_with_python.core.solvers.SolveResult.path>`.
+        scale (int): Pixels per cell, walls included.
+        wall (int): Wall thickness in pixels.
+        margin (int): Blank border around the maze in pixels.
+
+    Returns:
+        Raster: The image, using :data:`DEFAULT_PALETTE`.
+
+    Raises:
+        ValueError: If *wall* is not positive, *scale* does not exceed it or
+            *margin* is negative.
+    """
+    _check_geometry(scale, wall, margin)
+    width = 2 * margin + grid.num_cols * scale + wall
+    height = 2 * margin + grid.num_rows * scale + wall
+    side = bytes((BACKGROUND,)) * margin
+    blank = bytes((BACKGROUND,)) * width
+    lines = [blank] * margin
+    for line, count in _scanlines(grid, scale, wall):
+        lines += [side + line + side] * count
+    lines += [blank] * margin
+    pixels = bytearray().join(lines)
+    if path:
+        _draw_path(pixels, width, path, scale, wall, margin)
+    return Raster(width, height, pixels)
+
+
+def heat_palette() -> tuple[Color, ...]:
+    """Return :data:`DEFAULT_PALETTE` followed by the heatmap gradient.
+
+    Returns:
+        tuple[Color, ...]: ``3 + HEAT_LEVELS`` colours.
+    """
+    steps = HEAT_LEVELS - 1
+    (r0, g0, b0), (r1, g1, b1) = HEAT_NEAR, HEAT_FAR
+    gradient: tuple[Color, ...] = tuple(
+        (
+            (r0 * (steps - k) + r1 * k) // steps,
+            (g0 * (steps - k) + g1 * k) // steps,
+            (b0 * (steps - k) + b1 * k) // steps,
+        )
+        for k in range(HEAT_LEVELS)
+    )
+    palette: tuple[Color, ...] = DEFAULT_PALETTE
+    return palette + gradient
+
+
+def _heat_indices(distances: Sequence[int]) -> bytes:
+    """Return a palette index per cell, :data:`BACKGROUND` where unreachable."""
+    top = max(max(distances, default=0), 1)
+    steps = HEAT_LEVELS - 1
+    return bytes(BACKGROUND if d < 0 else 3 + d * steps // top for d in distances)
+
+
+def _heat_scanlines(
+    grid: WallGrid, fills: bytes, scale: int, wall: int
+) -> Iterator[tuple[bytes, int]]:
+    """Yield each distinct heatmap pixel row, margins excluded, with its count.
+
+    Patterns are looked up by the cell's palette index, plus 128 when the
+    wall that matters for that row (top or left) is present.
+    """
+    walls = bytes(grid.walls)
+    rows = grid.num_rows
+    span = scale - wall
+    post = bytes((WALL,)) * wall
+    solid = bytes((WALL,)) * span
+    across = [post + bytes((c,)) * span for c in range(128)]
+    across += [post + solid] * 128
+    inside = [bytes((c,)) * scale for c in range(128)]
+    inside += [post + bytes((c,)) * span for c in range(128)]
+    for j in range(rows):
+        masks = walls[j::rows]
+        colors = fills[j::rows]
+        keys = bytes(map(or_, masks.translate(_HIGH[TOP]), colors))
+        yield _scanline(across, keys, post), wall
+        keys = bytes(map(or_, masks.translate(_HIGH[LEFT]), colors))
+        last = post if masks[-1] & RIGHT else bytes((colors[-1],)) * wall
+        yield _scanline(inside, keys, last), span
+    gap = bytes((BACKGROUND,)) * span
+    bottom = [post + (solid if m & BOTTOM else gap) for m in range(16)]
+    yield _scanline(bottom, walls[rows - 1 :: rows], post), wall
+
+
+def rasterize_distances(
+    grid: WallGrid,
+    distances: Sequence[int],
+    scale: int = 4,
+    wall: int = 1,
+    margin: int = 0,
+) -> Raster:
+    """Draw *grid* over a heatmap of per-cell *distances*.
+
+    Distances are spread linearly over :data:`HEAT_LEVELS` colours from
+    :data:`HEAT_NEAR` to :data:`HEAT_FAR`; negative values leave the cell
+    blank.
+
+    Args:
+        grid (WallGrid): The maze to draw.
+        distances (Sequence[int]): One value per cell in flat index order,
+            such as :attr:`DistanceField.values
+            <maze_solver_with_python.core.distance.DistanceField.values>`.
+        scale (int): Pixels per cell, walls included.
+        wall (int): Wall thickness in pixels.
+        margin (int): Blank border around the maze in pixels.
+
+    Returns:
+        Raster: The image, using :func:`heat_palette`.
+
+    Raises:
+        ValueError: If the geometry is invalid or *distances* does not have
+            one value per cell.
+    """
+    _check_geometry(scale, wall, margin)
+    if len(distances) != len(grid):
+        raise ValueError("Expected one distance per cell.")
+    width = 2 * margin + grid.num_cols * scale + wall
+    height = 2 * margin + grid.num_rows * scale + wall
+    side = bytes((BACKGROUND,)) * margin
+    blank = bytes((BACKGROUND,)) * width
+    lines = [blank] * margin
+    fills = _heat_indices(distances)
+    for line, count in _heat_scanlines(grid, fills, scale, wall):
+        lines += [side + line + side] * count
+    lines += [blank] * margin
+    return Raster(width, height, bytearray().join(lines), heat_palette())
+
+
+def _path_corners(path: Sequence[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Return the ends of *path* and every cell where it turns."""
+    corners = [path[0]]
+    start = prev = path[0]
+    for cell in path[1:]:
+        if cell[0] != start[0] and cell[1] != start[1]:
+            corners.append(prev)
+            start = prev
+        prev = cell
+    corners.append(prev)
+    return corners
+
+
+def _draw_path(
+    pixels: bytearray,
+    width: int,
+    path: Sequence[tuple[int, int]],
+    scale: int,
+    wall: int,
+    margin: int,
+) -> None:
+    """Paint *path* into *pixels*, one rectangle per straight run."""
+    span = scale - wall
+    thick = max(1, span // 3)
+    offset = margin + wall + (span - thick) // 2
+
+    def fill(a: tuple[int, int], b: tuple[int, int]) -> None:
+        x0 = offset + min(a[0], b[0]) * scale
+        x1 = offset + max(a[0], b[0]) * scale + thick
+        y0 = offset + min(a[1], b[1]) * scale
+        y1 = offset + max(a[1], b[1]) * scale + thick
+        run = bytes((PATH,)) * (x1 - x0)
+        for y in range(y0, y1):
+            start = y * width + x0
+            pixels[start : start + len(run)] = run
+
+    for a, b in pairwise(_path_corners(path)):
+        fill(a, b)
+
+
+def _png_chunk(kind: bytes, data: bytes) -> bytes:
+    """Return a PNG chunk: length, type, data and CRC."""
+    body = kind + data
+    return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+
+def encode_png(raster: Raster, level: int = 1) -> bytes:
+    """Encode *raster* as an 8-bit palette PNG.
+
+    Args:
+        raster (Raster): Image to encode.
+        level (int): ``zlib`` compression level, ``0``–``9``. The default
+            favours speed; maze images are mostly long runs, so ``9`` only
+            saves about 40%.
+
+    Returns:
+        bytes: The PNG file contents.
+    """
+    width = raster.width
+    pixels = raster.pixels
+    rows = bytearray((width + 1) * raster.height)
+    # Filter type 0 (none) byte at the start of each row, then the row.
+    for y in range(raster.height):
+        start = y * (width + 1)
+        rows[start + 1 : start + 1 + width] = pixels[y * width : (y + 1) * width]
+    header = struct.pack(">IIBBBBB", width, raster.height, 8, 3, 0, 0, 0)
+    palette = bytes(channel for color in raster.palette for channel in color)
+    return b"".join(
+        (
+            _PNG_SIGNATURE,
+            _png_chunk(b"IHDR", header),
+            _png_chunk(b"PLTE", palette),
+            _png_chunk(b"IDAT", zlib.compress(rows, level)),
+            _png_chunk(b"IEND", b""),
+        )
+    )
+
+
+def encode_ppm(raster: Raster) -> bytes:
+    """Encode *raster* as a binary (``P6``) PPM.
+
+    Args:
+        raster (Raster): Image to encode.
+
+    Returns:
+        bytes: The PPM file contents.
+    """
+    return b"P6\n%d %d\n255\n" % (raster.width, raster.height) + raster.rgb()
+
+
+def _line_runs(grid: WallGrid) -> Iterator[tuple[bool, int, list[tuple[int, int]]]]:
+    """Yield ``(vertical, k, spans)`` for each grid line holding a wall.
+
+    Line ``k`` is the ``k``-th horizontal (top to bottom) or vertical (left
+    to right) grid line, and *spans* are its merged ``[start, stop)`` wall
+    runs in cell units.
+    """
+    walls = bytes(grid.walls)
+    cols, rows = grid.num_cols, grid.num_rows
+    for k in range(rows + 1):
+        if k < rows:
+            flags = walls[k::rows].translate(_FLAGS[TOP])
+        else:
+            flags = walls[rows - 1 :: rows].translate(_FLAGS[BOTTOM])
+        spans = [m.span() for m in _RUN.finditer(flags)]
+        if spans:
+            yield False, k, spans
+    for k in range(cols + 1):
+        if k < cols:
+            flags = walls[k * rows : (k + 1) * rows].translate(_FLAGS[LEFT])
+        else:
+            flags = walls[(cols - 1) * rows :].translate(_FLAGS[RIGHT])
+        spans = [m.span() for m in _RUN.finditer(flags)]
+        if spans:
+            yield True, k, spans
+
+
+def wall_runs(grid: WallGrid) -> Iterator[tuple[int, int, int, int]]:
+    """Yield every wall of *grid* with collinear neighbours merged.
+
+    Each wall is reported once, even where two cells share it.
+
+    Args:
+        grid (WallGrid): The maze.
+
+    Yields:
+        tuple[int, int, int, int]: ``(x1, y1, x2, y2)`` end points in cell
+        units: horizontal runs first, top to bottom, then vertical runs.
+    """
+    for vertical, k, spans in _line_runs(grid):
+        for start, stop in spans:
+            yield (k, start, k, stop) if vertical else (start, k, stop, k)
+
+
+def _hex(color: Color) -> str:
+    """Return *color* as an SVG ``#rrggbb`` string."""
+    return "#" + bytes(color).hex()
+
+
+def _svg_header(grid: WallGrid, scale: int, wall: int, margin: int) -> str:
+    """Return the SVG opening tags, background and wall group."""
+    width = 2 * margin + grid.num_cols * scale + wall
+    height = 2 * margin + grid.num_rows * scale + wall
+    origin = -(margin + wall / 2) / scale
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" '
+        f'height="{height}" viewBox="{origin:g} {origin:g} {width / scale:g} '
+        f'{height / scale:g}">\n'
+        f'<rect x="{origin:g}" y="{origin:g}" width="100%" height="100%" '
+        f'fill="{_hex(DEFAULT_PALETTE[BACKGROUND])}"/>\n'
+        f'<g fill="none" stroke="{_hex(DEFAULT_PALETTE[WALL])}" '
+        f'stroke-width="{wall / scale:g}" stroke-linecap="square">\n'
+    )
+
+
+def write_svg(
+    grid: WallGrid,
+    file: TextIO,
+    path: Sequence[tuple[int, int]] = (),
+    scale: int = 10,
+    wall: int = 2,
+    margin: int = 0,
+) -> int:
+    """Stream *grid*, and optionally a path through it, to *file* as SVG.
+
+    Walls are drawn as :func:`wall_runs`, one ``<path>`` element per grid
+    line, written as soon as that line is built. Coordinates are in cell
+    units, so the drawing scales without loss; *scale*, *wall* and *margin*
+    match :func:`rasterize`, which this reproduces at that size.
+
+    Args:
+        grid (WallGrid): The maze to draw.
+        file (TextIO): Text stream to write to.
+        path (Sequence[tuple[int, int]]): ``(col, row)`` cells to join with
+            a line.
+        scale (int): Nominal pixels per cell, walls included.
+        wall (int): Wall thickness in nominal pixels.
+        margin (int): Blank border around the maze in nominal pixels.
+
+    Returns:
+        int: Number of characters written.
+
+    Raises:
+        ValueError: If the geometry is invalid.
+    """
+    _check_geometry(scale, wall, margin)
+    written = file.write(_svg_header(grid, scale, wall, margin))
+    for vertical, k, spans in _line_runs(grid):
+        if vertical:
+            d = "".join(f"M{k} {a}v{b - a}" for a, b in spans)
+        else:
+            d = "".join(f"M{a} {k}h{b - a}" for a, b in spans)
+        written += file.write(f'<path d="{d}"/>\n')
+    written += file.write("</g>\n")
+    if path:
+        thick = max(1, (scale - wall) // 3)
+        points = " ".join(f"{x + 0.5:g},{y + 0.5:g}" for x, y in _path_corners(path))
+        written += file.write(
+            f'<polyline fill="none" stroke="{_hex(DEFAULT_PALETTE[PATH])}" '
+            f'stroke-width="{thick / scale:g}" stroke-linecap="square" '
+            f'stroke-linejoin="miter" points="{points}"/>\n'
+        )
+    return written + file.write("</svg>\n")
+
+
+def export_image(
+    grid: WallGrid,
+    dest: str | os.PathLike[str],
+    path: Sequence[tuple[int, int]] = (),
+    fmt: str = "",
+    scale: int = 4,
+    wall: int = 1,
+    margin: int = 0,
+    distances: Optional[Sequence[int]] = None,
+) -> int:
+    """Draw *grid* and write it to *dest* as an image.
+
+    Args:
+        grid (WallGrid): The maze to draw.
+        dest (str | os.PathLike[str]): Destination file.
+        path (Sequence[tuple[int, int]]): Optional ``(col, row)`` path to
+            overlay.
+        fmt (str): One of :data:`FORMATS`; taken from the suffix of *dest*
+            when empty.
+        scale (int): Pixels per cell, walls included.
+        wall (int): Wall thickness in pixels.
+        margin (int): Blank border around the maze in pixels.
+        distances (Sequence[int] | None): Per-cell distances to draw as a
+            heatmap with :func:`rasterize_distances` instead of a path.
+            PNG and PPM only.
+
+    Returns:
+        int: Number of bytes written.
+
+    Raises:
+        ValueError: If the format is not recognised, the geometry is
+            invalid, or *distances* is given for SVG.
+    """
+    fmt = (fmt or Path(dest).suffix.lstrip(".")).lower()
+    if fmt not in FORMATS:
+        raise ValueError("Unknown image format.")
+    if fmt == "svg":
+        if distances is not None:
+            raise ValueError("Distance maps are raster only.")
+        with open(dest, "w", encoding="ascii") as text:
+            return write_svg(grid, text, path, scale, wall, margin)
+    if distances is None:
+        raster = rasterize(grid, path, scale, wall, margin)
+    else:
+        raster = rasterize_distances(grid, distances, scale, wall, margin)
+    data = encode_png(raster) if fmt == "png" else encode_ppm(raster)
+    with open(dest, "wb") as file:
+        return file.write(data)
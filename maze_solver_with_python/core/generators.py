@@ -0,0 +1,331 @@
+"""Module defining pluggable maze generation algorithms.
+
+Every generator takes a fully walled
+:class:`~maze_solver_with_python.core.grid.WallGrid` and carves it into a
+perfect maze (exactly one path between any two cells). Generators only ever
+remove walls, so openings made beforehand — such as the maze entrance and
+exit — are preserved. Randomness is drawn only from the
+:class:`random.Random` passed in, so a seeded instance makes the layout
+reproducible and generators running concurrently never share state.
+
+:func:`braid` post-processes a carved grid into an imperfect maze by opening
+extra walls at dead ends, which adds loops.
+"""
+
+import random
+from array import array
+from collections.abc import Callable, Iterator
+
+from maze_solver_with_python.core.grid import (
+    ALL_WALLS,
+    BOTTOM,
+    LEFT,
+    RIGHT,
+    TOP,
+    WallGrid,
+)
+
+
+def _find(parents: array, idx: int) -> int:
+    """Return the root of *idx* in a union-find forest, halving paths."""
+    while parents[idx] != idx:
+        parents[idx] = parents[parents[idx]]
+        idx = parents[idx]
+    return idx
+
+
+def _find_label(parents: dict[int, int], label: int) -> int:
+    """Return the representative of set *label* within one Eller row."""
+    while label in parents:
+        label = parents[label]
+    return label
+
+
+def _interior_walls(grid: WallGrid, idx: int) -> list[int]:
+    """Return the wall bits of cell *idx* that face another cell."""
+    i, j = divmod(idx, grid.num_rows)
+    bits = []
+    if j > 0:
+        bits.append(TOP)
+    if j < grid.num_rows - 1:
+        bits.append(BOTTOM)
+    if i > 0:
+        bits.append(LEFT)
+    if i < grid.num_cols - 1:
+        bits.append(RIGHT)
+    return bits
+
+
+def _eller_join(
+    row: bytearray, sets: array, join_all: bool, rng: random.Random
+) -> None:
+    """Randomly join horizontally adjacent cells of different sets.
+
+    Args:
+        row (bytearray): Wall masks of the current row, modified in place.
+        sets (array): Set label of each cell, relabelled after merging.
+        join_all (bool): Join every such pair (used on the last row so the
+            maze ends up connected).
+        rng (random.Random): Source of randomness.
+    """
+    parents: dict[int, int] = {}
+    for i in range(len(row) - 1):
+        a = _find_label(parents, sets[i])
+        b = _find_label(parents, sets[i + 1])
+        if a != b and (join_all or rng.random() < 0.5):
+            row[i] &= ~RIGHT
+            row[i + 1] &= ~LEFT
+            parents[b] = a
+    for i in range(len(row)):
+        sets[i] = _find_label(parents, sets[i])
+
+
+def _eller_extend(row: bytearray, sets: array, rng: random.Random) -> bytearray:
+    """Open bottom walls so every set continues into the next row.
+
+    Each set extends down at least once, so no region is sealed off. Cells
+    that do not extend lose their label and start a new set below.
+
+    Args:
+        row (bytearray): Wall masks of the current row, modified in place.
+        sets (array): Set label of each cell, cleared where not extended.
+        rng (random.Random): Source of randomness.
+
+    Returns:
+        bytearray: ``1`` for each column whose cell below has an open top.
+    """
+    members: dict[int, list[int]] = {}
+    for i, label in enumerate(sets):
+        members.setdefault(label, []).append(i)
+
+    open_top = bytearray(len(row))
+    for cells in members.values():
+        forced = rng.choice(cells)
+        for i in cells:
+            if i == forced or rng.random() < 0.5:
+                row[i] &= ~BOTTOM
+                open_top[i] = 1
+    for i in range(len(row)):
+        if not open_top[i]:
+            sets[i] = 0
+    return open_top
+
+
+def _eller_rows(
+    num_cols: int, num_rows: int, rng: random.Random
+) -> Iterator[bytearray]:
+    """Yield the wall masks of each row of an Eller's-algorithm maze.
+
+    Only the current row's set labels are kept, so memory is
+    ``O(num_cols)`` regardless of ``num_rows``.
+
+    Args:
+        num_cols (int): Number of columns.
+        num_rows (int): Number of rows.
+        rng (random.Random): Source of randomness.
+
+    Yields:
+        bytearray: ``num_cols`` wall masks for the next row, top to bottom.
+    """
+    sets = array("q", [0]) * num_cols  # 0 = not in a set yet
+    open_top = bytearray(num_cols)
+    next_set = 1
+
+    for j in range(num_rows):
+        last = j == num_rows - 1
+        row = bytearray([ALL_WALLS]) * num_cols
+        for i in range(num_cols):
+            if open_top[i]:
+                row[i] &= ~TOP
+            if not sets[i]:
+                sets[i] = next_set
+                next_set += 1
+
+        _eller_join(row, sets, last, rng)
+        if not last:
+            open_top = _eller_extend(row, sets, rng)
+        yield row
+
+
+def stream_eller(
+    num_cols: int, num_rows: int, rng: random.Random
+) -> Iterator[bytearray]:
+    """Stream a maze row by row with Eller's algorithm.
+
+    No grid is built: each row is yielded as soon as it is final and only
+    ``O(num_cols)`` state is kept, so mazes far larger than memory can be
+    piped straight to disk (see
+    :func:`~maze_solver_with_python.core.storage.write_rows`). The entrance
+    (top of the first cell) and exit (bottom of the last cell) are open.
+
+    Args:
+        num_cols (int): Number of columns.
+        num_rows (int): Number of rows.
+        rng (random.Random): Source of randomness.
+
+    Yields:
+        bytearray: ``num_cols`` wall masks per row, top row first.
+    """
+    for j, row in enumerate(_eller_rows(num_cols, num_rows, rng)):
+        if j == 0:
+            row[0] &= ~TOP
+        if j == num_rows - 1:
+            row[-1] &= ~BOTTOM
+        yield row
+
+
+def generate_eller(grid: WallGrid, rng: random.Random) -> None:
+    """Carve *grid* with Eller's algorithm, one row at a time.
+
+    Args:
+        grid (WallGrid): A fully walled grid, modified in place.
+        rng (random.Random): Source of randomness.
+    """
+    walls = grid.walls
+    num_rows = grid.num_rows
+    for j, row in enumerate(_eller_rows(grid.num_cols, num_rows, rng)):
+        for i, mask in enumerate(row):
+            walls[i * num_rows + j] &= mask
+
+
+def generate_kruskal(grid: WallGrid, rng: random.Random) -> None:
+    """Carve *grid* with randomised Kruskal's algorithm over a union-find.
+
+    Args:
+        grid (WallGrid): A fully walled grid, modified in place.
+        rng (random.Random): Source of randomness.
+    """
+    num_cols, num_rows = grid.num_cols, grid.num_rows
+    # Edge ``idx << 1`` is the right wall of idx, ``idx << 1 | 1`` its bottom.
+    edges = array("q")
+    for idx in range(len(grid)):
+        i, j = divmod(idx, num_rows)
+        if i < num_cols - 1:
+            edges.append(idx << 1)
+        if j < num_rows - 1:
+            edges.append(idx << 1 | 1)
+    rng.shuffle(edges)
+
+    parents = array("q", range(len(grid)))
+    for edge in edges:
+        idx, bit = edge >> 1, BOTTOM if edge & 1 else RIGHT
+        a = _find(parents, idx)
+        b = _find(parents, grid.neighbor(idx, bit))
+        if a != b:
+            parents[b] = a
+            grid.carve(idx, bit)
+
+
+def generate_wilson(grid: WallGrid, rng: random.Random) -> None:
+    """Carve *grid* with Wilson's algorithm (loop-erased random walks).
+
+    Produces a uniform spanning tree: every perfect maze on the grid is
+    equally likely.
+
+    Args:
+        grid (WallGrid): A fully walled grid, modified in place.
+        rng (random.Random): Source of randomness.
+    """
+    size = len(grid)
+    in_tree = bytearray(size)
+    exits = bytearray(size)  # last direction taken out of each cell
+    in_tree[rng.randrange(size)] = 1
+
+    for start in range(size):
+        # Walk until the tree is hit; overwriting exits erases any loops.
+        idx = start
+        while not in_tree[idx]:
+            bit = rng.choice(_interior_walls(grid, idx))
+            exits[idx] = bit
+            idx = grid.neighbor(idx, bit)
+
+        idx = start
+        while not in_tree[idx]:
+            in_tree[idx] = 1
+            idx = grid.carve(idx, exits[idx])
+
+
+def generate_binary_tree(grid: WallGrid, rng: random.Random) -> None:
+    """Carve *grid* by opening the top or left wall of every cell.
+
+    Args:
+        grid (WallGrid): A fully walled grid, modified in place.
+        rng (random.Random): Source of randomness.
+    """
+    num_rows = grid.num_rows
+    for idx in range(len(grid)):
+        i, j = divmod(idx, num_rows)
+        options = [bit for bit, ok in ((TOP, j > 0), (LEFT, i > 0)) if ok]
+        if options:
+            grid.carve(idx, rng.choice(options))
+
+
+def generate_sidewinder(grid: WallGrid, rng: random.Random) -> None:
+    """Carve *grid* with the sidewinder algorithm, one row at a time.
+
+    Args:
+        grid (WallGrid): A fully walled grid, modified in place.
+        rng (random.Random): Source of randomness.
+    """
+    num_cols, num_rows = grid.num_cols, grid.num_rows
+    for j in range(num_rows):
+        run: list[int] = []
+        for i in range(num_cols):
+            idx = i * num_rows + j
+            run.append(idx)
+            at_east = i == num_cols - 1
+            if at_east or (j > 0 and rng.random() < 0.5):
+                if j > 0:
+                    grid.carve(rng.choice(run), TOP)
+                run.clear()
+            else:
+                grid.carve(idx, RIGHT)
+
+
+def braid(grid: WallGrid, fraction: float, rng: random.Random) -> list[tuple[int, int]]:
+    """Open one more wall in a random *fraction* of the dead ends of *grid*.
+
+    Dead ends are visited in random order; each one still a dead end when
+    reached is braided with probability *fraction*, preferring a wall that
+    also clears a neighbouring dead end. Every wall opened joins two cells
+    that were already connected, so each adds exactly one loop.
+
+    Args:
+        grid (WallGrid): A carved grid, modified in place.
+        fraction (float): Share of dead ends to remove, from ``0`` to ``1``.
+        rng (random.Random): Source of randomness.
+
+    Returns:
+        list[tuple[int, int]]: ``(flat index, wall bit)`` of each opened wall.
+    """
+    dead_ends = [idx for idx in range(len(grid)) if len(grid.open_neighbors(idx)) == 1]
+    rng.shuffle(dead_ends)
+    opened = []
+    for idx in dead_ends:
+        if len(grid.open_neighbors(idx)) != 1 or rng.random() >= fraction:
+            continue
+        closed = [bit for bit in _interior_walls(grid, idx) if grid.walls[idx] & bit]
+        if not closed:
+            continue
+        best = [
+            bit
+            for bit in closed
+            if len(grid.open_neighbors(grid.neighbor(idx, bit))) == 1
+        ]
+        bit = rng.choice(best or closed)
+        grid.carve(idx, bit)
+        opened.append((idx, bit))
+    return opened
+
+
+GENERATORS: dict[str, Callable[[WallGrid, random.Random], None]] = {
+    "eller": generate_eller,
+    "kruskal": generate_kruskal,
+    "wilson": generate_wilson,
+    "binary_tree": generate_binary_tree,
+    "sidewinder": generate_sidewinder,
+}
+"""Registry of grid-level generators by name.
+
+``Maze`` also accepts ``"dfs"``, its own animated backtracker.
+"""
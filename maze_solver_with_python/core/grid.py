@@ -0,0 +1,309 @@
+"""Module defining compact, array-backed maze grid storage."""
+
+from collections.abc import Iterator, MutableMapping
+
+# Wall bits. Bit *n* matches the *n*-th direction in ``DIRECTIONS``.
+TOP = 1
+BOTTOM = 2
+LEFT = 4
+RIGHT = 8
+ALL_WALLS = TOP | BOTTOM | LEFT | RIGHT
+
+DIRECTIONS = ("top", "bottom", "left", "right")
+WALL_BITS = {"top": TOP, "bottom": BOTTOM, "left": LEFT, "right": RIGHT}
+OPPOSITE_BITS = {TOP: BOTTOM, BOTTOM: TOP, LEFT: RIGHT, RIGHT: LEFT}
+
+# Iteration order of ``Cell.configs``, kept from the original per-cell dict.
+_CONFIG_KEYS = ("left", "right", "top", "bottom")
+
+
+class WallGrid:
+    """Walls and visited flags for a rectangular grid of cells.
+
+    Cells are addressed by a flat column-major index ``i * num_rows + j``,
+    where *i* is the column and *j* the row, mirroring ``Maze._cells[i][j]``.
+    Each cell's walls are a 4-bit mask (see :data:`TOP`, :data:`BOTTOM`,
+    :data:`LEFT`, :data:`RIGHT`) held in one byte of :attr:`walls`; visited
+    flags are packed eight to a byte in :attr:`visited`.
+
+    Attributes:
+        num_cols (int): Number of columns (x-axis).
+        num_rows (int): Number of rows (y-axis).
+        walls (bytearray): One wall mask per cell (bit set = wall present).
+        visited (bytearray): Visited bitset, bit ``idx % 8`` of byte
+            ``idx // 8`` for cell ``idx``.
+    """
+
+    __slots__ = ("num_cols", "num_rows", "visited", "walls")
+
+    def __init__(self, num_cols: int, num_rows: int) -> None:
+        """Initialize a grid with every wall present and no cell visited.
+
+        Args:
+            num_cols (int): Number of columns.
+            num_rows (int): Number of rows.
+        """
+        self.num_cols = num_cols
+        self.num_rows = num_rows
+        size = num_cols * num_rows
+        self.walls = bytearray([ALL_WALLS]) * size
+        self.visited = bytearray((size + 7) >> 3)
+
+    def __len__(self) -> int:
+        return self.num_cols * self.num_rows
+
+    def index(self, i: int, j: int) -> int:
+        """Return the flat index of cell ``(i, j)``.
+
+        Args:
+            i (int): Column index.
+            j (int): Row index.
+
+        Returns:
+            int: The column-major index into :attr:`walls`.
+        """
+        return i * self.num_rows + j
+
+    def cell_index(self, i: int, j: int) -> int:
+        """Return the flat index of cell ``(i, j)`` after checking its bounds.
+
+        :meth:`index` does no checking, and an out-of-range row there aliases
+        a cell of the next column; use this for coordinates from callers.
+
+        Args:
+            i (int): Column index.
+            j (int): Row index.
+
+        Returns:
+            int: The column-major index into :attr:`walls`.
+
+        Raises:
+            IndexError: If the cell is outside the grid.
+        """
+        if not (0 <= i < self.num_cols and 0 <= j < self.num_rows):
+            raise IndexError(f"Cell {(i, j)} is outside the maze.")
+        return i * self.num_rows + j
+
+    def has_wall(self, idx: int, bit: int) -> bool:
+        """Return whether cell *idx* has the wall *bit*.
+
+        Args:
+            idx (int): Flat cell index.
+            bit (int): One of the wall bit constants.
+
+        Returns:
+            bool: ``True`` if the wall is present.
+        """
+        return bool(self.walls[idx] & bit)
+
+    def set_wall(self, idx: int, bit: int, present: bool) -> None:
+        """Add or remove the wall *bit* on cell *idx* only.
+
+        Args:
+            idx (int): Flat cell index.
+            bit (int): One of the wall bit constants.
+            present (bool): ``True`` to add the wall, ``False`` to remove it.
+        """
+        if present:
+            self.walls[idx] |= bit
+        else:
+            self.walls[idx] &= ~bit
+
+    def neighbor(self, idx: int, bit: int) -> int:
+        """Return the index of the cell across wall *bit* of cell *idx*.
+
+        No bounds check is made; callers must only ask for interior walls.
+
+        Args:
+            idx (int): Flat cell index.
+            bit (int): One of the wall bit constants.
+
+        Returns:
+            int: Flat index of the neighbouring cell.
+        """
+        if bit == TOP:
+            return idx - 1
+        if bit == BOTTOM:
+            return idx + 1
+        if bit == LEFT:
+            return idx - self.num_rows
+        return idx + self.num_rows
+
+    def carve(self, idx: int, bit: int) -> int:
+        """Remove the wall *bit* between cell *idx* and its neighbour.
+
+        Both sides of the wall are cleared so the two cells stay consistent.
+
+        Args:
+            idx (int): Flat cell index.
+            bit (int): One of the wall bit constants (must be interior).
+
+        Returns:
+            int: Flat index of the neighbouring cell.
+        """
+        n = self.neighbor(idx, bit)
+        self.walls[idx] &= ~bit
+        self.walls[n] &= ~OPPOSITE_BITS[bit]
+        return n
+
+    def set_shared_wall(self, idx: int, bit: int, present: bool) -> int:
+        """Add or remove the wall *bit* on both cell *idx* and its neighbour.
+
+        Args:
+            idx (int): Flat cell index.
+            bit (int): One of the wall bit constants (must be interior).
+            present (bool): ``True`` to add the wall, ``False`` to remove it.
+
+        Returns:
+            int: Flat index of the neighbouring cell.
+        """
+        n = self.neighbor(idx, bit)
+        self.set_wall(idx, bit, present)
+        self.set_wall(n, OPPOSITE_BITS[bit], present)
+        return n
+
+    def is_interior(self, idx: int, bit: int) -> bool:
+        """Return whether wall *bit* of cell *idx* separates two cells.
+
+        Args:
+            idx (int): Flat cell index.
+            bit (int): One of the wall bit constants.
+
+        Returns:
+            bool: ``False`` for walls on the outer border.
+        """
+        i, j = divmod(idx, self.num_rows)
+        if bit == TOP:
+            return j > 0
+        if bit == BOTTOM:
+            return j < self.num_rows - 1
+        if bit == LEFT:
+            return i > 0
+        return i < self.num_cols - 1
+
+    def is_visited(self, idx: int) -> bool:
+        """Return whether cell *idx* is flagged visited.
+
+        Args:
+            idx (int): Flat cell index.
+
+        Returns:
+            bool: ``True`` if the visited bit is set.
+        """
+        return bool(self.visited[idx >> 3] & (1 << (idx & 7)))
+
+    def set_visited(self, idx: int, value: bool = True) -> None:
+        """Set or clear the visited flag of cell *idx*.
+
+        Args:
+            idx (int): Flat cell index.
+            value (bool): New flag value. Defaults to ``True``.
+        """
+        if value:
+            self.visited[idx >> 3] |= 1 << (idx & 7)
+        else:
+            self.visited[idx >> 3] &= ~(1 << (idx & 7))
+
+    def open_unvisited(self, idx: int) -> int:
+        """Return the walls of cell *idx* that lead to unvisited neighbours.
+
+        A direction qualifies when its wall is absent, the neighbour behind
+        it is inside the grid, and that neighbour is not visited.
+
+        Args:
+            idx (int): Flat cell index.
+
+        Returns:
+            int: A mask of wall bits, one per qualifying direction.
+        """
+        num_rows = self.num_rows
+        i, j = divmod(idx, num_rows)
+        mask = self.walls[idx]
+        visited = self.visited
+        exits = 0
+        if j > 0 and not mask & TOP:
+            n = idx - 1
+            if not visited[n >> 3] & (1 << (n & 7)):
+                exits |= TOP
+        if j < num_rows - 1 and not mask & BOTTOM:
+            n = idx + 1
+            if not visited[n >> 3] & (1 << (n & 7)):
+                exits |= BOTTOM
+        if i > 0 and not mask & LEFT:
+            n = idx - num_rows
+            if not visited[n >> 3] & (1 << (n & 7)):
+                exits |= LEFT
+        if i < self.num_cols - 1 and not mask & RIGHT:
+            n = idx + num_rows
+            if not visited[n >> 3] & (1 << (n & 7)):
+                exits |= RIGHT
+        return exits
+
+    def open_neighbors(self, idx: int) -> list[int]:
+        """Return the in-bounds neighbours reachable from cell *idx*.
+
+        Neighbours are listed in ``DIRECTIONS`` order and only through absent
+        walls; the entrance and exit openings on the border are ignored.
+
+        Args:
+            idx (int): Flat cell index.
+
+        Returns:
+            list[int]: Flat indices of the reachable neighbours.
+        """
+        num_rows = self.num_rows
+        i, j = divmod(idx, num_rows)
+        mask = self.walls[idx]
+        neighbors = []
+        if j > 0 and not mask & TOP:
+            neighbors.append(idx - 1)
+        if j < num_rows - 1 and not mask & BOTTOM:
+            neighbors.append(idx + 1)
+        if i > 0 and not mask & LEFT:
+            neighbors.append(idx - num_rows)
+        if i < self.num_cols - 1 and not mask & RIGHT:
+            neighbors.append(idx + num_rows)
+        return neighbors
+
+    def reset_visited(self) -> None:
+        """Clear the visited flag of every cell."""
+        self.visited[:] = bytes(len(self.visited))
+
+
+class WallConfigs(MutableMapping[str, bool]):
+    """Dict-like view of one cell's walls inside a :class:`WallGrid`.
+
+    Reads and writes go straight to the grid, so ``configs["top"] = False``
+    updates the shared wall mask. Keys are ``"left"``, ``"right"``,
+    ``"top"`` and ``"bottom"``; walls cannot be added or deleted.
+    """
+
+    __slots__ = ("_grid", "_index")
+
+    def __init__(self, grid: WallGrid, index: int) -> None:
+        """Initialize the view.
+
+        Args:
+            grid (WallGrid): Grid holding the wall masks.
+            index (int): Flat index of the viewed cell.
+        """
+        self._grid = grid
+        self._index = index
+
+    def __getitem__(self, key: str) -> bool:
+        return bool(self._grid.walls[self._index] & WALL_BITS[key])
+
+    def __setitem__(self, key: str, value: bool) -> None:
+        self._grid.set_wall(self._index, WALL_BITS[key], value)
+
+    def __delitem__(self, key: str) -> None:
+        raise TypeError("Walls cannot be deleted.")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_CONFIG_KEYS)
+
+    def __len__(self) -> int:
+        return len(_CONFIG_KEYS)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
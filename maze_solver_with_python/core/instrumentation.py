@@ -0,0 +1,229 @@
+"""Module defining opt-in timing and counters for the phases of a maze.
+
+Pass an :class:`Instrumentation` to
+:class:`~maze_solver_with_python.core.models.Maze` and it records, for each
+phase the maze runs, how often it ran and for how long:
+
+==================  =========================================================
+Phase               What runs
+==================  =========================================================
+``create_cells``    Allocating the fully walled grid and drawing it
+``entrance_exit``   Opening the entrance and exit
+``generate``        Carving the passages, animation included
+``braid``           Opening dead ends into loops
+``reset_visited``   Clearing the visited flags
+``draw``            Drawing every cell of an adopted grid
+``solve``           :meth:`Maze.solve`, including its own flag reset
+``find_path``       :meth:`Maze.find_path`
+``render``          Playing an animation frame or flushing the canvas, when
+                    the :class:`Window` is given the same instrumentation
+==================  =========================================================
+
+The instrumentation is also an event listener, so it counts visited cells,
+removed and added walls, moves and backtracks from the event stream, and the
+maze adds every cell it draws. Subscribing it turns event emission on, which
+makes the hot loops slightly slower than in an uninstrumented maze; without
+one, each phase costs a single ``with`` on a shared no-op context.
+
+Each phase can additionally run under :mod:`cProfile`, :mod:`tracemalloc`,
+or both; each module is only imported once a phase asks for it.
+"""
+
+import io
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+from maze_solver_with_python.core.events import (
+    BACKTRACK,
+    CELL_VISITED,
+    EVENT_NAMES,
+    MOVE,
+    WALL_ADDED,
+    WALL_REMOVED,
+)
+
+if TYPE_CHECKING:
+    import cProfile
+    from types import ModuleType
+
+
+@dataclass
+class PhaseStats:
+    """Accumulated measurements of one phase.
+
+    Attributes:
+        calls (int): Number of times the phase ran.
+        seconds (float): Total wall time over all calls.
+        peak_kib (float): Largest peak of traced memory in one call, in KiB;
+            ``0`` unless memory tracing is on.
+        profile (cProfile.Profile | None): Profile accumulated over all
+            calls, when profiling is on.
+    """
+
+    calls: int = 0
+    seconds: float = 0.0
+    peak_kib: float = 0.0
+    profile: Optional["cProfile.Profile"] = None
+
+
+class Instrumentation:
+    """Per-phase wall time and event counters for one or more mazes.
+
+    Attributes:
+        phases (dict[str, PhaseStats]): Measurements by phase name, in the
+            order the phases first ran.
+        events (list[int]): Number of events seen, indexed by event kind.
+        draws (int): Number of cell and path segment draws sent to a window.
+        profile (bool): Whether phases run under :mod:`cProfile`.
+        trace_memory (bool): Whether phases run under :mod:`tracemalloc`.
+    """
+
+    __slots__ = ("_profiling", "draws", "events", "phases", "profile", "trace_memory")
+
+    def __init__(self, profile: bool = False, trace_memory: bool = False) -> None:
+        """Initialize empty counters.
+
+        Args:
+            profile (bool): Run every phase under :mod:`cProfile`.
+            trace_memory (bool): Record the peak traced memory of every phase.
+                Tracing slows allocation-heavy phases down considerably.
+        """
+        self.phases: dict[str, PhaseStats] = {}
+        self.events = [0] * len(EVENT_NAMES)
+        self.draws = 0
+        self.profile = profile
+        self.trace_memory = trace_memory
+        self._profiling = False
+
+    def __call__(self, kind: int, a: int, b: int) -> None:
+        """Count one event.
+
+        Args:
+            kind (int): Event kind.
+            a (int): First payload value.
+            b (int): Second payload value.
+        """
+        self.events[kind] += 1
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[PhaseStats]:
+        """Measure the enclosed block as one call of phase *name*.
+
+        Phases may nest; profiling is then only active in the outermost one,
+        as :mod:`cProfile` allows a single active profiler.
+
+        Args:
+            name (str): Phase name.
+
+        Yields:
+            PhaseStats: The phase's accumulated measurements.
+        """
+        stats = self.phases.get(name)
+        if stats is None:
+            stats = self.phases[name] = PhaseStats()
+        profiler = None
+        if self.profile and not self._profiling:
+            profiler = stats.profile
+            if profiler is None:
+                # pylint: disable-next=import-outside-toplevel
+                import cProfile
+
+                profiler = stats.profile = cProfile.Profile()
+        tracing = False
+        tracer: Optional["ModuleType"] = None
+        if self.trace_memory:
+            # pylint: disable-next=import-outside-toplevel
+            import tracemalloc
+
+            tracer = tracemalloc
+            tracing = not tracer.is_tracing()
+            if tracing:
+                tracer.start()
+            else:
+                tracer.reset_peak()
+        start = time.perf_counter()
+        try:
+            if profiler is not None:
+                self._profiling = True
+                profiler.enable()
+            yield stats
+        finally:
+            if profiler is not None:
+                profiler.disable()
+                self._profiling = False
+            stats.seconds += time.perf_counter() - start
+            stats.calls += 1
+            if tracer is not None:
+                _, peak = tracer.get_traced_memory()
+                stats.peak_kib = max(stats.peak_kib, peak / 1024)
+                if tracing:
+                    tracer.stop()
+
+    @property
+    def cells_visited(self) -> int:
+        """Number of ``CELL_VISITED`` events seen."""
+        return self.events[CELL_VISITED]
+
+    @property
+    def walls_removed(self) -> int:
+        """Number of ``WALL_REMOVED`` events seen, entrance and exit included."""
+        return self.events[WALL_REMOVED]
+
+    @property
+    def walls_added(self) -> int:
+        """Number of ``WALL_ADDED`` events seen."""
+        return self.events[WALL_ADDED]
+
+    @property
+    def moves(self) -> int:
+        """Number of ``MOVE`` events seen."""
+        return self.events[MOVE]
+
+    @property
+    def backtracks(self) -> int:
+        """Number of ``BACKTRACK`` events seen."""
+        return self.events[BACKTRACK]
+
+    def report(self, top: int = 10) -> str:
+        """Return the measurements as text.
+
+        Args:
+            top (int): Number of functions listed per profiled phase, sorted
+                by cumulative time.
+
+        Returns:
+            str: A phase table, the counters, then any profiles.
+        """
+        lines = [f"{'phase':<14} {'calls':>6}  {'total ms':>10}  {'peak KiB':>9}"]
+        for name, stats in self.phases.items():
+            lines.append(
+                f"{name:<14} {stats.calls:>6}  {stats.seconds * 1e3:>10.2f}"
+                f"  {stats.peak_kib:>9,.0f}"
+            )
+        lines.append("")
+        lines.extend(
+            f"{label:<14} {value:>6,}"
+            for label, value in (
+                ("cells visited", self.cells_visited),
+                ("walls removed", self.walls_removed),
+                ("walls added", self.walls_added),
+                ("moves", self.moves),
+                ("backtracks", self.backtracks),
+                ("draws", self.draws),
+            )
+        )
+        for name, stats in self.phases.items():
+            if stats.profile is None:
+                continue
+            # pylint: disable-next=import-outside-toplevel
+            import pstats
+
+            out = io.StringIO()
+            pstats.Stats(stats.profile, stream=out).sort_stats(
+                "cumulative"
+            ).print_stats(top)
+            lines.extend(("", f"── {name} ──", out.getvalue().strip()))
+        return "\n".join(lines)
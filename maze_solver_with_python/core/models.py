@@ -1,49 +1,94 @@
-"""Module defining maze models."""
-
-import random
-import time
-from tkinter import BOTH, Canvas, Tk
-from typing import Optional, Self
+# pylint: disable=too-many-lines
+"""Module defining maze models.
 
+:mod:`tkinter` is imported only when a :class:`Window` is created, so
+headless use works on interpreters built without Tk and starts faster.
+"""
 
+import os
+import random
+from collections.abc import Callable, Iterable, Sequence
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Optional, Self, overload
+
+from maze_solver_with_python.core.animation import AnimationScheduler
+from maze_solver_with_python.core.cache import SolveCache, fingerprint
+from maze_solver_with_python.core.distance import (
+    DistanceField,
+    count_dead_ends,
+    diameter,
+)
+from maze_solver_with_python.core.events import (
+    BACKTRACK,
+    CELL_VISITED,
+    MOVE,
+    WALL_ADDED,
+    WALL_REMOVED,
+    Listener,
+    PathRecorder,
+)
+from maze_solver_with_python.core.generators import GENERATORS, braid
+from maze_solver_with_python.core.grid import (
+    BOTTOM,
+    RIGHT,
+    TOP,
+    WALL_BITS,
+    WallConfigs,
+    WallGrid,
+)
+from maze_solver_with_python.core.instrumentation import Instrumentation, PhaseStats
+from maze_solver_with_python.core.planner import LPAStar
+from maze_solver_with_python.core.rendering import CanvasRenderer
+from maze_solver_with_python.core.solvers import SOLVERS, SolveResult
+from maze_solver_with_python.core.storage import dump_grid, open_grid
+from maze_solver_with_python.core.tree_index import TreeIndex
+
+if TYPE_CHECKING:
+    from tkinter import Canvas
+
+# (direction, column offset, row offset) in the order neighbours are explored.
+_NEIGHBOR_OFFSETS = (
+    ("top", 0, -1),
+    ("bottom", 0, 1),
+    ("left", -1, 0),
+    ("right", 1, 0),
+)
+
+# Pixel layout shared by the cells of one grid: (x, y) of the top-left corner
+# of cell 0, cell width and height, and the number of rows.
+_Geometry = tuple[int, int, int, int, int]
+
+# Entered by every phase of an uninstrumented maze; nullcontext is reusable.
+_NO_PHASE: AbstractContextManager[None] = nullcontext()
+
+
+@dataclass(frozen=True, slots=True)
 class Point:
-    """A 2D coordinate point.
+    """An immutable 2D coordinate point.
 
     Attributes:
         x (int): Horizontal position in pixels.
         y (int): Vertical position in pixels.
     """
 
-    def __init__(self, x: int, y: int) -> None:
-        """Initialize a Point.
-
-        Args:
-            x (int): Horizontal position in pixels.
-            y (int): Vertical position in pixels.
-        """
-        self.x = x
-        self.y = y
+    x: int
+    y: int
 
 
+@dataclass(frozen=True, slots=True)
 class Line:
-    """A line segment between two points.
+    """An immutable line segment between two points.
 
     Attributes:
         p1 (Point): Start point.
         p2 (Point): End point.
     """
 
-    def __init__(self, p1: Point, p2: Point) -> None:
-        """Initialize a Line.
-
-        Args:
-            p1 (Point): Start point.
-            p2 (Point): End point.
-        """
-        self.p1 = p1
-        self.p2 = p2
+    p1: Point
+    p2: Point
 
-    def draw(self, canvas: Canvas, fill_color: str = "black") -> None:
+    def draw(self, canvas: "Canvas", fill_color: str = "black") -> None:
         """Draw the line onto a tkinter canvas.
 
         Args:
@@ -60,24 +105,72 @@ class Window:
 
     Wraps a ``Tk`` root and a ``Canvas`` widget. Pass ``win=None`` to
     :class:`Maze` or :class:`Cell` to run headlessly (useful for tests).
+    Drawing goes through a
+    :class:`~maze_solver_with_python.core.rendering.CanvasRenderer`: updates
+    are queued and applied once per frame, reusing one canvas item per line
+    segment. Drawing calls are grouped into animation steps by :meth:`step`
+    and played back by an
+    :class:`~maze_solver_with_python.core.animation.AnimationScheduler`
+    driven by ``Tk.after``, so nothing blocks between frames.
     """
 
-    def __init__(self, width: int, height: int) -> None:
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        scheduler: Optional[AnimationScheduler] = None,
+        instrumentation: Optional[Instrumentation] = None,
+    ) -> None:
         """Initialize the Window.
 
         Args:
             width (int): Width of the canvas in pixels.
             height (int): Height of the canvas in pixels.
+            scheduler (AnimationScheduler | None): Playback settings.
+                Defaults to 60 frames per second, one step per frame and a
+                600-frame queue.
+            instrumentation (Instrumentation | None): Times every animation
+                frame and canvas flush as the ``render`` phase. Pass the same
+                instance to :class:`Maze` to see rendering next to the
+                construction phases.
+
+        Raises:
+            ImportError: If the interpreter has no :mod:`tkinter`.
         """
-        self.__root = Tk()
+        # pylint: disable-next=import-outside-toplevel
+        import tkinter
+
+        self.__root = tkinter.Tk()
         self.__root.title("The Maze Solver")
         self.__root.protocol("WM_DELETE_WINDOW", self.close)
-        self.__canvas = Canvas(self.__root, bg="white", width=width, height=height)
-        self.__canvas.pack(fill=BOTH, expand=1)
+        self.__canvas = tkinter.Canvas(
+            self.__root, bg="white", width=width, height=height
+        )
+        self.__canvas.pack(fill=tkinter.BOTH, expand=1)
+        self.__renderer = CanvasRenderer(self.__canvas)
+        self.__scheduler = AnimationScheduler() if scheduler is None else scheduler
+        self.__instrumentation = instrumentation
         self.__running = False
 
+    def __render_phase(self) -> AbstractContextManager[Optional[PhaseStats]]:
+        """Return the ``render`` phase, or a no-op one when not instrumented."""
+        if self.__instrumentation is None:
+            return _NO_PHASE
+        return self.__instrumentation.phase("render")
+
+    def __after(self, ms: int, func: Callable[..., object], *args: Any) -> str:
+        """Schedule *func* like ``Tk.after``, timed as the ``render`` phase."""
+        return self.__root.after(ms, self.__render, func, *args)
+
+    def __render(self, func: Callable[..., object], *args: Any) -> None:
+        """Call ``func(*args)`` as one call of the ``render`` phase."""
+        with self.__render_phase():
+            func(*args)
+
     def redraw(self) -> None:
-        """Process all pending tkinter events and redraw the window."""
+        """Flush queued drawing, process pending tkinter events and redraw."""
+        with self.__render_phase():
+            self.__renderer.flush()
         self.__root.update_idletasks()
         self.__root.update()
 
@@ -95,38 +188,69 @@ class Window:
     def draw_line(
         self, line: Line, fill_color: str = "black", visible: bool = True
     ) -> None:
-        """Draw a line on the canvas.
+        """Queue a line for the next frame.
+
+        A line with the same end points as one already on the canvas replaces
+        it rather than being drawn on top.
 
         Args:
             line (Line): The :class:`Line` to draw.
             fill_color (str): Color when the line is visible. Defaults to
                 ``"black"``.
-            visible (bool): When ``False`` the line is drawn white, effectively
-                erasing it.
+            visible (bool): When ``False`` the line is removed.
+        """
+        segment = (line.p1.x, line.p1.y, line.p2.x, line.p2.y)
+        color = fill_color if visible else None
+        self.__scheduler.push(self.__renderer.set_segment, segment, color)
+
+    def draw_cell(self, x1: int, y1: int, x2: int, y2: int, mask: int) -> None:
+        """Queue the walls of one cell for the next frame.
+
+        Args:
+            x1 (int): Left edge in pixels.
+            y1 (int): Top edge in pixels.
+            x2 (int): Right edge in pixels.
+            y2 (int): Bottom edge in pixels.
+            mask (int): Wall bits of the cell; set bits are drawn.
         """
-        if not visible:
-            fill_color = "white"
-        line.draw(self.__canvas, fill_color)
+        self.__scheduler.push(self.__renderer.set_walls, x1, y1, x2, y2, mask)
+
+    def step(self) -> None:
+        """End the current animation step and make sure playback is running."""
+        after = self.__root.after if self.__instrumentation is None else self.__after
+        self.__scheduler.end_step()
+        self.__scheduler.play(after, self.__renderer.flush)
 
 
 class Cell:
     """A single rectangular cell within the maze grid.
 
     Each cell tracks whether its four walls are present and whether it has
-    been visited by the generation or solving algorithm.
+    been visited by the generation or solving algorithm. The state itself
+    lives in a :class:`~maze_solver_with_python.core.grid.WallGrid`; a cell
+    is a lightweight view onto one slot of it. A standalone ``Cell`` owns a
+    private 1×1 grid.
+
+    Pixel coordinates are not stored per cell: they are derived on demand
+    from the cell's flat index and a layout tuple shared by the whole grid,
+    so creating a cell view allocates no geometry.
 
     Attributes:
-        configs (dict[str, bool]): Wall-presence flags keyed by ``"top"``,
-            ``"bottom"``, ``"left"``, and ``"right"`` (``True`` = wall
-            present).
+        configs (WallConfigs): Dict-like wall-presence flags keyed by
+            ``"top"``, ``"bottom"``, ``"left"``, and ``"right"`` (``True`` =
+            wall present).
         visited (bool): ``True`` once the cell has been visited by DFS.
     """
 
+    __slots__ = ("_geometry", "_grid", "_index", "_w")
+
     def __init__(
         self,
         top_left: Point,
         right_bottom: Point,
         win: Optional[Window] = None,
+        grid: Optional[WallGrid] = None,
+        index: int = 0,
         **kwargs: bool,
     ) -> None:
         """Initialize a Cell.
@@ -136,50 +260,111 @@ class Cell:
             right_bottom (Point): Bottom-right corner of the cell in pixels.
             win (Window | None): Window used for rendering. Pass ``None`` to
                 skip drawing.
+            grid (WallGrid | None): Grid holding this cell's state. Defaults
+                to a new 1×1 grid owned by the cell.
+            index (int): Flat index of the cell within *grid*.
             **kwargs (bool): Optional wall overrides — accepted keys:
                 ``left``, ``right``, ``top``, ``bottom`` (default ``True``).
         """
-        self.configs = {}
-        self.configs["left"] = kwargs.pop("left", True)
-        self.configs["right"] = kwargs.pop("right", True)
-        self.configs["top"] = kwargs.pop("top", True)
-        self.configs["bottom"] = kwargs.pop("bottom", True)
+        if grid is None:
+            grid = WallGrid(1, 1)
+            index = 0
+        self._grid = grid
+        self._index = index
+        for direction in WALL_BITS.keys() & kwargs.keys():
+            self.configs[direction] = kwargs.pop(direction)
+
+        width = right_bottom.x - top_left.x
+        height = right_bottom.y - top_left.y
+        i, j = divmod(index, grid.num_rows)
+        self._geometry = (
+            top_left.x - i * width,
+            top_left.y - j * height,
+            width,
+            height,
+            grid.num_rows,
+        )
+        self._w = win
 
-        self._x1 = top_left.x
-        self._y1 = top_left.y
-        self._x2 = right_bottom.x
-        self._y2 = right_bottom.y
+    @classmethod
+    def _view(
+        cls, grid: WallGrid, index: int, win: Optional[Window], geometry: _Geometry
+    ) -> Self:
+        """Return a view of cell *index* without computing any coordinates.
 
-        self._w = win
-        self.visited = False
+        Args:
+            grid (WallGrid): Grid holding the cell's state.
+            index (int): Flat index of the cell within *grid*.
+            win (Window | None): Window used for rendering.
+            geometry (_Geometry): Pixel layout shared by the grid's cells.
+
+        Returns:
+            Cell: The view.
+        """
+        cell = cls.__new__(cls)
+        cell._grid = grid
+        cell._index = index
+        cell._w = win
+        cell._geometry = geometry
+        return cell
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Cell):
+            return NotImplemented
+        return self._grid is other._grid and self._index == other._index
+
+    def __hash__(self) -> int:
+        return hash((id(self._grid), self._index))
+
+    @property
+    def configs(self) -> WallConfigs:
+        """Live view of the cell's wall flags.
+
+        Returns:
+            WallConfigs: A mutable mapping backed by the grid's wall mask.
+        """
+        return WallConfigs(self._grid, self._index)
+
+    @property
+    def visited(self) -> bool:
+        """Whether the cell has been visited.
+
+        Returns:
+            bool: The cell's bit in the grid's visited bitset.
+        """
+        return self._grid.is_visited(self._index)
+
+    @visited.setter
+    def visited(self, value: bool) -> None:
+        self._grid.set_visited(self._index, value)
 
     def __repr__(self) -> str:
-        return f"Cell [({self._x1}, {self._y1}), ({self._x2}, {self._y2})]"
+        x1, y1, x2, y2 = self.bounds
+        return f"Cell [({x1}, {y1}), ({x2}, {y2})]"
+
+    @property
+    def bounds(self) -> tuple[int, int, int, int]:
+        """The cell's pixel bounding box.
+
+        Returns:
+            tuple[int, int, int, int]: ``(x1, y1, x2, y2)``, the top-left and
+            bottom-right corners.
+        """
+        x, y, width, height, num_rows = self._geometry
+        i, j = divmod(self._index, num_rows)
+        x1, y1 = x + i * width, y + j * height
+        return x1, y1, x1 + width, y1 + height
 
     def draw(self) -> None:
         """Render the cell's walls onto the window canvas.
 
-        Walls flagged ``False`` in :attr:`configs` are drawn white (erasing
-        them visually). Does nothing when ``win`` is ``None``.
+        Walls flagged ``False`` in :attr:`configs` are removed from the
+        canvas. Does nothing when ``win`` is ``None``.
         """
         if self._w is None:
             return
-
-        # Left wall
-        left_wall = Line(Point(self._x1, self._y1), Point(self._x1, self._y2))
-        self._w.draw_line(left_wall, visible=self.configs["left"])
-
-        # Right wall
-        right_wall = Line(Point(self._x2, self._y1), Point(self._x2, self._y2))
-        self._w.draw_line(right_wall, visible=self.configs["right"])
-
-        # Top wall
-        top_wall = Line(Point(self._x1, self._y1), Point(self._x2, self._y1))
-        self._w.draw_line(top_wall, visible=self.configs["top"])
-
-        # Bottom wall
-        bottom_wall = Line(Point(self._x1, self._y2), Point(self._x2, self._y2))
-        self._w.draw_line(bottom_wall, visible=self.configs["bottom"])
+        mask = self._grid.walls[self._index]
+        self._w.draw_cell(*self.bounds, mask)
 
     @property
     def center(self) -> Point:
@@ -188,10 +373,8 @@ class Cell:
         Returns:
             Point: The midpoint between ``top_left`` and ``right_bottom``.
         """
-        return Point(
-            int((self._x2 + self._x1) / 2),
-            int((self._y2 + self._y1) / 2),
-        )
+        x1, y1, x2, y2 = self.bounds
+        return Point(int((x2 + x1) / 2), int((y2 + y1) / 2))
 
     def draw_move(self, to_cell: Self, undo: bool = False) -> None:
         """Draw a path segment from this cell's center to an adjacent cell's center.
@@ -212,15 +395,86 @@ class Cell:
         self._w.draw_line(Line(self.center, to_cell.center), fill_color)
 
 
-class Maze:
-    """A randomly generated, solvable rectangular maze.
+class _CellColumn(Sequence[Cell]):
+    """One column of :class:`Cell` views over a maze's :class:`WallGrid`."""
+
+    __slots__ = ("_i", "_maze")
+
+    def __init__(self, maze: "Maze", i: int) -> None:
+        self._maze = maze
+        self._i = i
+
+    def __len__(self) -> int:
+        return self._maze.num_rows
+
+    @overload
+    def __getitem__(self, j: int) -> Cell: ...
 
-    The maze is stored as a column-major 2-D list of :class:`Cell` objects:
-    ``_cells[col][row]``, where *col* indexes the x-axis and *row* the y-axis.
+    @overload
+    def __getitem__(self, j: slice) -> list[Cell]: ...
 
-    Generation uses randomised recursive backtracking (DFS). Solving uses a
-    depth-first search from the top-left entrance ``(0, 0)`` to the
-    bottom-right exit ``(num_cols-1, num_rows-1)``.
+    def __getitem__(self, j: int | slice) -> Cell | list[Cell]:
+        num_rows = self._maze.num_rows
+        if isinstance(j, slice):
+            return [self[k] for k in range(*j.indices(num_rows))]
+        if j < 0:
+            j += num_rows
+        if not 0 <= j < num_rows:
+            raise IndexError("Row index out of range.")
+
+        maze = self._maze
+        return Cell._view(maze._grid, self._i * num_rows + j, maze.win, maze._geometry)
+
+
+class _CellGrid(Sequence[_CellColumn]):
+    """Column-major ``_cells[col][row]`` facade over a maze's :class:`WallGrid`.
+
+    Cells are materialised on access, so the maze holds no per-cell objects,
+    and they share the maze's pixel layout instead of carrying coordinates.
+    """
+
+    __slots__ = ("_maze",)
+
+    def __init__(self, maze: "Maze") -> None:
+        self._maze = maze
+
+    def __len__(self) -> int:
+        return self._maze.num_cols
+
+    @overload
+    def __getitem__(self, i: int) -> _CellColumn: ...
+
+    @overload
+    def __getitem__(self, i: slice) -> list[_CellColumn]: ...
+
+    def __getitem__(self, i: int | slice) -> _CellColumn | list[_CellColumn]:
+        num_cols = self._maze.num_cols
+        if isinstance(i, slice):
+            return [self[k] for k in range(*i.indices(num_cols))]
+        if i < 0:
+            i += num_cols
+        if not 0 <= i < num_cols:
+            raise IndexError("Column index out of range.")
+        return _CellColumn(self._maze, i)
+
+
+class Maze:  # pylint: disable=too-many-instance-attributes
+    """A randomly generated, solvable rectangular maze.
+
+    Walls and visited flags are stored compactly in a
+    :class:`~maze_solver_with_python.core.grid.WallGrid` (one byte of wall
+    mask per cell plus a visited bitset). ``_cells[col][row]`` exposes it as
+    a column-major grid of :class:`Cell` views, where *col* indexes the
+    x-axis and *row* the y-axis.
+
+    Generation defaults to randomised backtracking (DFS) driven by an
+    explicit stack, so grid size is not bounded by the interpreter recursion
+    limit; other algorithms can be picked by name.
+    Solving uses a depth-first search from the top-left entrance ``(0, 0)``
+    to the bottom-right exit ``(num_cols-1, num_rows-1)``. A *braid* turns
+    the perfect maze into one with loops; :meth:`find_path` then still
+    returns shortest paths with ``"bfs"``, ``"astar"``, ``"bidirectional"``
+    or ``"dead_end"``.
 
     Attributes:
         top_left (Point): Pixel offset of the maze's top-left corner.
@@ -229,6 +483,12 @@ class Maze:
         cell_size_x (int): Width of each cell in pixels.
         cell_size_y (int): Height of each cell in pixels.
         win (Window | None): Rendering window (``None`` for headless mode).
+        backend (str): Grid storage backend, ``"python"`` or ``"numpy"``.
+        seed (int | None): Seed the layout was generated from, if known.
+        generator (str): Name of the algorithm that carved the layout.
+        braid (float): Share of dead ends opened into loops after carving.
+        instrumentation (Instrumentation | None): Phase timings and counters,
+            if the maze is instrumented.
     """
 
     def __init__(
@@ -240,11 +500,19 @@ class Maze:
         cell_size_y: int,
         win: Optional[Window] = None,
         seed: Optional[int] = None,
+        generator: str = "dfs",
+        backend: str = "python",
+        rng: Optional[random.Random] = None,
+        grid: Optional[WallGrid] = None,
+        listeners: Iterable[Listener] = (),
+        braid: float = 0.0,
+        instrumentation: Optional[Instrumentation] = None,
     ) -> None:
         """Initialize and fully generate the maze.
 
         Runs the complete generation pipeline: create cells, open the
-        entrance and exit, carve passages, reset visited flags.
+        entrance and exit, carve passages, reset visited flags. When *grid*
+        is given the pipeline is skipped and the maze adopts it as-is.
 
         Args:
             top_left (Point): Pixel coordinate of the top-left corner of the
@@ -257,65 +525,241 @@ class Maze:
                 headlessly.
             seed (int | None): Optional RNG seed for reproducible maze
                 layouts.
+            generator (str): ``"dfs"`` (default) for the animated
+                backtracker, or the name of a generator in
+                :data:`~maze_solver_with_python.core.generators.GENERATORS`.
+            backend (str): Grid storage. ``"python"`` (default) uses a plain
+                :class:`WallGrid`; ``"numpy"`` uses
+                :class:`~maze_solver_with_python.core.numpy_grid.NumpyWallGrid`,
+                which adds vectorised batch queries and requires NumPy.
+            rng (random.Random | None): Random source used for generation.
+                Defaults to a new ``random.Random(seed)`` owned by this maze,
+                so mazes never share the global :mod:`random` state. When both
+                are given, *rng* is re-seeded with *seed*.
+            grid (WallGrid | None): An already carved ``num_cols`` ×
+                ``num_rows`` grid to wrap instead of generating one; *seed*
+                and *generator* are then only recorded.
+            listeners (Iterable[Listener]): Event listeners to subscribe
+                before generation starts; see :meth:`subscribe`.
+            braid (float): Share of dead ends, from ``0`` (a perfect maze,
+                the default) to ``1``, to open into loops after carving; see
+                :func:`~maze_solver_with_python.core.generators.braid`.
+                Ignored when *grid* is given.
+            instrumentation (Instrumentation | None): Records the time of
+                every construction phase and later solve, and counts events
+                and draws; see
+                :mod:`~maze_solver_with_python.core.instrumentation`.
+
+        Raises:
+            ValueError: If *generator* or *backend* is not a recognised name,
+                *braid* is outside ``[0, 1]``, or *grid* does not match the
+                maze size.
         """
+        if grid is not None and (grid.num_cols, grid.num_rows) != (
+            num_cols,
+            num_rows,
+        ):
+            raise ValueError("Grid size does not match the maze.")
+        if grid is None and generator != "dfs" and generator not in GENERATORS:
+            raise ValueError("Unknown generator.")
+        if backend not in ("python", "numpy"):
+            raise ValueError("Unknown backend.")
+        if not 0.0 <= braid <= 1.0:
+            raise ValueError("braid must be between 0 and 1.")
+
         self.top_left = top_left
         self.num_rows = num_rows
         self.num_cols = num_cols
         self.cell_size_x = cell_size_x
         self.cell_size_y = cell_size_y
         self.win = win
-        self._cells: list[list[Cell]] = []
-        self._create_cells()
-        self._break_entrance_and_exit()
-        if seed is not None:
-            random.seed(seed)
-        self._break_walls_r(0, 0)
-        self._reset_cells_visited()
+        self.backend = backend
+        self.seed = seed
+        self.generator = generator
+        self.braid = braid
+        self._rng = random.Random(seed) if rng is None else rng  # nosec
+        if rng is not None and seed is not None:
+            rng.seed(seed)
+        self.instrumentation = instrumentation
+        self._listeners: list[Listener] = list(listeners)
+        if instrumentation is not None:
+            self._listeners.append(instrumentation)
+        if win is not None:
+            self._listeners.append(self._render_event)
+        self._grid = self._new_grid() if grid is None else grid
+        self._geometry: _Geometry = (
+            top_left.x,
+            top_left.y,
+            cell_size_x,
+            cell_size_y,
+            num_rows,
+        )
+        self._cells = _CellGrid(self)
+        if grid is not None:
+            with self._phase("draw"):
+                self._draw_all_cells()
+            return
+        with self._phase("create_cells"):
+            self._create_cells()
+        with self._phase("entrance_exit"):
+            self._break_entrance_and_exit()
+        with self._phase("generate"):
+            self._generate(generator)
+        if braid:
+            with self._phase("braid"):
+                self._braid(braid)
+        with self._phase("reset_visited"):
+            self._reset_cells_visited()
+
+    def _phase(self, name: str) -> AbstractContextManager[Optional[PhaseStats]]:
+        """Return a context measuring phase *name*, or a no-op one.
+
+        Args:
+            name (str): Phase name.
+
+        Returns:
+            AbstractContextManager[PhaseStats | None]: The instrumentation's
+            phase, or a shared null context when the maze is not instrumented.
+        """
+        if self.instrumentation is None:
+            return _NO_PHASE
+        return self.instrumentation.phase(name)
+
+    def _generate(self, generator: str) -> None:
+        """Carve the passages with the named generation algorithm.
+
+        ``"dfs"`` emits events as it carves. Registry generators work on the
+        grid directly, so when anyone is listening their removed walls are
+        reported afterwards, in flat index order.
+
+        Args:
+            generator (str): ``"dfs"`` or a key of ``GENERATORS``.
+        """
+        if generator == "dfs":
+            self._break_walls_i(0, 0)
+            return
+
+        GENERATORS[generator](self._grid, self._rng)
+        if not self._listeners:
+            return
+        grid = self._grid
+        for idx in range(len(grid)):
+            i, j = divmod(idx, self.num_rows)
+            if i < self.num_cols - 1 and not grid.has_wall(idx, RIGHT):
+                self._emit(WALL_REMOVED, idx, RIGHT)
+            if j < self.num_rows - 1 and not grid.has_wall(idx, BOTTOM):
+                self._emit(WALL_REMOVED, idx, BOTTOM)
+
+    def _braid(self, fraction: float) -> None:
+        """Open a *fraction* of the dead ends into loops, reporting each wall.
+
+        Args:
+            fraction (float): Share of dead ends to remove.
+        """
+        for idx, bit in braid(self._grid, fraction, self._rng):
+            if self._listeners:
+                self._emit(WALL_REMOVED, idx, bit)
 
     def _create_cells(self) -> None:
-        """Populate ``_cells`` with a grid of :class:`Cell` objects and draw them.
+        """Reset ``_grid`` to a fully walled grid and draw every cell.
 
-        ``_cells`` is column-major: ``_cells[i]`` is the list of cells in
-        column *i*, ordered top to bottom.
+        ``_cells`` is column-major: ``_cells[i]`` is the column of cells
+        *i*, ordered top to bottom.
         """
-        for i in range(self.num_cols):  # x-axis
-            col_cells = []
-            for j in range(self.num_rows):  # y-axis
-                top_left_of_cell = Point(
-                    self.top_left.x + i * self.cell_size_x,
-                    self.top_left.y + j * self.cell_size_y,
-                )
-                right_bottom_of_cell = Point(
-                    self.top_left.x + (i + 1) * self.cell_size_x,
-                    self.top_left.y + (j + 1) * self.cell_size_y,
-                )
-                cell = Cell(top_left_of_cell, right_bottom_of_cell, win=self.win)
-                col_cells.append(cell)
-            self._cells.append(col_cells)
+        self._grid = self._new_grid()
+        self._draw_all_cells()
 
+    def _draw_all_cells(self) -> None:
+        """Draw every cell as a single animation step."""
+        if self.win is None:
+            return
         for i in range(self.num_cols):  # x-axis
             for j in range(self.num_rows):  # y-axis
-                self._draw_cell(i, j)
+                self._cells[i][j].draw()
+        self.win.step()
+        if self.instrumentation is not None:
+            self.instrumentation.draws += len(self._grid)
+
+    def _new_grid(self) -> WallGrid:
+        """Return a fully walled grid for the configured backend.
+
+        NumPy is imported here, only when the ``"numpy"`` backend is used.
+
+        Returns:
+            WallGrid: A ``num_cols`` × ``num_rows`` grid.
+        """
+        if self.backend == "numpy":
+            # pylint: disable-next=import-outside-toplevel
+            from maze_solver_with_python.core.numpy_grid import NumpyWallGrid
+
+            return NumpyWallGrid(self.num_cols, self.num_rows)
+        return WallGrid(self.num_cols, self.num_rows)
 
-    def _draw_cell(self, i: int, j: int) -> None:
-        """Draw cell ``(i, j)`` and trigger an animation frame.
+    def subscribe(self, listener: Listener) -> None:
+        """Receive the events of every later generation or solving step.
+
+        Listeners are called as ``listener(kind, a, b)``; see
+        :mod:`~maze_solver_with_python.core.events` for the event kinds. To
+        also see generation, pass ``listeners=`` to the constructor instead.
 
         Args:
-            i (int): Column index.
-            j (int): Row index.
+            listener (Listener): Callable to add.
         """
-        self._cells[i][j].draw()
-        self._animate()
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Listener) -> None:
+        """Stop sending events to *listener*.
 
-    def _animate(self) -> None:
-        """Redraw the window and pause briefly to visualise progress.
+        Args:
+            listener (Listener): A previously subscribed callable.
 
-        Does nothing when ``win`` is ``None`` (headless mode).
+        Raises:
+            ValueError: If *listener* is not subscribed.
+        """
+        self._listeners.remove(listener)
+
+    def _emit(self, kind: int, a: int, b: int) -> None:
+        """Send one event to every listener."""
+        for listener in self._listeners:
+            listener(kind, a, b)
+
+    def _cell_at(self, idx: int) -> Cell:
+        """Return the cell view at flat index *idx*."""
+        i, j = divmod(idx, self.num_rows)
+        return self._cells[i][j]
+
+    def _render_event(self, kind: int, a: int, b: int) -> None:
+        """Draw one event on the window.
+
+        Subscribed automatically when the maze has a window. Moves are drawn
+        in red and backtracks in grey; removed or added walls redraw both
+        cells they separate. Each wall change and visited cell ends an
+        animation step.
+
+        Args:
+            kind (int): Event kind.
+            a (int): First payload value.
+            b (int): Second payload value.
         """
         if self.win is None:
             return
-        self.win.redraw()
-        time.sleep(0.05)
+        instrumentation = self.instrumentation
+        if kind in (WALL_REMOVED, WALL_ADDED):
+            self._cell_at(a).draw()
+            i, j = divmod(a, self.num_rows)
+            _, di, dj = _NEIGHBOR_OFFSETS[b.bit_length() - 1]
+            if 0 <= i + di < self.num_cols and 0 <= j + dj < self.num_rows:
+                self._cells[i + di][j + dj].draw()
+                if instrumentation is not None:
+                    instrumentation.draws += 1
+            if instrumentation is not None:
+                instrumentation.draws += 1
+        elif kind in (MOVE, BACKTRACK):
+            self._cell_at(a).draw_move(self._cell_at(b), undo=kind == BACKTRACK)
+            if instrumentation is not None:
+                instrumentation.draws += 1
+            return
+        self.win.step()
 
     def _break_entrance_and_exit(self) -> None:
         """Open the maze entrance and exit.
@@ -329,8 +773,9 @@ class Maze:
         top_left_cell.configs["top"] = False
         right_bottom_cell.configs["bottom"] = False
 
-        self._draw_cell(0, 0)
-        self._draw_cell(self.num_cols - 1, self.num_rows - 1)
+        if self._listeners:
+            self._emit(WALL_REMOVED, 0, TOP)
+            self._emit(WALL_REMOVED, len(self._grid) - 1, BOTTOM)
 
     def get_neighbors_coords(self, i: int, j: int) -> dict[str, tuple[int, int]]:
         """Return in-bounds neighbours of cell ``(i, j)``.
@@ -395,6 +840,8 @@ class Maze:
         """
         current_cell = self._cells[i][j]
         current_cell.visited = True
+        if self._listeners:
+            self._emit(CELL_VISITED, self._grid.index(i, j), 0)
 
         while True:
             neighbors_coords = self.get_neighbors_coords(i, j)
@@ -402,31 +849,78 @@ class Maze:
             unvisited = [k for k, v in list(neighbors.items()) if not v.visited]
 
             if not unvisited:
-                self._draw_cell(i, j)
                 return
 
-            direction = random.choice(unvisited)  # nosec
+            direction = self._rng.choice(unvisited)
 
             current_cell.configs[direction] = False
-            self._draw_cell(i, j)
 
             x, y = neighbors_coords[direction]
             next_cell = self._cells[x][y]
             next_cell.configs[self.get_opposite_direction(direction)] = False
+            if self._listeners:
+                self._emit(WALL_REMOVED, self._grid.index(i, j), WALL_BITS[direction])
 
             self._break_walls_r(x, y)
 
+    def _break_walls_i(self, i: int, j: int) -> None:
+        """Carve passages using randomised backtracking with an explicit stack.
+
+        Produces exactly the same layout as :meth:`_break_walls_r` for a given
+        RNG state — the same neighbours are offered to ``self._rng.choice`` in the
+        same order — but keeps the DFS spine on a heap-allocated stack instead
+        of the call stack, so it never raises ``RecursionError``.
+
+        Args:
+            i (int): Column index of the starting cell.
+            j (int): Row index of the starting cell.
+        """
+        grid = self._grid
+        num_rows = self.num_rows
+        num_cols = self.num_cols
+        emit = self._emit if self._listeners else None
+
+        grid.set_visited(grid.index(i, j))
+        if emit:
+            emit(CELL_VISITED, grid.index(i, j), 0)
+        stack = [(i, j)]
+
+        while stack:
+            i, j = stack[-1]
+            idx = i * num_rows + j
+
+            unvisited = [
+                direction
+                for direction, di, dj in _NEIGHBOR_OFFSETS
+                if 0 <= i + di < num_cols
+                and 0 <= j + dj < num_rows
+                and not grid.is_visited(idx + di * num_rows + dj)
+            ]
+
+            if not unvisited:
+                stack.pop()
+                continue
+
+            direction = self._rng.choice(unvisited)
+            bit = WALL_BITS[direction]
+
+            next_idx = grid.carve(idx, bit)
+            grid.set_visited(next_idx)
+            if emit:
+                emit(WALL_REMOVED, idx, bit)
+                emit(CELL_VISITED, next_idx, 0)
+            stack.append(divmod(next_idx, num_rows))
+
     def _reset_cells_visited(self) -> None:
         """Clear the ``visited`` flag on every cell in the grid."""
-        for i in range(self.num_cols):  # x-axis
-            for j in range(self.num_rows):  # y-axis
-                self._cells[i][j].visited = False
+        self._grid.reset_visited()
 
     def _solve_r(self, i: int, j: int) -> bool:
         """Depth-first search from cell ``(i, j)`` toward the exit.
 
-        Moves only through broken walls and unvisited cells. Draws the active
-        path in red and backtracks in grey on dead ends.
+        Moves only through broken walls and unvisited cells, emitting a
+        ``MOVE`` event for each step forward and a ``BACKTRACK`` event for
+        each step back out of a dead end.
 
         Args:
             i (int): Column index of the current cell.
@@ -436,10 +930,10 @@ class Maze:
             bool: ``True`` if a path to the exit was found, ``False``
             otherwise.
         """
-        self._animate()
-
         current_cell = self._cells[i][j]
         current_cell.visited = True
+        if self._listeners:
+            self._emit(CELL_VISITED, self._grid.index(i, j), 0)
 
         broken_walls = [k for k, v in current_cell.configs.items() if not v]
 
@@ -454,19 +948,448 @@ class Maze:
 
         for direction in eligible_directions:
             x, y = neighbors_coords[direction]
-            next_cell = self._cells[x][y]
-            current_cell.draw_move(next_cell)
+            if self._listeners:
+                self._emit(MOVE, self._grid.index(i, j), self._grid.index(x, y))
             if self._solve_r(x, y):
                 return True
-            current_cell.draw_move(next_cell, undo=True)
+            if self._listeners:
+                self._emit(BACKTRACK, self._grid.index(i, j), self._grid.index(x, y))
 
         return False
 
-    def solve(self) -> bool:
+    def _solve_i(self, i: int, j: int) -> bool:
+        """Depth-first search from cell ``(i, j)`` using an explicit stack.
+
+        Visits cells and emits events in exactly the same order as
+        :meth:`_solve_r`, but without recursion. It reads wall masks and
+        visited bits straight from ``_grid``, and the directions still to try
+        from each cell are kept as a 4-bit mask, so no per-step lists, dicts
+        or :class:`Cell` views are built.
+
+        Args:
+            i (int): Column index of the starting cell.
+            j (int): Row index of the starting cell.
+
+        Returns:
+            bool: ``True`` if a path to the exit was found, ``False``
+            otherwise.
+        """
+        grid = self._grid
+        num_rows = self.num_rows
+        exit_idx = len(grid) - 1
+        emit = self._emit if self._listeners else None
+
+        # Frames are (col, row, pending direction mask, child col, child row).
+        stack: list[tuple[int, int, int, int, int]] = []
+        pending = 0
+        entering = True
+
+        while True:
+            if entering:
+                idx = i * num_rows + j
+                grid.set_visited(idx)
+                if emit:
+                    emit(CELL_VISITED, idx, 0)
+                if idx == exit_idx:
+                    return True
+
+                pending = grid.open_unvisited(idx)
+            else:
+                i, j, pending, x, y = stack.pop()
+                if emit:
+                    emit(BACKTRACK, i * num_rows + j, x * num_rows + y)
+
+            if pending:
+                _, dx, dy = _NEIGHBOR_OFFSETS[(pending & -pending).bit_length() - 1]
+                pending &= pending - 1  # drop the lowest direction bit
+                x, y = i + dx, j + dy
+                if emit:
+                    emit(MOVE, i * num_rows + j, x * num_rows + y)
+                stack.append((i, j, pending, x, y))
+                i, j = x, y
+                entering = True
+            elif stack:
+                entering = False
+            else:
+                return False
+
+    def solve(
+        self, method: str = "iterative", cache: Optional[SolveCache] = None
+    ) -> bool:
         """Solve the maze using depth-first search.
 
+        Visited flags are cleared first, so solving again gives the same
+        answer. With a *cache*, a maze whose layout was solved before returns
+        at once, without searching or drawing.
+
+        Args:
+            method (str): ``"iterative"`` (default) runs :meth:`_solve_i`,
+                which handles arbitrarily large mazes; ``"recursive"`` runs
+                the original :meth:`_solve_r`. Both visit cells in the same
+                order.
+            cache (SolveCache | None): Cache to consult and fill.
+
         Returns:
             bool: ``True`` if the maze has a solution, ``False`` if it is
             unsolvable.
+
+        Raises:
+            ValueError: If *method* is not a recognised value.
+        """
+        match method:
+            case "iterative":
+                run = self._solve_i
+            case "recursive":
+                run = self._solve_r
+            case _:
+                raise ValueError("Unknown solve method.")
+        with self._phase("solve"):
+            key = ""
+            if cache is not None:
+                key = self.fingerprint() + "-solve"
+                hit = cache.get(key)
+                if hit is not None:
+                    return hit.found
+            self._reset_cells_visited()
+            if cache is None:
+                return run(0, 0)
+            recorder = PathRecorder(0)
+            self.subscribe(recorder)
+            try:
+                found = run(0, 0)
+            finally:
+                self.unsubscribe(recorder)
+            path = (
+                [divmod(idx, self.num_rows) for idx in recorder.path] if found else []
+            )
+            cache.put(key, SolveResult(path, recorder.visited))
+            return found
+
+    def fingerprint(
+        self, start: tuple[int, int] = (0, 0), goal: Optional[tuple[int, int]] = None
+    ) -> str:
+        """Return a content hash of the wall layout and the *start* and *goal*.
+
+        Mazes with identical walls share a fingerprint however they were
+        generated or loaded; see
+        :func:`~maze_solver_with_python.core.cache.fingerprint`.
+
+        Args:
+            start (tuple[int, int]): ``(col, row)`` of the start cell.
+            goal (tuple[int, int] | None): ``(col, row)`` of the goal cell.
+                Defaults to the exit.
+
+        Returns:
+            str: 64 hexadecimal digits.
+
+        Raises:
+            IndexError: If *start* or *goal* is outside the maze.
+        """
+        if goal is None:
+            goal = (self.num_cols - 1, self.num_rows - 1)
+        return fingerprint(
+            self._grid, self._grid.cell_index(*start), self._grid.cell_index(*goal)
+        )
+
+    def find_path(
+        self,
+        solver: str = "bfs",
+        start: tuple[int, int] = (0, 0),
+        goal: Optional[tuple[int, int]] = None,
+        cache: Optional[SolveCache] = None,
+    ) -> SolveResult:
+        """Find a path between two cells with a registered solver.
+
+        Unlike :meth:`solve`, this neither draws nor touches visited flags,
+        so it can be called repeatedly.
+
+        Args:
+            solver (str): Name of a solver in
+                :data:`~maze_solver_with_python.core.solvers.SOLVERS`:
+                ``"dfs"``, ``"bfs"`` (default), ``"astar"``,
+                ``"bidirectional"`` or ``"dead_end"``.
+            start (tuple[int, int]): ``(col, row)`` of the start cell.
+                Defaults to the entrance ``(0, 0)``.
+            goal (tuple[int, int] | None): ``(col, row)`` of the goal cell.
+                Defaults to the exit ``(num_cols-1, num_rows-1)``.
+            cache (SolveCache | None): Cache to consult and fill. Cached
+                results are shared, so they must not be modified.
+
+        Returns:
+            SolveResult: The path found and the number of cells expanded.
+
+        Raises:
+            ValueError: If *solver* is not a registered name.
+            IndexError: If *start* or *goal* is outside the maze.
+        """
+        try:
+            solve = SOLVERS[solver]
+        except KeyError:
+            raise ValueError("Unknown solver.") from None
+        if goal is None:
+            goal = (self.num_cols - 1, self.num_rows - 1)
+        with self._phase("find_path"):
+            grid = self._grid
+            start_idx, goal_idx = grid.cell_index(*start), grid.cell_index(*goal)
+            if cache is None:
+                return solve(grid, start_idx, goal_idx)
+            key = f"{fingerprint(grid, start_idx, goal_idx)}-{solver}"
+            result = cache.get(key)
+            if result is None:
+                result = solve(grid, start_idx, goal_idx)
+                cache.put(key, result)
+            return result
+
+    def set_wall(self, cell: tuple[int, int], direction: str, present: bool) -> bool:
+        """Add or remove the wall between *cell* and its neighbour.
+
+        Both cells' ``configs`` are updated together, and a ``WALL_ADDED`` or
+        ``WALL_REMOVED`` event is emitted if the wall changed, so windows
+        redraw and subscribed :class:`LPAStar` planners repair their paths.
+
+        Args:
+            cell (tuple[int, int]): ``(col, row)`` of the cell.
+            direction (str): ``"top"``, ``"bottom"``, ``"left"`` or
+                ``"right"``.
+            present (bool): ``True`` to add the wall, ``False`` to open it.
+
+        Returns:
+            bool: ``True`` if the wall changed.
+
+        Raises:
+            ValueError: If *direction* is not recognised or the wall is on the
+                outer border.
+            IndexError: If *cell* is outside the maze.
+        """
+        if direction not in WALL_BITS:
+            raise ValueError("Unknown direction.")
+        grid = self._grid
+        idx, bit = grid.cell_index(*cell), WALL_BITS[direction]
+        if not grid.is_interior(idx, bit):
+            raise ValueError("Border walls cannot be changed.")
+        if grid.has_wall(idx, bit) == present:
+            return False
+        grid.set_shared_wall(idx, bit, present)
+        if self._listeners:
+            self._emit(WALL_ADDED if present else WALL_REMOVED, idx, bit)
+        return True
+
+    def toggle_wall(self, cell: tuple[int, int], direction: str) -> bool:
+        """Flip the wall between *cell* and its neighbour.
+
+        Args:
+            cell (tuple[int, int]): ``(col, row)`` of the cell.
+            direction (str): ``"top"``, ``"bottom"``, ``"left"`` or
+                ``"right"``.
+
+        Returns:
+            bool: ``True`` if the wall is now present.
+
+        Raises:
+            ValueError: If *direction* is not recognised or the wall is on the
+                outer border.
+            IndexError: If *cell* is outside the maze.
+        """
+        if direction not in WALL_BITS:
+            raise ValueError("Unknown direction.")
+        grid = self._grid
+        present = not grid.has_wall(grid.cell_index(*cell), WALL_BITS[direction])
+        self.set_wall(cell, direction, present)
+        return present
+
+    def plan(
+        self, start: tuple[int, int] = (0, 0), goal: Optional[tuple[int, int]] = None
+    ) -> LPAStar:
+        """Find a shortest path and keep it current as walls change.
+
+        The planner is subscribed to this maze, so every :meth:`set_wall` or
+        :meth:`toggle_wall` repairs its path incrementally rather than
+        solving again. :meth:`unsubscribe` it to stop tracking.
+
+        Args:
+            start (tuple[int, int]): ``(col, row)`` of the start cell.
+            goal (tuple[int, int] | None): ``(col, row)`` of the goal cell.
+                Defaults to the exit.
+
+        Returns:
+            LPAStar: The planner; read its ``path`` or ``distance``.
+
+        Raises:
+            IndexError: If *start* or *goal* is outside the maze.
+        """
+        if goal is None:
+            goal = (self.num_cols - 1, self.num_rows - 1)
+        grid = self._grid
+        planner = LPAStar(grid, grid.cell_index(*start), grid.cell_index(*goal))
+        self.subscribe(planner)
+        return planner
+
+    def tree_index(self, root: tuple[int, int] = (0, 0)) -> TreeIndex:
+        """Build a spanning-tree index for repeated path queries.
+
+        Building walks the maze once; afterwards path lengths between any two
+        cells take ``O(log depth)`` and paths ``O(path length)``, with no
+        search. On a perfect maze these are the only, and so shortest, paths.
+        The index does not follow later wall edits.
+
+        Args:
+            root (tuple[int, int]): ``(col, row)`` of the tree root. Defaults
+                to the entrance.
+
+        Returns:
+            TreeIndex: The index.
+
+        Raises:
+            IndexError: If *root* is outside the maze.
+        """
+        return TreeIndex(self._grid, self._grid.cell_index(*root))
+
+    def distance_field(self, *sources: tuple[int, int]) -> DistanceField:
+        """Return the distance from the nearest source to every cell.
+
+        One breadth-first sweep fills the whole field, so it replaces a
+        solver call per cell. The field exposes its values through the
+        buffer protocol, e.g. ``numpy.asarray(field)``, without copying.
+
+        Args:
+            *sources (tuple[int, int]): ``(col, row)`` of each cell at
+                distance 0. Defaults to the entrance.
+
+        Returns:
+            DistanceField: The distances, in flat index order.
+
+        Raises:
+            IndexError: If a source is outside the maze.
+        """
+        grid = self._grid
+        cells = sources or ((0, 0),)
+        return DistanceField(grid, [grid.cell_index(i, j) for i, j in cells])
+
+    def diameter(self) -> tuple[tuple[int, int], tuple[int, int], int]:
+        """Return the two cells furthest apart and the steps between them.
+
+        Found with two sweeps; exact on perfect mazes, a lower bound on mazes
+        with loops.
+
+        Returns:
+            tuple[tuple[int, int], tuple[int, int], int]: ``(col, row)`` of
+            both ends and the path length between them.
+        """
+        a, b, length = diameter(self._grid)
+        return divmod(a, self.num_rows), divmod(b, self.num_rows), length
+
+    def dead_end_count(self) -> int:
+        """Return the number of cells with exactly one open neighbour.
+
+        Returns:
+            int: The number of dead ends.
+        """
+        return count_dead_ends(self._grid)
+
+    def save(self, path: str | os.PathLike[str]) -> int:
+        """Write the maze to *path* in the binary maze file format.
+
+        Args:
+            path (str | os.PathLike[str]): Destination file.
+
+        Returns:
+            int: Number of bytes written.
         """
-        return self._solve_r(0, 0)
+        with open(path, "wb") as file:
+            return file.write(dump_grid(self._grid, self.seed, self.generator))
+
+    def export(
+        self,
+        dest: str | os.PathLike[str],
+        solver: Optional[str] = "bfs",
+        scale: int = 4,
+        wall: int = 1,
+        margin: int = 0,
+        distances: Optional[DistanceField] = None,
+        fmt: str = "",
+    ) -> int:
+        """Write the maze, and its solution, as a PNG, PPM or SVG image.
+
+        Needs no window; see :mod:`~maze_solver_with_python.core.export`.
+
+        Args:
+            dest (str | os.PathLike[str]): Destination file; its suffix
+                (``.png``, ``.ppm`` or ``.svg``) picks the format unless
+                *fmt* is given.
+            solver (str | None): Solver whose path is drawn, or ``None`` to
+                draw the walls only.
+            scale (int): Pixels per cell, walls included.
+            wall (int): Wall thickness in pixels.
+            margin (int): Blank border around the maze in pixels.
+            distances (DistanceField | None): Field to draw as a heatmap
+                instead of a solution, e.g. from :meth:`distance_field`.
+                PNG and PPM only.
+            fmt (str): ``"png"``, ``"ppm"`` or ``"svg"``; overrides the
+                suffix of *dest*.
+
+        Returns:
+            int: Number of bytes written.
+
+        Raises:
+            ValueError: If the format, solver or geometry is not valid.
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from maze_solver_with_python.core.export import export_image
+
+        if distances is not None:
+            return export_image(
+                self._grid,
+                dest,
+                fmt=fmt,
+                scale=scale,
+                wall=wall,
+                margin=margin,
+                distances=distances.values,
+            )
+        path = [] if solver is None else self.find_path(solver).path
+        return export_image(
+            self._grid, dest, path, fmt, scale=scale, wall=wall, margin=margin
+        )
+
+    @classmethod
+    def load(
+        cls,
+        path: str | os.PathLike[str],
+        top_left: Optional[Point] = None,
+        cell_size_x: int = 1,
+        cell_size_y: int = 1,
+        win: Optional[Window] = None,
+    ) -> Self:
+        """Open a maze saved with :meth:`save` without regenerating it.
+
+        The file is memory-mapped copy-on-write, so opening takes constant
+        time and walls are decoded only as cells are accessed. Solving or
+        editing the loaded maze never modifies the file.
+
+        Args:
+            path (str | os.PathLike[str]): Maze file to open.
+            top_left (Point | None): Pixel offset of the top-left corner.
+                Defaults to ``Point(0, 0)``.
+            cell_size_x (int): Width of each cell in pixels.
+            cell_size_y (int): Height of each cell in pixels.
+            win (Window | None): Window for rendering, or ``None``.
+
+        Returns:
+            Maze: The loaded maze.
+
+        Raises:
+            ValueError: If *path* is not a complete maze file.
+        """
+        grid = open_grid(path)
+        header = grid.header
+        return cls(
+            Point(0, 0) if top_left is None else top_left,
+            header.num_rows,
+            header.num_cols,
+            cell_size_x,
+            cell_size_y,
+            win,
+            seed=header.seed,
+            generator=header.generator,
+            grid=grid,
+        )
@@ -0,0 +1,130 @@
+"""Module defining an optional NumPy-backed maze grid.
+
+Importing this module requires :mod:`numpy`. ``Maze(..., backend="numpy")``
+imports it lazily, so the pure-Python path never loads NumPy.
+"""
+
+import numpy as np
+import numpy.typing as npt
+
+from maze_solver_with_python.core.grid import (
+    ALL_WALLS,
+    BOTTOM,
+    LEFT,
+    RIGHT,
+    TOP,
+    WallGrid,
+)
+
+# Number of set bits in each 4-bit mask.
+_POPCOUNT = np.array([bin(mask).count("1") for mask in range(16)], dtype=np.uint8)
+
+
+class NumpyWallGrid(WallGrid):
+    """A :class:`WallGrid` with NumPy views for whole-array queries.
+
+    :attr:`walls_array` and :attr:`visited_array` are zero-copy ``uint8``
+    views over the inherited ``bytearray`` storage, so per-cell code keeps
+    its fast scalar access while batch queries run as vectorised operations.
+    Which directions stay inside the grid is precomputed once per cell.
+
+    Attributes:
+        walls_array (numpy.ndarray): ``uint8`` view of ``walls``.
+        visited_array (numpy.ndarray): ``uint8`` view of the visited bitset.
+        inner_mask (numpy.ndarray): Per-cell mask of the directions that lead
+            to another cell.
+    """
+
+    __slots__ = ("walls_array", "visited_array", "inner_mask", "_inner", "_steps")
+
+    def __init__(self, num_cols: int, num_rows: int) -> None:
+        """Initialize a grid with every wall present and no cell visited.
+
+        Args:
+            num_cols (int): Number of columns.
+            num_rows (int): Number of rows.
+        """
+        super().__init__(num_cols, num_rows)
+        self.walls_array = np.frombuffer(self.walls, dtype=np.uint8)
+        self.visited_array = np.frombuffer(self.visited, dtype=np.uint8)
+
+        cols, rows = np.divmod(np.arange(len(self)), num_rows)
+        inner = np.zeros(len(self), dtype=np.uint8)
+        inner[rows > 0] |= TOP
+        inner[rows < num_rows - 1] |= BOTTOM
+        inner[cols > 0] |= LEFT
+        inner[cols < num_cols - 1] |= RIGHT
+        self.inner_mask = inner
+        self._inner = inner.tobytes()
+
+        # Index offsets of the neighbours behind each open-wall mask.
+        deltas = ((TOP, -1), (BOTTOM, 1), (LEFT, -num_rows), (RIGHT, num_rows))
+        self._steps = tuple(
+            tuple(delta for bit, delta in deltas if mask & bit) for mask in range(16)
+        )
+
+    def open_neighbors(self, idx: int) -> list[int]:
+        """Return the in-bounds neighbours reachable from cell *idx*.
+
+        Uses the precomputed in-bounds masks instead of bounds checks.
+
+        Args:
+            idx (int): Flat cell index.
+
+        Returns:
+            list[int]: Flat indices of the reachable neighbours.
+        """
+        open_mask = ~self.walls[idx] & self._inner[idx]
+        return [idx + delta for delta in self._steps[open_mask]]
+
+    def reset_visited(self) -> None:
+        """Clear the visited flag of every cell in one array operation."""
+        self.visited_array.fill(0)
+
+    def visited_flags(self) -> npt.NDArray[np.bool_]:
+        """Return the visited flag of every cell.
+
+        Returns:
+            numpy.ndarray: Boolean array of length ``len(self)``.
+        """
+        bits = np.unpackbits(self.visited_array, bitorder="little")
+        return bits[: len(self)].astype(bool)
+
+    def open_mask(self) -> npt.NDArray[np.uint8]:
+        """Return, per cell, the directions open to another cell.
+
+        Returns:
+            numpy.ndarray: ``uint8`` wall-bit masks; entrance and exit
+            openings on the border are excluded.
+        """
+        return (self.walls_array ^ np.uint8(ALL_WALLS)) & self.inner_mask
+
+    def has_walls(
+        self, indices: npt.NDArray[np.intp], bit: int
+    ) -> npt.NDArray[np.bool_]:
+        """Return whether each cell in *indices* has the wall *bit*.
+
+        Args:
+            indices (numpy.ndarray): Flat cell indices.
+            bit (int): One of the wall bit constants.
+
+        Returns:
+            numpy.ndarray: Boolean array shaped like *indices*.
+        """
+        return (self.walls_array[indices] & bit) != 0
+
+    def degrees(self) -> npt.NDArray[np.uint8]:
+        """Return the number of open neighbours of every cell.
+
+        Returns:
+            numpy.ndarray: ``uint8`` counts between 0 and 4.
+        """
+        return _POPCOUNT[self.open_mask()]
+
+    def dead_ends(self) -> npt.NDArray[np.intp]:
+        """Return the flat indices of cells with exactly one open neighbour.
+
+        Returns:
+            numpy.ndarray: Sorted flat indices.
+        """
+        return np.flatnonzero(self.degrees() == 1)
@@ -0,0 +1,151 @@
+"""Module defining an incrementally repaired shortest path.
+
+:class:`LPAStar` implements Lifelong Planning A* (Koenig and Likhachev) on a
+:class:`~maze_solver_with_python.core.grid.WallGrid`. Every cell keeps its
+current distance estimate ``g`` and a one-step lookahead ``rhs``; after a
+wall changes only the two cells it separates are re-evaluated, and the
+search re-expands just the cells whose distances actually change instead of
+solving from scratch.
+
+A planner is also an event listener: subscribed to a maze with
+:meth:`Maze.subscribe <maze_solver_with_python.core.models.Maze.subscribe>`,
+it repairs its path on every ``WALL_ADDED`` or ``WALL_REMOVED`` event.
+"""
+
+import heapq
+from array import array
+
+from maze_solver_with_python.core.events import WALL_ADDED, WALL_REMOVED
+from maze_solver_with_python.core.grid import WallGrid
+
+
+class LPAStar:
+    """A shortest path between two fixed cells, kept current as walls change.
+
+    Attributes:
+        start (int): Flat index of the start cell.
+        goal (int): Flat index of the goal cell.
+        expanded (int): Cells expanded since the planner was built.
+    """
+
+    __slots__ = ("_g", "_grid", "_heap", "_inf", "_rhs", "expanded", "goal", "start")
+
+    def __init__(self, grid: WallGrid, start: int, goal: int) -> None:
+        """Plan the initial path.
+
+        Args:
+            grid (WallGrid): The maze walls, read live on every update.
+            start (int): Flat index of the start cell.
+            goal (int): Flat index of the goal cell.
+        """
+        self._grid = grid
+        self.start = start
+        self.goal = goal
+        self.expanded = 0
+        # Larger than any path length, and small enough for a C int.
+        self._inf = len(grid) + 1
+        self._g = array("i", [self._inf]) * len(grid)
+        self._rhs = array("i", [self._inf]) * len(grid)
+        self._rhs[start] = 0
+        self._heap = [(*self._key(start), start)]
+        self._compute()
+
+    def __call__(self, kind: int, a: int, b: int) -> None:
+        """Repair the path after a wall event.
+
+        Args:
+            kind (int): Event kind; only wall changes are acted on.
+            a (int): Flat index of the cell whose wall changed.
+            b (int): The wall bit.
+        """
+        if kind in (WALL_ADDED, WALL_REMOVED) and self._grid.is_interior(a, b):
+            self.update(a, self._grid.neighbor(a, b))
+
+    def _key(self, idx: int) -> tuple[int, int]:
+        """Return the priority of cell *idx*: ``(f, g)`` with a Manhattan ``h``."""
+        best = min(self._g[idx], self._rhs[idx])
+        num_rows = self._grid.num_rows
+        i, j = divmod(idx, num_rows)
+        goal_i, goal_j = divmod(self.goal, num_rows)
+        return best + abs(i - goal_i) + abs(j - goal_j), best
+
+    def _update_vertex(self, idx: int) -> None:
+        """Recompute ``rhs`` of cell *idx* and queue it if inconsistent."""
+        g = self._g
+        if idx != self.start:
+            best = self._inf
+            for n in self._grid.open_neighbors(idx):
+                best = min(best, g[n])
+            self._rhs[idx] = min(best + 1, self._inf)
+        if g[idx] != self._rhs[idx]:
+            heapq.heappush(self._heap, (*self._key(idx), idx))
+
+    def _compute(self) -> None:
+        """Expand inconsistent cells until the goal's distance is settled.
+
+        Queue entries are never removed in place; entries for cells that
+        became consistent or whose key changed are skipped when popped, as
+        every change pushes a fresh entry.
+        """
+        heap, g, rhs = self._heap, self._g, self._rhs
+        goal = self.goal
+        open_neighbors = self._grid.open_neighbors
+        while heap:
+            k1, k2, idx = heap[0]
+            if g[idx] == rhs[idx] or (k1, k2) != self._key(idx):
+                heapq.heappop(heap)
+                continue
+            if g[goal] == rhs[goal] and (k1, k2) >= self._key(goal):
+                return
+            heapq.heappop(heap)
+            self.expanded += 1
+            if g[idx] > rhs[idx]:
+                g[idx] = rhs[idx]
+            else:
+                g[idx] = self._inf
+                self._update_vertex(idx)
+            for n in open_neighbors(idx):
+                self._update_vertex(n)
+
+    def update(self, a: int, b: int) -> None:
+        """Repair the path after the wall between cells *a* and *b* changed.
+
+        Args:
+            a (int): Flat index of one cell.
+            b (int): Flat index of the adjacent cell.
+        """
+        self._update_vertex(a)
+        self._update_vertex(b)
+        self._compute()
+
+    @property
+    def distance(self) -> int:
+        """Steps on the current shortest path.
+
+        Returns:
+            int: The path length in moves, or ``-1`` if the goal is
+            unreachable.
+        """
+        steps = self._g[self.goal]
+        return -1 if steps == self._inf else steps
+
+    @property
+    def path(self) -> list[tuple[int, int]]:
+        """The current shortest path.
+
+        Returns:
+            list[tuple[int, int]]: ``(col, row)`` coordinates from start to
+            goal, both included, or an empty list if there is none.
+        """
+        g = self._g
+        idx = self.goal
+        if g[idx] == self._inf:
+            return []
+        num_rows = self._grid.num_rows
+        open_neighbors = self._grid.open_neighbors
+        path = [divmod(idx, num_rows)]
+        while idx != self.start:
+            idx = min(open_neighbors(idx), key=g.__getitem__)
+            path.append(divmod(idx, num_rows))
+        path.reverse()
+        return path
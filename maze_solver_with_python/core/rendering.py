@@ -0,0 +1,129 @@
+"""Module defining batched, item-reusing canvas rendering.
+
+Drawing a cell used to add four new canvas lines, with removed walls painted
+over in white, so the item count grew with every frame. :class:`CanvasRenderer`
+instead keeps one canvas item per line segment, keyed by its end points:
+removing a wall deletes its item and recolouring a path segment reconfigures
+the existing one. Updates are queued and applied once per frame, so a cell
+drawn many times between two frames costs a single canvas operation.
+"""
+
+from typing import Optional, Protocol
+
+from maze_solver_with_python.core.grid import BOTTOM, LEFT, RIGHT, TOP
+
+Segment = tuple[int, int, int, int]
+"""End points ``(x1, y1, x2, y2)`` of a line segment in pixels."""
+
+
+class LineCanvas(Protocol):
+    """The subset of :class:`tkinter.Canvas` used by the renderer."""
+
+    def create_line(
+        self, x1: int, y1: int, x2: int, y2: int, /, *, fill: str, width: int
+    ) -> int:
+        """Create a line item and return its id."""
+
+    def itemconfigure(self, item: int, /, *, fill: str) -> object:
+        """Change the colour of an existing item."""
+
+    def delete(self, item: int, /) -> None:
+        """Remove an item from the canvas."""
+
+
+class CanvasRenderer:
+    """Render line segments onto a canvas, one item per segment.
+
+    Attributes:
+        width (int): Stroke width of new line items.
+        wall_color (str): Colour of wall segments.
+    """
+
+    __slots__ = ("_canvas", "_items", "_pending", "wall_color", "width")
+
+    def __init__(
+        self, canvas: LineCanvas, width: int = 2, wall_color: str = "black"
+    ) -> None:
+        """Initialize a renderer with no items on *canvas*.
+
+        Args:
+            canvas (LineCanvas): Canvas to draw on, normally a
+                :class:`tkinter.Canvas`.
+            width (int): Stroke width of new line items.
+            wall_color (str): Colour of wall segments.
+        """
+        self._canvas = canvas
+        self.width = width
+        self.wall_color = wall_color
+        # segment -> (canvas item id, colour) for every segment on screen.
+        self._items: dict[Segment, tuple[int, str]] = {}
+        # segment -> colour to show at the next flush, ``None`` to remove.
+        self._pending: dict[Segment, Optional[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def dirty(self) -> int:
+        """Number of segments waiting for the next :meth:`flush`.
+
+        Returns:
+            int: Queued segment updates.
+        """
+        return len(self._pending)
+
+    def set_segment(self, segment: Segment, color: Optional[str]) -> None:
+        """Queue *segment* to be shown in *color*, or removed when ``None``.
+
+        Args:
+            segment (Segment): End points of the segment.
+            color (str | None): Line colour, or ``None`` to remove the line.
+        """
+        self._pending[segment] = color
+
+    def set_walls(self, x1: int, y1: int, x2: int, y2: int, mask: int) -> None:
+        """Queue the four walls of the cell spanning ``(x1, y1)``–``(x2, y2)``.
+
+        Walls shared with a neighbour map to the same segment, so each wall
+        has a single canvas item.
+
+        Args:
+            x1 (int): Left edge in pixels.
+            y1 (int): Top edge in pixels.
+            x2 (int): Right edge in pixels.
+            y2 (int): Bottom edge in pixels.
+            mask (int): Wall bits of the cell; set bits are drawn.
+        """
+        color = self.wall_color
+        pending = self._pending
+        pending[(x1, y1, x1, y2)] = color if mask & LEFT else None
+        pending[(x2, y1, x2, y2)] = color if mask & RIGHT else None
+        pending[(x1, y1, x2, y1)] = color if mask & TOP else None
+        pending[(x1, y2, x2, y2)] = color if mask & BOTTOM else None
+
+    def flush(self) -> int:
+        """Apply every queued update to the canvas.
+
+        Returns:
+            int: Number of canvas calls made.
+        """
+        canvas = self._canvas
+        items = self._items
+        calls = 0
+        for segment, color in self._pending.items():
+            current = items.get(segment)
+            if color is None:
+                if current is not None:
+                    canvas.delete(current[0])
+                    del items[segment]
+                    calls += 1
+            elif current is None:
+                item = canvas.create_line(*segment, fill=color, width=self.width)
+                items[segment] = (item, color)
+                calls += 1
+            elif current[1] != color:
+                canvas.itemconfigure(current[0], fill=color)
+                items[segment] = (current[0], color)
+                calls += 1
+        self._pending.clear()
+        return calls
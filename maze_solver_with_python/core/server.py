@@ -0,0 +1,457 @@
+"""Module defining an asyncio HTTP service that generates and solves mazes.
+
+The server uses only the standard library. Mazes are built by
+:func:`~maze_solver_with_python.core.batch.build` on a worker pool, so the
+event loop stays free to accept connections while mazes are carved:
+
+* identical requests that arrive while a maze is being built share one build
+  instead of queueing a copy each;
+* the most recent results are kept in a least-recently-used cache bounded
+  both by entry count and by total bytes, so a run of huge mazes cannot
+  exhaust memory;
+* layouts are sent with chunked transfer encoding, one bounded chunk at a
+  time, so a slow client never makes the server buffer a huge maze.
+
+Endpoints, all ``GET``:
+
+============  ==============================================================
+Path          Response
+============  ==============================================================
+``/maze``     JSON: the maze parameters, timings and solution path
+``/layout``   The maze in the binary maze file format, chunked
+``/stats``    JSON: request, cache and coalescing counters
+============  ==============================================================
+
+``/maze`` and ``/layout`` take ``seed`` (required), ``rows``, ``cols``,
+``generator`` and ``solver`` as query parameters.
+"""
+
+import asyncio
+import json
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import suppress
+from functools import partial
+from http import HTTPStatus
+from typing import Optional
+from urllib.parse import parse_qs, urlsplit
+
+from maze_solver_with_python.core.batch import BatchResult, build, check_names
+
+CHUNK_SIZE = 64 * 1024
+"""Largest chunk of a streamed layout, in bytes."""
+
+MAX_HEADER = 16 * 1024
+"""Largest accepted request head, in bytes."""
+
+CACHE_BYTES = 64 * 1024 * 1024
+"""Default byte budget of the result cache."""
+
+# (seed, rows, cols, generator, solver)
+Key = tuple[int, int, int, str, str]
+
+
+class MazeService:
+    """Builds mazes on a worker pool and serves them over HTTP/1.1.
+
+    Attributes:
+        cache_size (int): Most results kept in the cache.
+        cache_bytes (int): Most layout and solution bytes kept in the cache.
+        max_cells (int): Largest maze, in cells, a request may ask for.
+        requests (int): Maze requests received.
+        hits (int): Requests answered from the cache.
+        coalesced (int): Requests that joined a build already in flight.
+        builds (int): Mazes actually built.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        executor: str = "process",
+        cache_size: int = 256,
+        max_cells: int = 4_000_000,
+        cache_bytes: int = CACHE_BYTES,
+    ) -> None:
+        """Initialize the service and its worker pool.
+
+        Args:
+            workers (int | None): Number of workers; ``None`` lets the
+                executor choose.
+            executor (str): ``"process"`` (default) or ``"thread"``.
+            cache_size (int): Most results kept in the cache.
+            max_cells (int): Largest maze, in cells, a request may ask for.
+            cache_bytes (int): Most layout and solution bytes kept in the
+                cache; a larger result is served but not cached.
+
+        Raises:
+            ValueError: If *executor* is not a recognised name or
+                *cache_size* or *cache_bytes* is less than 1.
+        """
+        if executor not in ("process", "thread"):
+            raise ValueError("Unknown executor.")
+        if cache_size < 1:
+            raise ValueError("cache_size must be at least 1.")
+        if cache_bytes < 1:
+            raise ValueError("cache_bytes must be at least 1.")
+        self._pool: Executor
+        if executor == "thread":
+            self._pool = ThreadPoolExecutor(max_workers=workers)
+        else:
+            self._pool = ProcessPoolExecutor(max_workers=workers)
+        self.cache_size = cache_size
+        self.cache_bytes = cache_bytes
+        self.max_cells = max_cells
+        self._cache: OrderedDict[Key, BatchResult] = OrderedDict()
+        self._cached_bytes = 0
+        self._inflight: dict[Key, asyncio.Future[BatchResult]] = {}
+        self.requests = 0
+        self.hits = 0
+        self.coalesced = 0
+        self.builds = 0
+
+    def close(self) -> None:
+        """Shut the worker pool down, waiting for running builds."""
+        self._pool.shutdown()
+
+    async def get(
+        self,
+        seed: int,
+        num_rows: int = 50,
+        num_cols: int = 50,
+        generator: str = "dfs",
+        solver: str = "bfs",
+    ) -> BatchResult:
+        """Return the maze for these parameters, building it at most once.
+
+        Args:
+            seed (int): Generation seed.
+            num_rows (int): Number of rows.
+            num_cols (int): Number of columns.
+            generator (str): Generator name accepted by
+                :class:`~maze_solver_with_python.core.models.Maze`.
+            solver (str): Solver name accepted by ``Maze.find_path``.
+
+        Returns:
+            BatchResult: The serialised maze and its solution.
+
+        Raises:
+            ValueError: If a parameter is invalid.
+        """
+        if num_rows < 1 or num_cols < 1 or num_rows * num_cols > self.max_cells:
+            raise ValueError(f"Mazes must have 1 to {self.max_cells} cells.")
+        check_names(generator, solver)
+        self.requests += 1
+        key = (seed, num_rows, num_cols, generator, solver)
+        result = self._cache.get(key)
+        if result is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return result
+        future = self._inflight.get(key)
+        if future is None:
+            self.builds += 1
+            future = asyncio.get_running_loop().run_in_executor(self._pool, build, *key)
+            self._inflight[key] = future
+            future.add_done_callback(partial(self._finish, key))
+        else:
+            self.coalesced += 1
+        # A client that disconnects must not cancel the build for the others.
+        return await asyncio.shield(future)
+
+    def _finish(self, key: Key, future: "asyncio.Future[BatchResult]") -> None:
+        """Move a finished build from the in-flight table to the cache."""
+        del self._inflight[key]
+        if future.cancelled() or future.exception() is not None:
+            return
+        result = future.result()
+        size = _size(result)
+        if size > self.cache_bytes:
+            return
+        self._cache[key] = result
+        self._cached_bytes += size
+        while (
+            len(self._cache) > self.cache_size or self._cached_bytes > self.cache_bytes
+        ):
+            self._cached_bytes -= _size(self._cache.popitem(last=False)[1])
+
+    def stats(self) -> dict[str, int]:
+        """Return the service counters.
+
+        Returns:
+            dict[str, int]: Requests, cache hits, coalesced requests, builds,
+            the number of cached and in-flight mazes, and the bytes cached.
+        """
+        return {
+            "requests": self.requests,
+            "hits": self.hits,
+            "coalesced": self.coalesced,
+            "builds": self.builds,
+            "cached": len(self._cache),
+            "inflight": len(self._inflight),
+            "cached_bytes": self._cached_bytes,
+        }
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8080) -> asyncio.Server:
+        """Start listening for HTTP connections.
+
+        Args:
+            host (str): Interface to bind.
+            port (int): TCP port; ``0`` picks a free one.
+
+        Returns:
+            asyncio.Server: The listening server.
+        """
+        return await asyncio.start_server(self.handle, host, port, limit=MAX_HEADER)
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve the requests of one connection until it closes.
+
+        Connections are kept alive between requests unless the client sends
+        ``Connection: close`` or speaks HTTP/1.0. Request bodies are never
+        read, so a request that is not a ``GET`` or announces a body with
+        ``Content-Length`` or ``Transfer-Encoding`` is answered and the
+        connection closed; otherwise the body would be parsed as the next
+        request.
+
+        Args:
+            reader (asyncio.StreamReader): Incoming bytes.
+            writer (asyncio.StreamWriter): Outgoing bytes.
+        """
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    return
+                except asyncio.LimitOverrunError:
+                    await _send_json(
+                        writer,
+                        HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE,
+                        {"error": "Request head too large."},
+                        keep_alive=False,
+                    )
+                    return
+                request_line, *header_lines = head.decode("latin-1").split("\r\n")
+                parts = request_line.split(" ")
+                if len(parts) != 3:
+                    await _send_json(
+                        writer,
+                        HTTPStatus.BAD_REQUEST,
+                        {"error": "Malformed request line."},
+                        keep_alive=False,
+                    )
+                    return
+                method, target, version = parts
+                headers = {}
+                for line in header_lines:
+                    name, _, value = line.partition(":")
+                    headers[name.strip().lower()] = value.strip().lower()
+                has_body = "transfer-encoding" in headers or headers.get(
+                    "content-length", "0"
+                ) not in ("", "0")
+                keep_alive = (
+                    version == "HTTP/1.1"
+                    and headers.get("connection") != "close"
+                    and method == "GET"
+                    and not has_body
+                )
+                await self._dispatch(method, target, writer, keep_alive)
+                if not keep_alive:
+                    return
+        except ConnectionError:
+            return
+        finally:
+            writer.close()
+            with suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _dispatch(
+        self, method: str, target: str, writer: asyncio.StreamWriter, keep_alive: bool
+    ) -> None:
+        """Answer one request."""
+        if method != "GET":
+            await _send_json(
+                writer,
+                HTTPStatus.METHOD_NOT_ALLOWED,
+                {"error": "Only GET is supported."},
+                keep_alive,
+            )
+            return
+        url = urlsplit(target)
+        if url.path == "/stats":
+            await _send_json(writer, HTTPStatus.OK, self.stats(), keep_alive)
+            return
+        if url.path not in ("/maze", "/layout"):
+            await _send_json(
+                writer, HTTPStatus.NOT_FOUND, {"error": "Unknown path."}, keep_alive
+            )
+            return
+        query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        try:
+            seed = int(query["seed"])
+            rows = int(query.get("rows", 50))
+            cols = int(query.get("cols", 50))
+        except KeyError:
+            await _send_json(
+                writer,
+                HTTPStatus.BAD_REQUEST,
+                {"error": "seed is required."},
+                keep_alive,
+            )
+            return
+        except ValueError as exc:
+            await _send_json(
+                writer, HTTPStatus.BAD_REQUEST, {"error": str(exc)}, keep_alive
+            )
+            return
+        generator = query.get("generator", "dfs")
+        solver = query.get("solver", "bfs")
+        try:
+            result = await self.get(seed, rows, cols, generator, solver)
+        except ValueError as exc:
+            await _send_json(
+                writer, HTTPStatus.BAD_REQUEST, {"error": str(exc)}, keep_alive
+            )
+            return
+        # A failed build (a crashed worker, say) must not drop the connection.
+        except Exception:  # pylint: disable=broad-exception-caught
+            await _send_json(
+                writer,
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                {"error": "Maze build failed."},
+                keep_alive,
+            )
+            return
+
+        if url.path == "/layout":
+            await _send_chunked(writer, result.layout, keep_alive)
+            return
+        document = {
+            "seed": seed,
+            "rows": rows,
+            "cols": cols,
+            "generator": generator,
+            "solver": solver,
+            "generate_ms": result.generate_seconds * 1e3,
+            "solve_ms": result.solve_seconds * 1e3,
+            "path": result.path,
+        }
+        await _send_json(writer, HTTPStatus.OK, document, keep_alive)
+
+
+def _size(result: BatchResult) -> int:
+    """Return the bytes a cached result holds."""
+    return len(result.layout) + len(result.solution)
+
+
+def _head(
+    status: HTTPStatus, content_type: str, keep_alive: bool, framing: str
+) -> bytes:
+    """Return a response status line and headers."""
+    return (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"{framing}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    ).encode("latin-1")
+
+
+async def _send_json(
+    writer: asyncio.StreamWriter, status: HTTPStatus, document: object, keep_alive: bool
+) -> None:
+    """Send *document* as a complete JSON response."""
+    body = json.dumps(document).encode()
+    framing = f"Content-Length: {len(body)}"
+    writer.write(_head(status, "application/json", keep_alive, framing) + body)
+    await writer.drain()
+
+
+async def _send_chunked(
+    writer: asyncio.StreamWriter, data: bytes, keep_alive: bool
+) -> None:
+    """Stream *data* in chunks of at most :data:`CHUNK_SIZE` bytes.
+
+    Waiting for the transport to drain after each chunk bounds what is
+    buffered per connection, however large the maze.
+    """
+    framing = "Transfer-Encoding: chunked"
+    writer.write(_head(HTTPStatus.OK, "application/octet-stream", keep_alive, framing))
+    view = memoryview(data)
+    for pos in range(0, len(view), CHUNK_SIZE):
+        chunk = view[pos : pos + CHUNK_SIZE]
+        writer.write(b"%x\r\n" % len(chunk))
+        writer.write(chunk)
+        writer.write(b"\r\n")
+        await writer.drain()
+    writer.write(b"0\r\n\r\n")
+    await writer.drain()
+
+
+async def fetch(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    target: str,
+    keep_alive: bool = True,
+) -> tuple[int, bytes]:
+    """Send one ``GET`` on an open connection and read the whole response.
+
+    A minimal client for tests and load generation; it understands the
+    ``Content-Length`` and chunked responses this server sends.
+
+    Args:
+        reader (asyncio.StreamReader): Connection input.
+        writer (asyncio.StreamWriter): Connection output.
+        target (str): Request path and query, e.g. ``/maze?seed=1``.
+        keep_alive (bool): Whether to keep the connection open afterwards.
+
+    Returns:
+        tuple[int, bytes]: The status code and the decoded body.
+    """
+    connection = "keep-alive" if keep_alive else "close"
+    request = f"GET {target} HTTP/1.1\r\nHost: maze\r\nConnection: {connection}"
+    writer.write(request.encode("latin-1") + b"\r\n\r\n")
+    await writer.drain()
+    head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1")
+    status_line, *header_lines = head.split("\r\n")
+    status = int(status_line.split()[1])
+    headers = {}
+    for line in header_lines:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    if "content-length" in headers:
+        return status, await reader.readexactly(int(headers["content-length"]))
+    chunks = []
+    while size := int((await reader.readuntil(b"\r\n"))[:-2], 16):
+        chunks.append(await reader.readexactly(size))
+        await reader.readexactly(2)
+    await reader.readexactly(2)
+    return status, b"".join(chunks)
+
+
+async def serve(
+    host: str = "127.0.0.1",
+    port: int = 8080,
+    workers: Optional[int] = None,
+    executor: str = "process",
+    cache_size: int = 256,
+    cache_bytes: int = CACHE_BYTES,
+) -> None:
+    """Run a :class:`MazeService` until cancelled.
+
+    Args:
+        host (str): Interface to bind.
+        port (int): TCP port.
+        workers (int | None): Number of workers.
+        executor (str): ``"process"`` or ``"thread"``.
+        cache_size (int): Most results kept in the cache.
+        cache_bytes (int): Most layout and solution bytes kept in the cache.
+    """
+    service = MazeService(workers, executor, cache_size, cache_bytes=cache_bytes)
+    try:
+        server = await service.start(host, port)
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
@@ -0,0 +1,263 @@
+"""Module defining pluggable maze solvers.
+
+Every solver takes a :class:`~maze_solver_with_python.core.grid.WallGrid` and
+flat start and goal indices, and returns a :class:`SolveResult`. Solvers never
+touch the grid's visited bitset, so they can run any number of times on the
+same maze.
+"""
+
+import heapq
+from array import array
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from maze_solver_with_python.core.grid import WallGrid
+
+
+@dataclass
+class SolveResult:
+    """Outcome of a solver run.
+
+    Attributes:
+        path (list[tuple[int, int]]): ``(col, row)`` coordinates from start to
+            goal, both included. Empty when the goal is unreachable.
+        expanded (int): Number of cells the solver expanded (dequeued, popped
+            or filled) before finishing.
+    """
+
+    path: list[tuple[int, int]] = field(default_factory=list)
+    expanded: int = 0
+
+    @property
+    def found(self) -> bool:
+        """Whether a path was found.
+
+        Returns:
+            bool: ``True`` if :attr:`path` is non-empty.
+        """
+        return bool(self.path)
+
+
+def _trace(grid: WallGrid, parents: array, goal: int) -> list[tuple[int, int]]:
+    """Follow *parents* back from *goal* and return the path as coordinates."""
+    path = []
+    idx = goal
+    while idx != -1:
+        path.append(divmod(idx, grid.num_rows))
+        idx = parents[idx]
+    path.reverse()
+    return path
+
+
+def _parents(grid: WallGrid) -> array:
+    """Return a parent array with every entry unset (``-2``)."""
+    return array("q", [-2]) * len(grid)
+
+
+def dfs(grid: WallGrid, start: int, goal: int) -> SolveResult:
+    """Depth-first search, exploring neighbours in ``DIRECTIONS`` order.
+
+    Args:
+        grid (WallGrid): The maze walls.
+        start (int): Flat index of the start cell.
+        goal (int): Flat index of the goal cell.
+
+    Returns:
+        SolveResult: A path (not necessarily the shortest) and the number of
+        cells expanded.
+    """
+    parents = _parents(grid)
+    parents[start] = -1
+    stack = [start]
+    expanded = 0
+    while stack:
+        idx = stack.pop()
+        expanded += 1
+        if idx == goal:
+            return SolveResult(_trace(grid, parents, goal), expanded)
+        for n in reversed(grid.open_neighbors(idx)):
+            if parents[n] == -2:
+                parents[n] = idx
+                stack.append(n)
+    return SolveResult([], expanded)
+
+
+def bfs(grid: WallGrid, start: int, goal: int) -> SolveResult:
+    """Breadth-first search.
+
+    Args:
+        grid (WallGrid): The maze walls.
+        start (int): Flat index of the start cell.
+        goal (int): Flat index of the goal cell.
+
+    Returns:
+        SolveResult: A shortest path and the number of cells expanded.
+    """
+    parents = _parents(grid)
+    parents[start] = -1
+    queue = deque([start])
+    expanded = 0
+    while queue:
+        idx = queue.popleft()
+        expanded += 1
+        if idx == goal:
+            return SolveResult(_trace(grid, parents, goal), expanded)
+        for n in grid.open_neighbors(idx):
+            if parents[n] == -2:
+                parents[n] = idx
+                queue.append(n)
+    return SolveResult([], expanded)
+
+
+def astar(grid: WallGrid, start: int, goal: int) -> SolveResult:
+    """A* search guided by the Manhattan distance to the goal.
+
+    Ties in estimated total cost go to the cell farthest from the start. On
+    mazes with loops many cells share the same estimate, and preferring the
+    deepest one follows a single shortest path instead of widening across
+    all of them.
+
+    Args:
+        grid (WallGrid): The maze walls.
+        start (int): Flat index of the start cell.
+        goal (int): Flat index of the goal cell.
+
+    Returns:
+        SolveResult: A shortest path and the number of cells expanded.
+    """
+    num_rows = grid.num_rows
+    goal_i, goal_j = divmod(goal, num_rows)
+
+    def heuristic(idx: int) -> int:
+        i, j = divmod(idx, num_rows)
+        return abs(i - goal_i) + abs(j - goal_j)
+
+    parents = _parents(grid)
+    parents[start] = -1
+    costs = array("q", [-1]) * len(grid)
+    costs[start] = 0
+    closed = bytearray(len(grid))
+    # Entries are (f, -g, idx), so equal f pops the largest g first.
+    heap = [(heuristic(start), 0, start)]
+    expanded = 0
+    while heap:
+        _, cost, idx = heapq.heappop(heap)
+        if closed[idx]:
+            continue
+        closed[idx] = 1
+        expanded += 1
+        if idx == goal:
+            return SolveResult(_trace(grid, parents, goal), expanded)
+        cost = 1 - cost
+        for n in grid.open_neighbors(idx):
+            if not closed[n] and (costs[n] == -1 or cost < costs[n]):
+                costs[n] = cost
+                parents[n] = idx
+                heapq.heappush(heap, (cost + heuristic(n), -cost, n))
+    return SolveResult([], expanded)
+
+
+def bidirectional_bfs(grid: WallGrid, start: int, goal: int) -> SolveResult:
+    """Breadth-first search from both ends, meeting in the middle.
+
+    Each round expands one full layer of whichever frontier is smaller.
+
+    Args:
+        grid (WallGrid): The maze walls.
+        start (int): Flat index of the start cell.
+        goal (int): Flat index of the goal cell.
+
+    Returns:
+        SolveResult: A shortest path and the number of cells expanded.
+    """
+    if start == goal:
+        return SolveResult([divmod(start, grid.num_rows)], 1)
+
+    forward = _parents(grid)
+    backward = _parents(grid)
+    forward[start] = -1
+    backward[goal] = -1
+    frontiers = ([start], [goal])
+    expanded = 0
+
+    while frontiers[0] and frontiers[1]:
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        seen, other = (forward, backward) if side == 0 else (backward, forward)
+        layer: list[int] = []
+        for idx in frontiers[side]:
+            expanded += 1
+            for n in grid.open_neighbors(idx):
+                if seen[n] != -2:
+                    continue
+                seen[n] = idx
+                if other[n] != -2:
+                    path = _trace(grid, forward, n)
+                    tail = _trace(grid, backward, n)
+                    tail.reverse()
+                    return SolveResult(path + tail[1:], expanded)
+                layer.append(n)
+        frontiers = (layer, frontiers[1]) if side == 0 else (frontiers[0], layer)
+
+    return SolveResult([], expanded)
+
+
+def dead_end_filling(grid: WallGrid, start: int, goal: int) -> SolveResult:
+    """Fill dead ends until only the start-to-goal corridor is left.
+
+    Cells with at most one open neighbour (other than *start* and *goal*) are
+    filled, which may turn their neighbour into a new dead end. What remains
+    is searched breadth-first, so mazes with loops still get a shortest path.
+
+    Args:
+        grid (WallGrid): The maze walls.
+        start (int): Flat index of the start cell.
+        goal (int): Flat index of the goal cell.
+
+    Returns:
+        SolveResult: A shortest path and the number of cells filled plus the
+        number of cells walked afterwards.
+    """
+    size = len(grid)
+    degrees = bytearray(len(grid.open_neighbors(idx)) for idx in range(size))
+    filled = bytearray(size)
+    queue = deque(
+        idx for idx in range(size) if degrees[idx] <= 1 and idx not in (start, goal)
+    )
+    expanded = 0
+    while queue:
+        idx = queue.popleft()
+        if filled[idx]:
+            continue
+        filled[idx] = 1
+        expanded += 1
+        for n in grid.open_neighbors(idx):
+            if filled[n]:
+                continue
+            degrees[n] -= 1
+            if degrees[n] <= 1 and n not in (start, goal):
+                queue.append(n)
+
+    parents = _parents(grid)
+    parents[start] = -1
+    walk = deque([start])
+    while walk:
+        idx = walk.popleft()
+        expanded += 1
+        if idx == goal:
+            return SolveResult(_trace(grid, parents, goal), expanded)
+        for n in grid.open_neighbors(idx):
+            if not filled[n] and parents[n] == -2:
+                parents[n] = idx
+                walk.append(n)
+    return SolveResult([], expanded)
+
+
+SOLVERS: dict[str, Callable[[WallGrid, int, int], SolveResult]] = {
+    "dfs": dfs,
+    "bfs": bfs,
+    "astar": astar,
+    "bidirectional": bidirectional_bfs,
+    "dead_end": dead_end_filling,
+}
+"""Registry of solvers by name, as accepted by :meth:`Maze.find_path`."""
@@ -0,0 +1,413 @@
+"""Module defining the compact binary maze file format.
+
+A maze file is a fixed 40-byte little-endian header followed by the wall
+masks of every cell, packed two 4-bit masks per byte in row-major order
+(cell ``(i, j)`` is nibble ``j * num_cols + i``; even nibbles use the low half
+of a byte). The header layout is:
+
+==========  ======  ============================================
+Field       Type    Meaning
+==========  ======  ============================================
+magic       4s      ``b"MAZE"``
+version     uint8   :data:`FORMAT_VERSION`
+flags       uint8   bit 0 set when ``seed`` is meaningful
+reserved    uint16  zero
+num_cols    uint32  number of columns
+num_rows    uint32  number of rows
+seed        int64   generation seed
+generator   16s     generator name, ASCII, NUL-padded
+==========  ======  ============================================
+
+:func:`open_grid` memory-maps a file instead of reading it, so opening takes
+constant time and wall masks are decoded only when a cell is accessed.
+"""
+
+import mmap
+import os
+import struct
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import BinaryIO, Optional
+
+from maze_solver_with_python.core.grid import WallGrid
+
+MAGIC = b"MAZE"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sBBHIIq16s")
+
+_FLAG_SEED = 1
+_READ_CHUNK = 1 << 16  # bytes read from the body at a time
+
+# Byte-wise lookup tables for packing and unpacking nibbles.
+_TO_HIGH = bytes((b << 4) & 0xFF for b in range(256))
+_LOW = bytes(b & 0x0F for b in range(256))
+_HIGH = bytes(b >> 4 for b in range(256))
+
+
+@dataclass(frozen=True)
+class MazeHeader:
+    """Metadata stored at the start of a maze file.
+
+    Attributes:
+        num_cols (int): Number of columns.
+        num_rows (int): Number of rows.
+        seed (int | None): Seed the maze was generated with, if known.
+        generator (str): Name of the generation algorithm.
+    """
+
+    num_cols: int
+    num_rows: int
+    seed: Optional[int] = None
+    generator: str = ""
+
+    @property
+    def body_size(self) -> int:
+        """Number of bytes of packed wall masks following the header.
+
+        Returns:
+            int: ``ceil(num_cols * num_rows / 2)``.
+        """
+        return (self.num_cols * self.num_rows + 1) >> 1
+
+    def pack(self) -> bytes:
+        """Encode the header.
+
+        Returns:
+            bytes: The :data:`HEADER`-sized binary header.
+        """
+        return HEADER.pack(
+            MAGIC,
+            FORMAT_VERSION,
+            _FLAG_SEED if self.seed is not None else 0,
+            0,
+            self.num_cols,
+            self.num_rows,
+            self.seed or 0,
+            self.generator.encode("ascii"),
+        )
+
+    @classmethod
+    def unpack(cls, data: bytes) -> "MazeHeader":
+        """Decode a header.
+
+        Args:
+            data (bytes): At least :data:`HEADER` ``.size`` bytes.
+
+        Returns:
+            MazeHeader: The decoded header.
+
+        Raises:
+            ValueError: If *data* is not a supported maze header.
+        """
+        if len(data) < HEADER.size:
+            raise ValueError("Truncated maze header.")
+        magic, version, flags, _, num_cols, num_rows, seed, generator = (
+            HEADER.unpack_from(data)
+        )
+        if magic != MAGIC:
+            raise ValueError("Not a maze file.")
+        if version != FORMAT_VERSION:
+            raise ValueError("Unsupported maze file version.")
+        return cls(
+            num_cols,
+            num_rows,
+            seed if flags & _FLAG_SEED else None,
+            generator.rstrip(b"\0").decode("ascii"),
+        )
+
+
+def pack_masks(masks: bytes | bytearray) -> bytes:
+    """Pack 4-bit wall masks two per byte.
+
+    Args:
+        masks (bytes | bytearray): One mask per byte. An odd trailing mask
+            is packed with a zero high nibble.
+
+    Returns:
+        bytes: ``ceil(len(masks) / 2)`` packed bytes.
+    """
+    size = (len(masks) + 1) >> 1
+    low = int.from_bytes(masks[0::2], "little")
+    high = int.from_bytes(masks[1::2].translate(_TO_HIGH), "little")
+    return (low | high).to_bytes(size, "little")
+
+
+def unpack_masks(packed: bytes | bytearray, count: int) -> bytearray:
+    """Unpack *count* 4-bit wall masks from *packed*.
+
+    Args:
+        packed (bytes | bytearray): Bytes produced by :func:`pack_masks`.
+        count (int): Number of masks to return.
+
+    Returns:
+        bytearray: One mask per byte.
+    """
+    masks = bytearray(len(packed) * 2)
+    masks[0::2] = packed.translate(_LOW)
+    masks[1::2] = packed.translate(_HIGH)
+    del masks[count:]
+    return masks
+
+
+def write_rows(
+    file: BinaryIO,
+    num_cols: int,
+    num_rows: int,
+    rows: Iterable[bytes | bytearray],
+    seed: Optional[int] = None,
+    generator: str = "",
+) -> int:
+    """Stream rows of wall masks to *file* in the maze file format.
+
+    Rows are packed and written as they arrive, so memory stays at one row
+    regardless of maze size. Pair it with
+    :func:`~maze_solver_with_python.core.generators.stream_eller` to write
+    mazes larger than RAM.
+
+    Args:
+        file (BinaryIO): Binary file object opened for writing.
+        num_cols (int): Number of columns (masks per row).
+        num_rows (int): Number of rows *rows* yields.
+        rows (Iterable[bytes | bytearray]): Wall masks per row, top row
+            first.
+        seed (int | None): Seed recorded in the header.
+        generator (str): Generator name recorded in the header.
+
+    Returns:
+        int: Number of bytes written, header included.
+
+    Raises:
+        ValueError: If a row has the wrong length or the row count is off.
+    """
+    written = file.write(MazeHeader(num_cols, num_rows, seed, generator).pack())
+    carry = b""
+    count = 0
+    for row in rows:
+        if len(row) != num_cols:
+            raise ValueError("Row length does not match num_cols.")
+        count += 1
+        data = carry + row if carry else row
+        even = len(data) & ~1
+        written += file.write(pack_masks(data[:even]))
+        carry = bytes(data[even:])
+    if count != num_rows:
+        raise ValueError("Row count does not match num_rows.")
+    if carry:
+        written += file.write(pack_masks(carry))
+    return written
+
+
+def read_header(file: BinaryIO) -> MazeHeader:
+    """Read the header from the start of a maze file.
+
+    Args:
+        file (BinaryIO): Binary file object positioned at the header.
+
+    Returns:
+        MazeHeader: The decoded header.
+    """
+    return MazeHeader.unpack(file.read(HEADER.size))
+
+
+def iter_rows(file: BinaryIO, header: MazeHeader) -> Iterator[bytearray]:
+    """Stream the rows of wall masks following a header.
+
+    Reads the body in bounded chunks, so memory stays flat for any maze.
+
+    Args:
+        file (BinaryIO): Binary file object positioned just after the header.
+        header (MazeHeader): Header returned by :func:`read_header`.
+
+    Yields:
+        bytearray: ``num_cols`` wall masks per row, top row first.
+
+    Raises:
+        ValueError: If the file ends before every row is read.
+    """
+    num_cols = header.num_cols
+    buffer = bytearray()
+    pos = 0
+    remaining = header.body_size
+    for _ in range(header.num_rows):
+        while len(buffer) - pos < num_cols:
+            del buffer[:pos]
+            pos = 0
+            chunk = file.read(min(remaining, max(_READ_CHUNK, num_cols)))
+            if not chunk:
+                raise ValueError("Truncated maze file.")
+            remaining -= len(chunk)
+            buffer += unpack_masks(chunk, len(chunk) * 2)
+        yield buffer[pos : pos + num_cols]
+        pos += num_cols
+
+
+def dump_grid(grid: WallGrid, seed: Optional[int] = None, generator: str = "") -> bytes:
+    """Serialise a grid to the maze file format.
+
+    Args:
+        grid (WallGrid): Grid whose wall masks are written.
+        seed (int | None): Seed recorded in the header.
+        generator (str): Generator name recorded in the header.
+
+    Returns:
+        bytes: Header followed by the packed row-major wall masks.
+    """
+    num_rows = grid.num_rows
+    header = MazeHeader(grid.num_cols, num_rows, seed, generator)
+    if isinstance(grid.walls, PackedWalls):
+        return header.pack() + grid.walls.packed()
+    rows = b"".join(grid.walls[j::num_rows] for j in range(num_rows))
+    return header.pack() + pack_masks(rows)
+
+
+def load_grid(data: bytes) -> tuple[MazeHeader, WallGrid]:
+    """Deserialise bytes produced by :func:`dump_grid` or :func:`write_rows`.
+
+    Args:
+        data (bytes): A complete maze file.
+
+    Returns:
+        tuple[MazeHeader, WallGrid]: The header and a grid holding the walls.
+
+    Raises:
+        ValueError: If *data* is not a complete maze file.
+    """
+    header = MazeHeader.unpack(data)
+    body = data[HEADER.size : HEADER.size + header.body_size]
+    if len(body) < header.body_size:
+        raise ValueError("Truncated maze file.")
+
+    grid = WallGrid(header.num_cols, header.num_rows)
+    grid.walls[:] = _column_major(body, header.num_cols, header.num_rows)
+    return header, grid
+
+
+def _column_major(packed: bytes | bytearray, num_cols: int, num_rows: int) -> bytearray:
+    """Unpack row-major packed masks into a column-major mask per byte."""
+    masks = unpack_masks(packed, num_cols * num_rows)
+    walls = bytearray(len(masks))
+    for j in range(num_rows):
+        walls[j::num_rows] = masks[j * num_cols : (j + 1) * num_cols]
+    return walls
+
+
+class PackedWalls:
+    """Column-major wall masks decoded on access from packed nibbles.
+
+    Stands in for :attr:`WallGrid.walls` over the body of a maze file held in
+    a buffer such as a memory map: reading cell ``idx`` decodes one nibble and
+    writing it updates that nibble in place, so no cell is unpacked up front.
+    """
+
+    __slots__ = ("_data", "_offset", "_num_cols", "_num_rows")
+
+    def __init__(
+        self, data: mmap.mmap | bytearray, offset: int, num_cols: int, num_rows: int
+    ) -> None:
+        """Wrap the packed body starting at *offset* in *data*.
+
+        Args:
+            data (mmap.mmap | bytearray): Writable buffer holding the body.
+            offset (int): Position of the first packed byte.
+            num_cols (int): Number of columns.
+            num_rows (int): Number of rows.
+        """
+        self._data = data
+        self._offset = offset
+        self._num_cols = num_cols
+        self._num_rows = num_rows
+
+    def __len__(self) -> int:
+        return self._num_cols * self._num_rows
+
+    def __getitem__(self, idx: int) -> int:
+        i, j = divmod(idx, self._num_rows)
+        nibble = j * self._num_cols + i
+        return (self._data[self._offset + (nibble >> 1)] >> ((nibble & 1) << 2)) & 15
+
+    def __setitem__(self, idx: int, mask: int) -> None:
+        i, j = divmod(idx, self._num_rows)
+        nibble = j * self._num_cols + i
+        pos = self._offset + (nibble >> 1)
+        if nibble & 1:
+            self._data[pos] = (self._data[pos] & 0x0F) | (mask & 15) << 4
+        else:
+            self._data[pos] = (self._data[pos] & 0xF0) | (mask & 15)
+
+    def __bytes__(self) -> bytes:
+        return bytes(_column_major(self.packed(), self._num_cols, self._num_rows))
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(bytes(self))
+
+    def packed(self) -> bytes | bytearray:
+        """Return the packed body in the maze file layout.
+
+        Returns:
+            bytes | bytearray: ``ceil(len(self) / 2)`` bytes of row-major nibbles.
+        """
+        return self._data[self._offset : self._offset + ((len(self) + 1) >> 1)]
+
+
+class MappedWallGrid(WallGrid):
+    """A :class:`WallGrid` backed by a memory-mapped maze file.
+
+    The file is mapped copy-on-write (``ACCESS_COPY``): the grid can be
+    carved or solved freely, but changes never reach the file. Visited flags
+    live in an anonymous map, which the OS also zero-fills lazily.
+
+    Attributes:
+        header (MazeHeader): Header of the mapped file.
+    """
+
+    __slots__ = ("header", "_maps")
+
+    # pylint: disable-next=super-init-not-called
+    def __init__(self, data: mmap.mmap, header: MazeHeader) -> None:
+        """Wrap a mapped maze file.
+
+        Args:
+            data (mmap.mmap): Map of the whole file, header included.
+            header (MazeHeader): The decoded header.
+        """
+        self.num_cols = header.num_cols
+        self.num_rows = header.num_rows
+        visited = mmap.mmap(-1, max((len(self) + 7) >> 3, 1))
+        self.walls = PackedWalls(  # type: ignore[assignment]
+            data, HEADER.size, header.num_cols, header.num_rows
+        )
+        self.visited = visited  # type: ignore[assignment]
+        self.header = header
+        self._maps = (data, visited)
+
+    def close(self) -> None:
+        """Release the file and visited-flag maps."""
+        for mapped in self._maps:
+            mapped.close()
+
+
+def open_grid(path: str | os.PathLike[str]) -> MappedWallGrid:
+    """Memory-map a maze file as a grid.
+
+    Only the header is read, so opening takes constant time whatever the
+    file size.
+
+    Args:
+        path (str | os.PathLike[str]): Maze file to open.
+
+    Returns:
+        MappedWallGrid: A grid decoding walls from the file on access.
+
+    Raises:
+        ValueError: If the file is not a complete maze file.
+    """
+    with open(path, "rb") as file:
+        data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+    try:
+        header = MazeHeader.unpack(data[: HEADER.size])
+        if len(data) < HEADER.size + header.body_size:
+            raise ValueError("Truncated maze file.")
+    except ValueError:
+        data.close()
+        raise
+    return MappedWallGrid(data, header)
@@ -0,0 +1,196 @@
+"""Module defining a spanning-tree index for arbitrary path queries.
+
+A perfect maze is a tree, so the path between any two cells is unique: it
+climbs from each end to their lowest common ancestor (LCA). :class:`TreeIndex`
+roots a breadth-first spanning tree at one cell, records each cell's parent
+and depth, and builds a binary-lifting table of ``2**k``-th ancestors. After
+that one ``O(n log d)`` build, where *d* is the tree depth, a path length
+costs ``O(log d)`` and a full path ``O(path length)``, with no search.
+
+On a maze with loops the index still returns valid paths, but they follow
+the spanning tree and are not necessarily the shortest.
+"""
+
+from array import array
+from collections import deque
+
+from maze_solver_with_python.core.grid import WallGrid
+
+
+class TreeIndex:
+    """Parent pointers, depths and binary lifting over a maze's spanning tree.
+
+    Cells are addressed by ``(col, row)`` as in
+    :meth:`Maze.find_path <maze_solver_with_python.core.models.Maze.find_path>`.
+    Every connected region gets its own tree; queries between cells of
+    different regions report no path. The index is a snapshot, so it must be
+    rebuilt after walls change.
+
+    Attributes:
+        num_cols (int): Number of columns of the indexed grid.
+        num_rows (int): Number of rows of the indexed grid.
+        parents (array): Parent of each cell by flat index; a root is its own
+            parent.
+        depths (array): Number of steps from each cell up to its root.
+        regions (array): Flat index of the root of each cell's tree.
+    """
+
+    __slots__ = ("_up", "depths", "num_cols", "num_rows", "parents", "regions")
+
+    def __init__(self, grid: WallGrid, root: int = 0) -> None:
+        """Build the index.
+
+        Args:
+            grid (WallGrid): The maze walls.
+            root (int): Flat index of the cell the main tree hangs from.
+                Cells it cannot reach are rooted at the lowest flat index of
+                their region.
+        """
+        self.num_cols = grid.num_cols
+        self.num_rows = grid.num_rows
+        size = len(grid)
+        typecode = "i" if size < 2**31 else "q"
+        parents = array(typecode, [-1]) * size
+        depths = array(typecode, [0]) * size
+        regions = array(typecode, [-1]) * size
+        open_neighbors = grid.open_neighbors
+
+        for start in (root, *range(size)):
+            if regions[start] != -1:
+                continue
+            parents[start] = start
+            regions[start] = start
+            queue = deque([start])
+            while queue:
+                idx = queue.popleft()
+                depth = depths[idx] + 1
+                for n in open_neighbors(idx):
+                    if regions[n] == -1:
+                        parents[n] = idx
+                        depths[n] = depth
+                        regions[n] = start
+                        queue.append(n)
+
+        self.parents = parents
+        self.depths = depths
+        self.regions = regions
+        # _up[k][idx] is the 2**k-th ancestor of idx, clamped at the root.
+        self._up = [parents]
+        for _ in range(1, max(depths, default=0).bit_length()):
+            prev = self._up[-1]
+            self._up.append(array(typecode, map(prev.__getitem__, prev)))
+
+    def __len__(self) -> int:
+        return len(self.parents)
+
+    def _index(self, cell: tuple[int, int]) -> int:
+        """Return the flat index of ``(col, row)``, checking bounds."""
+        i, j = cell
+        if not (0 <= i < self.num_cols and 0 <= j < self.num_rows):
+            raise IndexError("Cell out of range.")
+        return i * self.num_rows + j
+
+    def _ancestor(self, idx: int, steps: int) -> int:
+        """Return the ancestor *steps* levels above *idx*."""
+        up = self._up
+        k = 0
+        while steps:
+            if steps & 1:
+                idx = up[k][idx]
+            steps >>= 1
+            k += 1
+        return idx
+
+    def _lca(self, a: int, b: int) -> int:
+        """Return the lowest common ancestor of two cells in one region."""
+        depths = self.depths
+        if depths[a] < depths[b]:
+            a, b = b, a
+        a = self._ancestor(a, depths[a] - depths[b])
+        if a == b:
+            return a
+        for level in reversed(self._up):
+            up_a, up_b = level[a], level[b]
+            if up_a != up_b:
+                a, b = up_a, up_b
+        return self.parents[a]
+
+    def lca(self, a: tuple[int, int], b: tuple[int, int]) -> tuple[int, int] | None:
+        """Return the cell where the paths from *a* and *b* to the root meet.
+
+        Args:
+            a (tuple[int, int]): ``(col, row)`` of the first cell.
+            b (tuple[int, int]): ``(col, row)`` of the second cell.
+
+        Returns:
+            tuple[int, int] | None: ``(col, row)`` of the common ancestor, or
+            ``None`` if the cells are not connected.
+
+        Raises:
+            IndexError: If either cell is outside the grid.
+        """
+        a_idx, b_idx = self._index(a), self._index(b)
+        if self.regions[a_idx] != self.regions[b_idx]:
+            return None
+        return divmod(self._lca(a_idx, b_idx), self.num_rows)
+
+    def distance(self, start: tuple[int, int], goal: tuple[int, int]) -> int:
+        """Return the number of steps on the tree path from *start* to *goal*.
+
+        Runs in ``O(log d)`` time for a tree of depth *d*.
+
+        Args:
+            start (tuple[int, int]): ``(col, row)`` of the start cell.
+            goal (tuple[int, int]): ``(col, row)`` of the goal cell.
+
+        Returns:
+            int: The path length in moves, or ``-1`` if *goal* cannot be
+            reached from *start*.
+
+        Raises:
+            IndexError: If either cell is outside the grid.
+        """
+        a, b = self._index(start), self._index(goal)
+        if self.regions[a] != self.regions[b]:
+            return -1
+        depths = self.depths
+        return depths[a] + depths[b] - 2 * depths[self._lca(a, b)]
+
+    def path(
+        self, start: tuple[int, int], goal: tuple[int, int]
+    ) -> list[tuple[int, int]]:
+        """Return the tree path from *start* to *goal*.
+
+        Both ends climb toward the root in step, so the walk stops at their
+        meeting cell and costs ``O(path length)`` however deep the tree is.
+
+        Args:
+            start (tuple[int, int]): ``(col, row)`` of the start cell.
+            goal (tuple[int, int]): ``(col, row)`` of the goal cell.
+
+        Returns:
+            list[tuple[int, int]]: ``(col, row)`` coordinates from *start* to
+            *goal*, both included, or an empty list if they are not connected.
+
+        Raises:
+            IndexError: If either cell is outside the grid.
+        """
+        a, b = self._index(start), self._index(goal)
+        if self.regions[a] != self.regions[b]:
+            return []
+        parents, depths = self.parents, self.depths
+        head, tail = [a], [b]
+        while depths[a] > depths[b]:
+            a = parents[a]
+            head.append(a)
+        while depths[b] > depths[a]:
+            b = parents[b]
+            tail.append(b)
+        while a != b:
+            a, b = parents[a], parents[b]
+            head.append(a)
+            tail.append(b)
+        tail.pop()  # the meeting cell is already the last entry of head
+        head.extend(reversed(tail))
+        num_rows = self.num_rows
+        return [divmod(idx, num_rows) for idx in head]
@@ -0,0 +1,202 @@
+"""Unit tests for frame-budgeted animation playback."""
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from maze_solver_with_python.core.animation import AnimationScheduler
+
+
+class _FakeTimer:
+    """Stand-in for ``Tk.after`` that runs callbacks on demand."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[int, Callable[..., object], tuple[Any, ...]]] = []
+
+    def after(self, ms: int, func: Callable[..., object], *args: Any) -> str:
+        """Record a callback."""
+        self.calls.append((ms, func, args))
+        return f"after#{len(self.calls)}"
+
+    def fire(self) -> bool:
+        """Run the oldest pending callback; return whether one ran."""
+        if not self.calls:
+            return False
+        _, func, args = self.calls.pop(0)
+        func(*args)
+        return True
+
+
+def _queue_steps(scheduler: AnimationScheduler, log: list[int], count: int) -> None:
+    """Queue *count* single-operation steps that append their number to *log*."""
+    for n in range(count):
+        scheduler.push(log.append, n)
+        scheduler.end_step()
+
+
+# ---------------------------------------------------------------------------
+# Queueing
+# ---------------------------------------------------------------------------
+
+
+def test_push_defers_until_advance() -> None:
+    """Queued operations run only when their step is advanced."""
+    scheduler = AnimationScheduler()
+    log: list[int] = []
+    _queue_steps(scheduler, log, 3)
+    assert not log and scheduler.pending == 3
+
+    assert scheduler.advance() == 1
+    assert log == [0] and scheduler.pending == 2
+
+
+def test_push_captures_arguments() -> None:
+    """Arguments are bound at push time, not at playback time."""
+    scheduler = AnimationScheduler()
+    seen: list[int] = []
+    mask = 5
+    scheduler.push(seen.append, mask)
+    mask = 9
+    scheduler.drain()
+    assert seen == [5] and mask == 9
+
+
+def test_steps_group_operations() -> None:
+    """All operations of one step are applied together."""
+    scheduler = AnimationScheduler()
+    log: list[str] = []
+    scheduler.push(log.append, "a")
+    scheduler.push(log.append, "b")
+    scheduler.end_step()
+    scheduler.push(log.append, "c")
+    scheduler.end_step()
+    scheduler.advance()
+    assert log == ["a", "b"]
+
+
+def test_empty_steps_are_dropped() -> None:
+    """Ending a step with nothing queued does not add a frame."""
+    scheduler = AnimationScheduler()
+    scheduler.end_step()
+    scheduler.push(print)
+    scheduler.end_step()
+    scheduler.end_step()
+    assert scheduler.pending == 1
+
+
+def test_trailing_step_counts_as_pending() -> None:
+    """Operations without a closing end_step still play back."""
+    scheduler = AnimationScheduler()
+    log: list[int] = []
+    _queue_steps(scheduler, log, 2)
+    scheduler.push(log.append, 99)
+    assert scheduler.pending == 3
+    assert scheduler.drain() == 3
+    assert log == [0, 1, 99] and scheduler.pending == 0
+
+
+def test_instant_mode_runs_immediately() -> None:
+    """In instant mode nothing is queued."""
+    scheduler = AnimationScheduler(instant=True)
+    log: list[int] = []
+    _queue_steps(scheduler, log, 4)
+    assert log == [0, 1, 2, 3] and scheduler.pending == 0
+
+
+@pytest.mark.parametrize(
+    ("fps", "steps_per_frame", "max_frames"),
+    [(0, 1, 1), (-5, 1, 1), (30, 0, 1), (30, 1, 0)],
+    ids=str,
+)
+def test_invalid_settings(fps: float, steps_per_frame: int, max_frames: int) -> None:
+    """Non-positive rates and budgets are rejected."""
+    with pytest.raises(ValueError):
+        AnimationScheduler(fps, steps_per_frame, max_frames=max_frames)
+
+
+# ---------------------------------------------------------------------------
+# Frame budget
+# ---------------------------------------------------------------------------
+
+
+def test_budget_collapses_to_latest_state_per_target() -> None:
+    """Over budget, pending steps merge into one with the last write per key."""
+    scheduler = AnimationScheduler(steps_per_frame=2, max_frames=2)
+    state: dict[str, int] = {}
+    for n in range(4):
+        scheduler.push(state.__setitem__, "a", n)
+        scheduler.push(state.__setitem__, f"b{n % 2}", n)
+        scheduler.end_step()
+    assert scheduler.pending == 4
+    scheduler.push(state.__setitem__, "a", 4)
+    scheduler.end_step()
+    assert scheduler.pending == 1
+    assert len(scheduler._queue) == 4  # b0, b1, a, end of step
+    assert scheduler.advance() == 1
+    assert state == {"a": 4, "b0": 2, "b1": 3}
+
+
+def test_budget_keeps_the_final_canvas() -> None:
+    """A collapsed animation ends on the same walls as an unbounded one."""
+    states = []
+    for max_frames in (None, 3):
+        scheduler = AnimationScheduler(max_frames=max_frames)
+        cells: dict[tuple[int, int], int] = {}
+        for n in range(50):
+            scheduler.push(cells.__setitem__, (n % 7, n % 3), n)
+            scheduler.end_step()
+            if n % 10 == 0:
+                scheduler.advance()
+        scheduler.drain()
+        states.append(cells)
+    assert states[0] == states[1]
+
+
+def test_unbounded_scheduler_never_collapses() -> None:
+    """max_frames=None keeps every step."""
+    scheduler = AnimationScheduler(max_frames=None)
+    _queue_steps(scheduler, [], 2_000)
+    assert scheduler.pending == 2_000
+
+
+# ---------------------------------------------------------------------------
+# Playback
+# ---------------------------------------------------------------------------
+
+
+def test_play_applies_steps_per_frame() -> None:
+    """Each timer tick plays steps_per_frame steps, then a frame callback."""
+    scheduler = AnimationScheduler(fps=50, steps_per_frame=3)
+    timer = _FakeTimer()
+    log: list[int] = []
+    frames: list[list[int]] = []
+    _queue_steps(scheduler, log, 7)
+
+    scheduler.play(timer.after, lambda: frames.append(list(log)))
+    assert timer.calls[0][0] == scheduler.interval_ms == 20
+    while timer.fire():
+        pass
+    assert frames == [[0, 1, 2], [0, 1, 2, 3, 4, 5], list(range(7))]
+    assert not scheduler.playing
+
+
+def test_play_is_idempotent_and_restartable() -> None:
+    """Playing twice schedules one timer; playback restarts after idling."""
+    scheduler = AnimationScheduler()
+    timer = _FakeTimer()
+    log: list[int] = []
+
+    scheduler.play(timer.after, list)
+    assert not timer.calls  # nothing queued
+
+    _queue_steps(scheduler, log, 2)
+    scheduler.play(timer.after, list)
+    scheduler.play(timer.after, list)
+    assert len(timer.calls) == 1
+    while timer.fire():
+        pass
+
+    _queue_steps(scheduler, log, 1)
+    scheduler.play(timer.after, list)
+    assert timer.fire() and log == [0, 1, 0]
@@ -0,0 +1,166 @@
+"""Unit tests for bulk maze generation."""
+
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from maze_solver_with_python.__main__ import main, seed_range
+from maze_solver_with_python.core.batch import build, generate_batch
+from maze_solver_with_python.core.models import Maze, Point
+from maze_solver_with_python.core.storage import load_grid
+
+# ---------------------------------------------------------------------------
+# Batch API
+# ---------------------------------------------------------------------------
+
+
+def test_build_matches_single_maze() -> None:
+    """A batch result holds the same layout and path as a direct build."""
+    result = build(5, 6, 8, "dfs", "bfs")
+    maze = Maze(Point(0, 0), 6, 8, 1, 1, seed=5)
+    header, grid = load_grid(result.layout)
+    assert (header.num_cols, header.num_rows, header.seed) == (8, 6, 5)
+    assert grid.walls == maze._grid.walls
+    assert result.path == maze.find_path("bfs").path
+    assert result.generate_seconds >= 0 and result.solve_seconds >= 0
+
+
+def test_generate_batch_streams_in_seed_order() -> None:
+    """Results arrive in the order the seeds were given."""
+    seeds = [9, 2, 7, 0, 4]
+    results = list(generate_batch(seeds, 5, 5, workers=2, chunksize=2))
+    assert [result.seed for result in results] == seeds
+
+
+def test_process_pool_matches_serial_run() -> None:
+    """Worker processes produce the same bytes as an in-process run."""
+    serial = list(generate_batch(range(6), 7, 7, "kruskal", "astar", workers=1))
+    pooled = list(generate_batch(range(6), 7, 7, "kruskal", "astar", workers=2))
+    assert [r.layout for r in serial] == [r.layout for r in pooled]
+    assert [r.solution for r in serial] == [r.solution for r in pooled]
+
+
+def test_threads_match_serial_run() -> None:
+    """Threads interleaving generation produce a serial run's bytes."""
+    seeds = range(24)
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # force frequent thread switches
+    try:
+        threaded = list(
+            generate_batch(seeds, 9, 9, "wilson", "bfs", workers=8, executor="thread")
+        )
+    finally:
+        sys.setswitchinterval(interval)
+    serial = list(generate_batch(seeds, 9, 9, "wilson", "bfs", workers=1))
+    assert [r.layout for r in threaded] == [r.layout for r in serial]
+    assert [r.solution for r in threaded] == [r.solution for r in serial]
+
+
+def test_generate_batch_unknown_executor() -> None:
+    """An unknown executor name raises ValueError."""
+    with pytest.raises(ValueError, match="Unknown executor"):
+        list(generate_batch(range(2), 3, 3, executor="gpu"))
+
+
+@pytest.mark.parametrize(
+    ("generator", "solver", "message"),
+    [("nope", "bfs", "Unknown generator"), ("dfs", "nope", "Unknown solver")],
+)
+def test_generate_batch_checks_names_before_submitting(
+    generator: str, solver: str, message: str
+) -> None:
+    """Unknown names raise on the call, not later inside a worker."""
+    with pytest.raises(ValueError, match=message):
+        generate_batch(range(2), 3, 3, generator, solver)
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [
+        ({"workers": 0}, "workers"),
+        ({"workers": -2}, "workers"),
+        ({"chunksize": 0}, "chunksize"),
+    ],
+)
+def test_generate_batch_checks_sizes_before_submitting(
+    kwargs: dict[str, int], message: str
+) -> None:
+    """Non-positive worker counts and chunk sizes raise on the call."""
+    with pytest.raises(ValueError, match=message):
+        generate_batch(range(2), 3, 3, **kwargs)  # type: ignore[arg-type]
+
+
+def test_generate_batch_bounds_work_in_flight() -> None:
+    """Only a window of chunks is submitted ahead of the consumer."""
+    submitted: list[int] = []
+
+    def seeds() -> Iterator[int]:
+        for seed in range(100):
+            submitted.append(seed)
+            yield seed
+
+    results = generate_batch(seeds(), 3, 3, workers=2, chunksize=2, executor="thread")
+    first = next(results)
+    assert first.seed == 0
+    assert len(submitted) <= 2 * 2 * 2 + 2
+    assert [result.seed for result in results] == list(range(1, 100))
+
+
+# ---------------------------------------------------------------------------
+# Command line
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"), [("0:3", range(3)), ("5:8", range(5, 8)), ("4", range(4))]
+)
+def test_seed_range(text: str, expected: range) -> None:
+    """Seed ranges accept START:STOP and a bare count."""
+    assert seed_range(text) == expected
+
+
+def test_batch_command_writes_files(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """The batch sub-command writes one file and one line per seed."""
+    main(
+        [
+            "batch",
+            "2:5",
+            "--rows",
+            "4",
+            "--cols",
+            "6",
+            "--workers",
+            "1",
+            "--output",
+            str(tmp_path),
+        ]
+    )
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "2.maze",
+        "3.maze",
+        "4.maze",
+    ]
+    lines = capsys.readouterr().out.splitlines()
+    assert [line.split()[0] for line in lines] == ["seed=2", "seed=3", "seed=4"]
+
+
+@pytest.mark.parametrize("option", ["--generator", "--solver"])
+def test_batch_command_rejects_unknown_names(option: str, tmp_path: Path) -> None:
+    """An unknown name exits with a message before any output is written."""
+    with pytest.raises(SystemExit, match="Unknown"):
+        main(["batch", "3", option, "nope", "--output", str(tmp_path / "out")])
+    assert not (tmp_path / "out").exists()
+
+
+@pytest.mark.parametrize("workers", ["0", "-1"])
+def test_batch_command_rejects_non_positive_workers(
+    workers: str, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """--workers below 1 is a usage error, not a traceback."""
+    with pytest.raises(SystemExit):
+        main(["batch", "3", "--workers", workers])
+    assert "at least 1" in capsys.readouterr().err
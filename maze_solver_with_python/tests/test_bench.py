@@ -0,0 +1,174 @@
+"""Unit tests for the built-in benchmark suite."""
+
+import json
+import math
+import time
+from dataclasses import replace
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from maze_solver_with_python.__main__ import main, size_list
+from maze_solver_with_python.core.bench import (
+    FORMAT_VERSION,
+    PHASES,
+    compare,
+    dump_results,
+    format_table,
+    load_results,
+    percentile,
+    run_benchmarks,
+    run_phase,
+)
+
+# ---------------------------------------------------------------------------
+# Measurements
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(("q", "expected"), [(0, 1), (50, 3), (90, 5), (99, 5)])
+def test_percentile_nearest_rank(q: float, expected: float) -> None:
+    """Percentiles pick the nearest-rank sample."""
+    assert percentile([5, 1, 4, 2, 3], q) == expected
+
+
+@pytest.mark.parametrize("phase", PHASES)
+def test_run_phase_reports_every_field(phase: str) -> None:
+    """Each phase runs headlessly and fills in consistent numbers."""
+    result = run_phase(phase, 8, 3)
+    assert (result.phase, result.cells, result.runs) == (phase, 64, 3)
+    assert 0 < result.p50_ms <= result.p90_ms <= result.p99_ms
+    assert result.cells_per_sec > 0
+    assert result.peak_kib >= 0
+
+
+def test_run_phase_rejects_bad_arguments() -> None:
+    """Unknown phases and empty runs raise ValueError."""
+    with pytest.raises(ValueError, match="Unknown phase"):
+        run_phase("paint", 4, 1)
+    with pytest.raises(ValueError, match="repeats"):
+        run_phase("solve", 4, 0)
+
+
+def test_run_benchmarks_orders_sizes_then_phases() -> None:
+    """Results come out size by size, phases in the requested order."""
+    results = run_benchmarks([4, 6], 1, phases=["solve", "generate"])
+    assert [(r.cells, r.phase) for r in results] == [
+        (16, "solve"),
+        (16, "generate"),
+        (36, "solve"),
+        (36, "generate"),
+    ]
+    assert len(format_table(results).splitlines()) == 5
+
+
+# ---------------------------------------------------------------------------
+# Baselines
+# ---------------------------------------------------------------------------
+
+
+def test_results_round_trip(tmp_path: Path) -> None:
+    """Results written as JSON load back unchanged."""
+    results = run_benchmarks([5], 2, phases=["generate", "find_path"])
+    path = tmp_path / "bench.json"
+    dump_results(results, path)
+    assert load_results(path) == results
+
+
+def test_instant_runs_stay_standard_json(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A median below the clock resolution still gives a finite rate."""
+    monkeypatch.setattr(time, "perf_counter", lambda: 1.0)
+    result = run_phase("solve", 4, 2)
+    assert result.p50_ms == 0
+    assert math.isfinite(result.cells_per_sec)
+    path = tmp_path / "bench.json"
+    dump_results([result], path)
+
+    def reject(token: str) -> None:
+        raise AssertionError(f"non-standard JSON token {token}")
+
+    json.loads(path.read_text(), parse_constant=reject)
+
+
+def test_load_results_rejects_other_files(tmp_path: Path) -> None:
+    """A JSON file without the expected version is refused."""
+    path = tmp_path / "other.json"
+    path.write_text('{"results": []}')
+    with pytest.raises(ValueError, match="Not a benchmark"):
+        load_results(path)
+
+
+def test_load_results_rejects_malformed_entries(tmp_path: Path) -> None:
+    """A versioned file with missing or unknown fields is refused."""
+    path = tmp_path / "broken.json"
+    path.write_text(json.dumps({"version": FORMAT_VERSION, "results": [{"x": 1}]}))
+    with pytest.raises(ValueError, match="Not a benchmark"):
+        load_results(path)
+
+
+def test_compare_flags_slower_and_hungrier_results() -> None:
+    """Time and memory beyond the tolerance are reported, the rest is not."""
+    (base,) = run_benchmarks([5], 1, phases=["solve"])
+    assert compare([base], [base]) == []
+    assert compare([replace(base, p50_ms=base.p50_ms * 1.05)], [base]) == []
+    slower = replace(base, p50_ms=base.p50_ms * 2)
+    hungrier = replace(base, peak_kib=base.peak_kib * 2 + 1)
+    (message,) = compare([slower], [base])
+    assert "p50_ms" in message
+    (message,) = compare([hungrier], [base])
+    assert "peak_kib" in message
+    other_size = replace(slower, cells=100)
+    assert compare([other_size], [base]) == []
+
+
+# ---------------------------------------------------------------------------
+# Command line
+# ---------------------------------------------------------------------------
+
+
+def test_size_list() -> None:
+    """Sizes are parsed from a comma-separated list."""
+    assert size_list("50,100") == [50, 100]
+
+
+def test_bench_command_writes_and_compares(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """The bench sub-command saves a baseline and exits 1 on regressions."""
+    baseline = tmp_path / "baseline.json"
+    args = ["bench", "--sizes", "4,6", "--repeats", "2", "--phases", "solve"]
+    with pytest.raises(SystemExit) as exc:
+        main([*args, "--output", str(baseline)])
+    assert exc.value.code == 0
+    assert len(load_results(baseline)) == 2
+    assert "solve" in capsys.readouterr().out
+
+    faster = [replace(r, p50_ms=r.p50_ms / 1e6) for r in load_results(baseline)]
+    dump_results(faster, baseline)
+    with pytest.raises(SystemExit) as exc:
+        main([*args, "--compare", str(baseline)])
+    assert exc.value.code == 1
+    assert "REGRESSION solve" in capsys.readouterr().out
+
+
+def test_bench_command_rejects_zero_repeats(capsys: pytest.CaptureFixture[str]) -> None:
+    """--repeats below 1 is a usage error, not a traceback."""
+    with pytest.raises(SystemExit):
+        main(["bench", "--repeats", "0", "--sizes", "5"])
+    assert "at least 1" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("content", [None, "not json", '{"results": []}'])
+def test_bench_command_reports_bad_baselines(
+    tmp_path: Path, content: Optional[str], capsys: pytest.CaptureFixture[str]
+) -> None:
+    """A missing or foreign --compare file exits with a message before running."""
+    baseline = tmp_path / "baseline.json"
+    if content is not None:
+        baseline.write_text(content)
+    with pytest.raises(SystemExit, match="Cannot read"):
+        main(["bench", "--sizes", "4", "--phases", "solve", "--compare", str(baseline)])
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,174 @@
+"""Unit tests for the solve cache."""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from maze_solver_with_python.core.cache import SolveCache, fingerprint
+from maze_solver_with_python.core.events import EventLog
+from maze_solver_with_python.core.grid import RIGHT
+from maze_solver_with_python.core.models import Maze, Point
+from maze_solver_with_python.core.solvers import SolveResult
+
+# ---------------------------------------------------------------------------
+# fingerprint
+# ---------------------------------------------------------------------------
+
+
+def test_fingerprint_depends_on_layout_only() -> None:
+    """Equal layouts share a fingerprint; a different seed changes it."""
+    first, again, other = (
+        Maze(Point(0, 0), 8, 9, 10, 10, seed=seed).fingerprint() for seed in (3, 3, 4)
+    )
+    assert first == again
+    assert first != other
+
+
+def test_fingerprint_depends_on_start_and_goal() -> None:
+    """Moving the start or goal changes the fingerprint."""
+    maze = Maze(Point(0, 0), 8, 9, 10, 10, seed=3)
+    base = maze.fingerprint()
+    assert maze.fingerprint((1, 0)) != base
+    assert maze.fingerprint(goal=(0, 1)) != base
+    assert maze.fingerprint((0, 0), (8, 7)) == base
+
+
+def test_fingerprint_tracks_wall_edits() -> None:
+    """Editing a wall changes the fingerprint."""
+    maze = Maze(Point(0, 0), 8, 9, 10, 10, seed=3)
+    before = maze.fingerprint()
+    maze._grid.set_wall(0, RIGHT, not maze._grid.has_wall(0, RIGHT))
+    assert maze.fingerprint() != before
+
+
+def test_fingerprint_of_loaded_maze(tmp_path: Path) -> None:
+    """A memory-mapped copy has the same fingerprint as the original."""
+    maze = Maze(Point(0, 0), 8, 9, 10, 10, seed=3)
+    maze.save(tmp_path / "m.maze")
+    grid = Maze.load(tmp_path / "m.maze")._grid
+    assert fingerprint(grid, 0, len(grid) - 1) == maze.fingerprint()
+
+
+# ---------------------------------------------------------------------------
+# SolveCache
+# ---------------------------------------------------------------------------
+
+
+def test_cache_counts_hits_and_misses() -> None:
+    """get() counts a miss, then a hit once the key is stored."""
+    cache = SolveCache()
+    assert cache.get("k") is None
+    result = SolveResult([(0, 0)], 1)
+    cache.put("k", result)
+    assert cache.get("k") is result
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    """The entry untouched the longest is evicted first."""
+    cache = SolveCache(maxsize=2)
+    cache.put("a", SolveResult())
+    cache.put("b", SolveResult())
+    cache.get("a")
+    cache.put("c", SolveResult())
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert len(cache) == 2
+
+
+def test_cache_rejects_zero_size() -> None:
+    """maxsize must be positive."""
+    with pytest.raises(ValueError):
+        SolveCache(maxsize=0)
+
+
+def test_disk_tier_survives_a_new_cache(tmp_path: Path) -> None:
+    """A second cache on the same directory reads stored results back."""
+    result = SolveResult([(0, 0), (1, 0), (1, 1)], 7)
+    SolveCache(directory=tmp_path / "cache").put("k", result)
+    cache = SolveCache(directory=tmp_path / "cache")
+    assert cache.get("k") == result
+    assert cache.hits == 1
+    assert len(cache) == 1
+
+
+def test_disk_tier_ignores_damaged_files(tmp_path: Path) -> None:
+    """A truncated file counts as a miss rather than an error."""
+    (tmp_path / "k.path").write_bytes(b"\x01\x02")
+    cache = SolveCache(directory=tmp_path)
+    assert cache.get("k") is None
+    assert cache.misses == 1
+
+
+def test_threads_share_a_cache_and_its_directory(tmp_path: Path) -> None:
+    """Concurrent writers of one key leave a whole file and no temporaries."""
+    cache = SolveCache(maxsize=4, directory=tmp_path)
+    results = [SolveResult([(n, n)] * 64, n) for n in range(8)]
+
+    def write(result: SolveResult) -> None:
+        for _ in range(50):
+            cache.put("k", result)
+            cache.get(f"other{result.expanded}")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(write, results))
+    assert [p.name for p in tmp_path.iterdir()] == ["k.path"]
+    assert SolveCache(directory=tmp_path).get("k") in results
+    assert cache.misses == 400
+
+
+def test_clear_keeps_disk_files(tmp_path: Path) -> None:
+    """clear() empties memory and counters but not the directory."""
+    cache = SolveCache(directory=tmp_path)
+    cache.put("k", SolveResult([(0, 0)], 1))
+    cache.clear()
+    assert (len(cache), cache.hits, cache.misses) == (0, 0, 0)
+    assert cache.get("k") is not None
+
+
+# ---------------------------------------------------------------------------
+# Maze integration
+# ---------------------------------------------------------------------------
+
+
+def test_solve_is_idempotent() -> None:
+    """Solving twice gives the same answer without a cache."""
+    maze = Maze(Point(0, 0), 8, 9, 10, 10, seed=3)
+    assert maze.solve()
+    assert maze.solve()
+    assert maze.solve("recursive")
+
+
+def test_solve_cache_skips_the_search() -> None:
+    """A repeated solve is answered from the cache without any events."""
+    cache = SolveCache()
+    assert Maze(Point(0, 0), 8, 9, 10, 10, seed=3).solve(cache=cache)
+    maze = Maze(Point(0, 0), 8, 9, 10, 10, seed=3)
+    log = EventLog()
+    maze.subscribe(log)
+    assert maze.solve(cache=cache)
+    assert len(log) == 0
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_solve_cache_stores_the_dfs_path() -> None:
+    """The cached solve result is the path the depth-first search found."""
+    cache = SolveCache()
+    maze = Maze(Point(0, 0), 8, 9, 10, 10, seed=3)
+    maze.solve(cache=cache)
+    (result,) = cache._entries.values()
+    assert result.path[0] == (0, 0)
+    assert result.path[-1] == (maze.num_cols - 1, maze.num_rows - 1)
+    assert result.path == maze.find_path("bfs").path  # perfect maze
+    assert result.expanded >= len(result.path)
+
+
+def test_find_path_cache_is_keyed_by_solver() -> None:
+    """Each solver has its own entry; repeats return the stored result."""
+    cache = SolveCache()
+    maze = Maze(Point(0, 0), 8, 9, 10, 10, seed=3)
+    first = maze.find_path("bfs", cache=cache)
+    assert maze.find_path("bfs", cache=cache) is first
+    maze.find_path("astar", cache=cache)
+    assert (cache.hits, cache.misses, len(cache)) == (1, 2, 2)
@@ -0,0 +1,171 @@
+"""Unit tests for the headless ``maze solve`` command."""
+
+import json
+import subprocess  # nosec
+import sys
+import types
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from maze_solver_with_python.__main__ import build_parser, main
+from maze_solver_with_python.core.models import Maze, Point
+from maze_solver_with_python.core.storage import load_grid
+
+ARGS = ["solve", "--rows", "6", "--cols", "8", "--seed", "3"]
+
+# ---------------------------------------------------------------------------
+# Output formats
+# ---------------------------------------------------------------------------
+
+
+def test_solve_prints_summary(capsys: pytest.CaptureFixture[str]) -> None:
+    """Without --format or --output a one-line summary is printed."""
+    main(ARGS)
+    expected = Maze(Point(0, 0), 6, 8, 1, 1, seed=3).find_path("bfs")
+    assert capsys.readouterr().out.split() == [
+        "rows=6",
+        "cols=8",
+        "seed=3",
+        f"path={len(expected.path)}",
+        f"expanded={expected.expanded}",
+    ]
+
+
+def test_solve_json_matches_library(capsys: pytest.CaptureFixture[str]) -> None:
+    """JSON output carries the same path as Maze.find_path."""
+    main([*ARGS, "--generator", "kruskal", "--solver", "astar", "--format", "json"])
+    document = json.loads(capsys.readouterr().out)
+    maze = Maze(Point(0, 0), 6, 8, 1, 1, seed=3, generator="kruskal")
+    assert [tuple(cell) for cell in document["path"]] == maze.find_path("astar").path
+    assert (document["rows"], document["cols"], document["solver"]) == (6, 8, "astar")
+
+
+def test_solve_format_follows_output_suffix(tmp_path: Path) -> None:
+    """The output suffix picks the format when --format is omitted."""
+    main([*ARGS, "--output", str(tmp_path / "maze.png")])
+    main([*ARGS, "--output", str(tmp_path / "maze.svg")])
+    main([*ARGS, "--braid", "0.5", "--output", str(tmp_path / "maze.maze")])
+    assert (tmp_path / "maze.png").read_bytes().startswith(b"\x89PNG")
+    assert (tmp_path / "maze.svg").read_text().startswith("<svg")
+    header, grid = load_grid((tmp_path / "maze.maze").read_bytes())
+    braided = Maze(Point(0, 0), 6, 8, 1, 1, seed=3, braid=0.5)
+    assert (header.num_cols, header.num_rows, header.seed) == (8, 6, 3)
+    assert grid.walls == braided._grid.walls
+
+
+def test_solve_format_overrides_output_suffix(tmp_path: Path) -> None:
+    """--format wins over a suffix that names another format."""
+    dest = tmp_path / "maze.img"
+    main([*ARGS, "--format", "ppm", "--output", str(dest)])
+    assert dest.read_bytes().startswith(b"P6")
+
+
+def test_solve_unknown_suffix_writes_summary(tmp_path: Path) -> None:
+    """Text goes to --output when its suffix names no format."""
+    main([*ARGS, "--output", str(tmp_path / "result.txt")])
+    assert (tmp_path / "result.txt").read_text().startswith("rows=6 cols=8")
+
+
+# ---------------------------------------------------------------------------
+# Errors and defaults
+# ---------------------------------------------------------------------------
+
+
+def test_binary_format_needs_output() -> None:
+    """Image and maze formats refuse to write to stdout."""
+    with pytest.raises(SystemExit, match="needs --output"):
+        main([*ARGS, "--format", "png"])
+
+
+@pytest.mark.parametrize(
+    ("option", "value", "message"),
+    [
+        ("--generator", "prim", "Unknown generator"),
+        ("--solver", "teleport", "Unknown solver"),
+        ("--braid", "2", "braid must be between 0 and 1"),
+    ],
+)
+def test_solve_reports_invalid_options(option: str, value: str, message: str) -> None:
+    """Invalid maze options exit with the library's message."""
+    with pytest.raises(SystemExit, match=message):
+        main([*ARGS, option, value])
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [["--rows", "0"], ["--cols", "-2"], ["--rows", "many"]],
+    ids=str,
+)
+def test_solve_rejects_empty_mazes(
+    argv: list[str], capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Sizes below one are a usage error, not a traceback."""
+    with pytest.raises(SystemExit) as excinfo:
+        main(["solve", *argv])
+    assert excinfo.value.code == 2
+    assert argv[0] in capsys.readouterr().err
+
+
+def test_solve_rejects_small_scale(tmp_path: Path) -> None:
+    """A scale that leaves no room inside the walls is refused up front."""
+    dest = tmp_path / "m.png"
+    with pytest.raises(SystemExit, match="--scale must be at least 2"):
+        main([*ARGS, "--scale", "1", "--output", str(dest)])
+    assert not dest.exists()
+
+
+class _FakeWidget:
+    """Accepts any tkinter call; enough for a :class:`Window` to open."""
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        del args, kwargs
+
+    def __getattr__(self, name: str) -> Callable[..., None]:
+        return lambda *args, **kwargs: None
+
+
+@pytest.mark.parametrize(
+    ("option", "value", "message"),
+    [("--generator", "krusk", "Unknown generator"), ("--braid", "2", "braid")],
+)
+def test_gui_reports_invalid_options(
+    option: str, value: str, message: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Invalid maze options exit with the library's message, not a traceback."""
+    fake = types.SimpleNamespace(Tk=_FakeWidget, Canvas=_FakeWidget, BOTH="both")
+    monkeypatch.setitem(sys.modules, "tkinter", fake)
+    with pytest.raises(SystemExit, match=message):
+        main(["gui", option, value])
+
+
+def test_gui_defaults_match_original_window() -> None:
+    """Running ``maze`` bare still means a 10 × 14 maze of 50-pixel cells."""
+    args = build_parser().parse_args(["gui"])
+    assert (args.rows, args.cols, args.cell_size) == (10, 14, 50)
+
+
+def test_headless_run_never_imports_tkinter(tmp_path: Path) -> None:
+    """Solving and exporting from the command line leave tkinter unloaded."""
+    code = (
+        "import sys\n"
+        "from maze_solver_with_python.__main__ import main\n"
+        f"main(['solve', '--output', {str(tmp_path / 'm.png')!r}])\n"
+        "assert 'tkinter' not in sys.modules\n"
+        "assert 'concurrent.futures.process' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)  # nosec
+
+
+def test_summary_run_skips_bench_and_export() -> None:
+    """A plain solve loads neither the benchmark suite nor the exporters."""
+    code = (
+        "import sys\n"
+        "from maze_solver_with_python.__main__ import main\n"
+        "main(['solve', '--rows', '3', '--cols', '3'])\n"
+        "loaded = {'maze_solver_with_python.core.bench',\n"
+        "          'maze_solver_with_python.core.export', 'tracemalloc'}\n"
+        "assert not loaded & set(sys.modules), loaded & set(sys.modules)\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)  # nosec
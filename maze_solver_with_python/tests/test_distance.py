@@ -0,0 +1,94 @@
+"""Unit tests for distance fields and derived maze metrics."""
+
+from pathlib import Path
+
+import pytest
+
+from maze_solver_with_python.core.distance import (
+    UNREACHABLE,
+    DistanceField,
+    count_dead_ends,
+    diameter,
+)
+from maze_solver_with_python.core.grid import RIGHT, WallGrid
+from maze_solver_with_python.core.models import Maze, Point
+
+
+def test_field_matches_bfs_path_lengths() -> None:
+    """Every distance equals the length of a BFS path from the entrance."""
+    maze = Maze(Point(0, 0), 9, 12, 10, 10, seed=6)
+    field = maze.distance_field()
+    for i in range(12):
+        for j in range(9):
+            path = maze.find_path("bfs", start=(0, 0), goal=(i, j)).path
+            assert field[i, j] == len(path) - 1
+    assert field.reachable() == len(field) == 12 * 9
+
+
+def test_multi_source_takes_nearest() -> None:
+    """A multi-source field is the minimum of the single-source fields."""
+    maze = Maze(Point(0, 0), 9, 12, 10, 10, seed=6)
+    sources = [(0, 0), (11, 8), (5, 4)]
+    merged = maze.distance_field(*sources)
+    singles = [maze.distance_field(cell).values for cell in sources]
+    assert list(merged.values) == [min(column) for column in zip(*singles)]
+    assert merged.sources == tuple(maze._grid.index(*cell) for cell in sources)
+
+
+def test_farthest_and_diameter() -> None:
+    """The diameter ends are mutually farthest on a perfect maze."""
+    maze = Maze(Point(0, 0), 9, 12, 10, 10, seed=6)
+    a, b, length = maze.diameter()
+    assert maze.distance_field(a).farthest() == (b, length)
+    assert len(maze.find_path("bfs", start=a, goal=b).path) == length + 1
+    every = [
+        maze.distance_field((i, j)).farthest()[1] for i in range(12) for j in range(9)
+    ]
+    assert max(every) == length
+
+
+def test_unreachable_cells() -> None:
+    """Cells no source reaches hold UNREACHABLE."""
+    grid = WallGrid(3, 1)
+    grid.carve(0, RIGHT)
+    field = DistanceField(grid, [0])
+    assert list(field.values) == [0, 1, UNREACHABLE]
+    assert field.reachable() == 2
+    assert diameter(grid, 2) == (2, 2, 0)
+
+
+def test_field_requires_a_source() -> None:
+    """An empty source list raises ValueError."""
+    with pytest.raises(ValueError):
+        DistanceField(WallGrid(2, 2), [])
+
+
+def test_buffer_is_zero_copy() -> None:
+    """memoryview(field) shares memory with the field values."""
+    field = Maze(Point(0, 0), 9, 12, 10, 10, seed=6).distance_field()
+    view = memoryview(field)
+    assert view.format == "i"
+    assert view.tolist() == list(field.values)
+    field.values[3] = 99
+    assert view[3] == 99
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+def test_dead_end_count(backend: str) -> None:
+    """Both backends count cells with a single open neighbour."""
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+    maze = Maze(Point(0, 0), 9, 12, 10, 10, seed=6, backend=backend)
+    grid = maze._grid
+    expected = sum(len(grid.open_neighbors(idx)) == 1 for idx in range(len(grid)))
+    assert maze.dead_end_count() == expected == count_dead_ends(grid)
+    assert expected > 0
+
+
+def test_export_heatmap(tmp_path: Path) -> None:
+    """Maze.export draws a distance field as a PNG heatmap."""
+    maze = Maze(Point(0, 0), 9, 12, 10, 10, seed=6)
+    dest = tmp_path / "heat.png"
+    assert maze.export(dest, distances=maze.distance_field()) == len(dest.read_bytes())
+    with pytest.raises(ValueError, match="raster only"):
+        maze.export(tmp_path / "heat.svg", distances=maze.distance_field())
@@ -0,0 +1,140 @@
+"""Unit tests for the generation and solving event stream."""
+
+import pytest
+
+from maze_solver_with_python.core.events import (
+    BACKTRACK,
+    CELL_VISITED,
+    MOVE,
+    WALL_REMOVED,
+    EventLog,
+)
+from maze_solver_with_python.core.grid import BOTTOM, TOP, WallGrid
+from maze_solver_with_python.core.models import Maze, Point
+
+ROWS, COLS = 7, 9
+
+# ---------------------------------------------------------------------------
+# EventLog
+# ---------------------------------------------------------------------------
+
+
+def test_event_log_records_in_order() -> None:
+    """Events are replayed in the order they were recorded."""
+    log = EventLog()
+    log(MOVE, 0, 1)
+    log(BACKTRACK, 1, 0)
+    assert len(log) == 2
+    assert list(log) == [(MOVE, 0, 1), (BACKTRACK, 1, 0)]
+
+
+def test_event_log_count() -> None:
+    """count() only matches the event kind, never a payload value."""
+    log = EventLog()
+    log(CELL_VISITED, MOVE, 0)
+    log(MOVE, 3, MOVE)
+    assert log.count(MOVE) == 1
+    assert log.count(CELL_VISITED) == 1
+
+
+def test_event_log_bytes_round_trip() -> None:
+    """frombytes() restores what tobytes() wrote."""
+    log = EventLog()
+    log(WALL_REMOVED, 5, BOTTOM)
+    log(CELL_VISITED, 6, 0)
+    data = log.tobytes()
+    assert len(data) == 2 * 24
+    assert list(EventLog.frombytes(data)) == list(log)
+
+
+# ---------------------------------------------------------------------------
+# Generation events
+# ---------------------------------------------------------------------------
+
+
+def test_dfs_generation_events() -> None:
+    """DFS visits every cell once and removes one wall per tree edge."""
+    log = EventLog()
+    Maze(Point(0, 0), ROWS, COLS, 10, 10, seed=3, listeners=[log])
+    cells = ROWS * COLS
+    assert log.count(CELL_VISITED) == cells
+    # A spanning tree has cells - 1 edges, plus the entrance and exit.
+    assert log.count(WALL_REMOVED) == cells - 1 + 2
+    assert log.count(MOVE) == log.count(BACKTRACK) == 0
+
+
+def test_entrance_and_exit_come_first() -> None:
+    """The entrance and exit are reported before any passage is carved."""
+    log = EventLog()
+    Maze(Point(0, 0), ROWS, COLS, 10, 10, seed=3, listeners=[log])
+    events = list(log)
+    assert events[0] == (WALL_REMOVED, 0, TOP)
+    assert events[1] == (WALL_REMOVED, ROWS * COLS - 1, BOTTOM)
+
+
+@pytest.mark.parametrize("generator", ["kruskal", "binary_tree"])
+def test_registry_generator_reports_removed_walls(generator: str) -> None:
+    """Grid-level generators report every carved passage afterwards."""
+    log = EventLog()
+    Maze(Point(0, 0), ROWS, COLS, 10, 10, seed=3, generator=generator, listeners=[log])
+    assert log.count(WALL_REMOVED) == ROWS * COLS - 1 + 2
+
+
+def test_removed_walls_match_layout() -> None:
+    """Replaying WALL_REMOVED events on a walled grid rebuilds the layout."""
+    log = EventLog()
+    maze = Maze(Point(0, 0), ROWS, COLS, 10, 10, seed=11, listeners=[log])
+    grid = WallGrid(COLS, ROWS)
+    outer = {(0, TOP), (len(grid) - 1, BOTTOM)}
+    for kind, idx, bit in log:
+        if kind != WALL_REMOVED:
+            continue
+        if (idx, bit) in outer:
+            grid.set_wall(idx, bit, False)
+        else:
+            grid.carve(idx, bit)
+    assert bytes(grid.walls) == bytes(maze._grid.walls)
+
+
+# ---------------------------------------------------------------------------
+# Solving events
+# ---------------------------------------------------------------------------
+
+
+def test_subscribe_receives_solve_events() -> None:
+    """A listener added after generation only sees solving."""
+    maze = Maze(Point(0, 0), ROWS, COLS, 10, 10, seed=3)
+    log = EventLog()
+    maze.subscribe(log)
+    assert maze.solve()
+    assert log.count(WALL_REMOVED) == 0
+    assert log.count(MOVE) - log.count(BACKTRACK) == len(maze.find_path().path) - 1
+
+
+def test_solve_events_match_between_methods() -> None:
+    """Recursive and iterative solving emit identical event streams."""
+    logs = []
+    for method in ("recursive", "iterative"):
+        maze = Maze(Point(0, 0), ROWS, COLS, 10, 10, seed=8)
+        log = EventLog()
+        maze.subscribe(log)
+        maze.solve(method)
+        logs.append(list(log))
+    assert logs[0] == logs[1]
+
+
+def test_unsubscribe_stops_events() -> None:
+    """An unsubscribed listener receives nothing more."""
+    maze = Maze(Point(0, 0), ROWS, COLS, 10, 10, seed=3)
+    log = EventLog()
+    maze.subscribe(log)
+    maze.unsubscribe(log)
+    maze.solve()
+    assert len(log) == 0
+
+
+def test_unsubscribe_unknown_listener_raises() -> None:
+    """Unsubscribing a listener that was never added raises ValueError."""
+    maze = Maze(Point(0, 0), ROWS, COLS, 10, 10, seed=3)
+    with pytest.raises(ValueError):
+        maze.unsubscribe(EventLog())
@@ -0,0 +1,290 @@
+"""Unit tests for image export."""
+
+import io
+import re
+import struct
+import zlib
+from pathlib import Path
+from xml.etree import ElementTree
+
+import pytest
+
+from maze_solver_with_python.core.export import (
+    BACKGROUND,
+    DEFAULT_PALETTE,
+    HEAT_LEVELS,
+    PATH,
+    WALL,
+    Raster,
+    encode_png,
+    encode_ppm,
+    export_image,
+    heat_palette,
+    rasterize,
+    rasterize_distances,
+    wall_runs,
+    write_svg,
+)
+from maze_solver_with_python.core.grid import BOTTOM, LEFT, RIGHT, TOP, WallGrid
+from maze_solver_with_python.core.models import Maze, Point
+
+
+def _pixel(raster: Raster, x: int, y: int) -> int:
+    return raster.pixels[y * raster.width + x]
+
+
+def _png_chunks(data: bytes) -> dict[bytes, bytes]:
+    chunks = {}
+    pos = 8
+    while pos < len(data):
+        (length,) = struct.unpack(">I", data[pos : pos + 4])
+        kind = data[pos + 4 : pos + 8]
+        body = data[pos + 8 : pos + 8 + length]
+        (crc,) = struct.unpack(">I", data[pos + 8 + length : pos + 12 + length])
+        assert crc == zlib.crc32(kind + body)
+        chunks[kind] = body
+        pos += 12 + length
+    return chunks
+
+
+# ---------------------------------------------------------------------------
+# rasterize
+# ---------------------------------------------------------------------------
+
+
+def test_raster_size() -> None:
+    """The image covers every cell plus the closing wall and margins."""
+    raster = rasterize(WallGrid(5, 3), scale=6, wall=2, margin=3)
+    assert (raster.width, raster.height) == (5 * 6 + 2 + 6, 3 * 6 + 2 + 6)
+    assert len(raster.pixels) == raster.width * raster.height
+
+
+def test_walled_cell_pixels() -> None:
+    """A closed cell has wall pixels on its edges and background inside."""
+    raster = rasterize(WallGrid(1, 1), scale=4, wall=1)
+    for k in range(5):
+        assert _pixel(raster, k, 0) == WALL
+        assert _pixel(raster, k, 4) == WALL
+        assert _pixel(raster, 0, k) == WALL
+        assert _pixel(raster, 4, k) == WALL
+    assert _pixel(raster, 2, 2) == BACKGROUND
+
+
+def test_removed_walls_are_background() -> None:
+    """Opened walls leave a gap between their posts."""
+    grid = WallGrid(2, 1)
+    grid.carve(0, RIGHT)
+    grid.set_wall(0, TOP, False)
+    raster = rasterize(grid, scale=4, wall=1)
+    assert _pixel(raster, 4, 2) == BACKGROUND
+    assert _pixel(raster, 4, 0) == WALL  # the post stays
+    assert _pixel(raster, 2, 0) == BACKGROUND
+    assert _pixel(raster, 6, 0) == WALL
+
+
+def test_margin_is_background() -> None:
+    """The border around the maze is left blank."""
+    raster = rasterize(WallGrid(2, 2), scale=4, wall=1, margin=2)
+    assert set(raster.pixels[: 2 * raster.width]) == {BACKGROUND}
+    assert _pixel(raster, 0, 5) == BACKGROUND
+    assert _pixel(raster, 2, 5) == WALL
+
+
+def test_path_is_drawn_through_cell_centres() -> None:
+    """A path paints the centres of its cells and the link between them."""
+    maze = Maze(Point(0, 0), 4, 4, 1, 1, seed=2)
+    path = maze.find_path().path
+    raster = rasterize(maze._grid, path, scale=7, wall=1)
+    for col, row in path:
+        assert _pixel(raster, col * 7 + 4, row * 7 + 4) == PATH
+    assert raster.pixels.count(PATH) > 0
+    assert rasterize(maze._grid, scale=7, wall=1).pixels.count(PATH) == 0
+
+
+@pytest.mark.parametrize(
+    ("scale", "wall", "margin"), [(1, 1, 0), (4, 0, 0), (4, 1, -1)]
+)
+def test_invalid_geometry_raises(scale: int, wall: int, margin: int) -> None:
+    """Walls must be thinner than a cell and the margin non-negative."""
+    with pytest.raises(ValueError):
+        rasterize(WallGrid(2, 2), scale=scale, wall=wall, margin=margin)
+
+
+# ---------------------------------------------------------------------------
+# Encoders
+# ---------------------------------------------------------------------------
+
+
+def test_png_decodes_to_raster() -> None:
+    """The PNG holds the raster's size, palette and pixels."""
+    maze = Maze(Point(0, 0), 5, 6, 1, 1, seed=4)
+    raster = rasterize(maze._grid, maze.find_path().path, scale=5, wall=1)
+    data = encode_png(raster)
+    assert data.startswith(b"\x89PNG\r\n\x1a\n")
+    chunks = _png_chunks(data)
+    width, height, depth, color_type = struct.unpack(">IIBB", chunks[b"IHDR"][:10])
+    assert (width, height, depth, color_type) == (raster.width, raster.height, 8, 3)
+    assert chunks[b"PLTE"] == bytes(c for color in DEFAULT_PALETTE for c in color)
+    rows = zlib.decompress(chunks[b"IDAT"])
+    stride = width + 1
+    assert all(rows[y * stride] == 0 for y in range(height))
+    pixels = b"".join(rows[y * stride + 1 : (y + 1) * stride] for y in range(height))
+    assert pixels == raster.pixels
+
+
+def test_ppm_expands_palette() -> None:
+    """The PPM holds one RGB triple per pixel."""
+    raster = rasterize(WallGrid(2, 2), scale=4, wall=1)
+    data = encode_ppm(raster)
+    header = b"P6\n9 9\n255\n"
+    assert data.startswith(header)
+    body = data[len(header) :]
+    assert len(body) == 3 * 81
+    assert body[:3] == bytes(DEFAULT_PALETTE[WALL])
+    centre = 3 * (2 * 9 + 2)
+    assert body[centre : centre + 3] == bytes(DEFAULT_PALETTE[BACKGROUND])
+
+
+# ---------------------------------------------------------------------------
+# SVG
+# ---------------------------------------------------------------------------
+
+
+def test_wall_runs_merge_collinear_walls() -> None:
+    """A closed grid's walls merge into one run per grid line."""
+    runs = set(wall_runs(WallGrid(3, 2)))
+    assert runs == {
+        (0, 0, 3, 0),
+        (0, 1, 3, 1),
+        (0, 2, 3, 2),
+        (0, 0, 0, 2),
+        (1, 0, 1, 2),
+        (2, 0, 2, 2),
+        (3, 0, 3, 2),
+    }
+
+
+def test_wall_runs_cover_every_wall_once() -> None:
+    """Splitting the runs back into unit walls gives each wall exactly once."""
+    maze = Maze(Point(0, 0), 6, 8, 1, 1, seed=5)
+    grid = maze._grid
+    units = []
+    for x1, y1, x2, y2 in wall_runs(grid):
+        assert x1 == x2 or y1 == y2
+        units += [(x, y1, x + 1, y1) for x in range(x1, x2)]
+        units += [(x1, y, x1, y + 1) for y in range(y1, y2)]
+    expected = set()
+    for idx, mask in enumerate(grid.walls):
+        i, j = divmod(idx, grid.num_rows)
+        if mask & TOP:
+            expected.add((i, j, i + 1, j))
+        if mask & BOTTOM:
+            expected.add((i, j + 1, i + 1, j + 1))
+        if mask & LEFT:
+            expected.add((i, j, i, j + 1))
+        if mask & RIGHT:
+            expected.add((i + 1, j, i + 1, j + 1))
+    assert len(units) == len(set(units))
+    assert set(units) == expected
+
+
+def test_svg_is_well_formed() -> None:
+    """The SVG parses, sizes like the raster and moves once per wall run."""
+    maze = Maze(Point(0, 0), 4, 5, 1, 1, seed=1)
+    out = io.StringIO()
+    written = write_svg(maze._grid, out, scale=6, wall=2, margin=3)
+    text = out.getvalue()
+    assert written == len(text)
+    root = ElementTree.fromstring(text)
+    raster = rasterize(maze._grid, scale=6, wall=2, margin=3)
+    assert root.get("width") == str(raster.width)
+    assert root.get("height") == str(raster.height)
+    moves = re.findall(r"M", text)
+    assert len(moves) == sum(1 for _ in wall_runs(maze._grid))
+    assert "polyline" not in text
+
+
+def test_svg_path_overlay_uses_corners() -> None:
+    """The solution is one polyline through the cell centres where it turns."""
+    grid = WallGrid(3, 1)
+    out = io.StringIO()
+    write_svg(grid, out, path=[(0, 0), (1, 0), (2, 0)])
+    root = ElementTree.fromstring(out.getvalue())
+    (line,) = root.iter("{http://www.w3.org/2000/svg}polyline")
+    assert line.get("points") == "0.5,0.5 2.5,0.5"
+
+
+def test_svg_invalid_geometry_raises() -> None:
+    """write_svg validates its geometry like rasterize."""
+    with pytest.raises(ValueError):
+        write_svg(WallGrid(2, 2), io.StringIO(), scale=2, wall=2)
+
+
+# ---------------------------------------------------------------------------
+# export_image and Maze.export
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("suffix", [".png", ".ppm", ".svg", ".PNG"])
+def test_export_image_format_from_suffix(tmp_path: Path, suffix: str) -> None:
+    """The file suffix picks the encoder."""
+    dest = tmp_path / f"maze{suffix}"
+    written = export_image(WallGrid(3, 3), dest)
+    data = dest.read_bytes()
+    assert written == len(data)
+    assert data[:2] == {".ppm": b"P6", ".svg": b"<s"}.get(suffix, b"\x89P")
+
+
+def test_export_image_unknown_format(tmp_path: Path) -> None:
+    """Unsupported formats raise ValueError without writing anything."""
+    dest = tmp_path / "maze.gif"
+    with pytest.raises(ValueError):
+        export_image(WallGrid(3, 3), dest)
+    assert not dest.exists()
+
+
+def test_maze_export(tmp_path: Path) -> None:
+    """Maze.export draws the solution unless solver is None."""
+    maze = Maze(Point(0, 0), 6, 6, 1, 1, seed=9)
+    maze.export(tmp_path / "solved.ppm")
+    maze.export(tmp_path / "plain.ppm", solver=None)
+    red = bytes(DEFAULT_PALETTE[PATH])
+    assert red in (tmp_path / "solved.ppm").read_bytes()
+    assert red not in (tmp_path / "plain.ppm").read_bytes()
+
+
+def test_export_loaded_maze(tmp_path: Path) -> None:
+    """Memory-mapped mazes export the same image as the original."""
+    maze = Maze(Point(0, 0), 7, 5, 1, 1, seed=3)
+    maze.save(tmp_path / "m.maze")
+    loaded = Maze.load(tmp_path / "m.maze")
+    assert rasterize(loaded._grid) == rasterize(maze._grid)
+
+
+# ---------------------------------------------------------------------------
+# Distance heatmaps
+# ---------------------------------------------------------------------------
+
+
+def test_heatmap_fills_cells_by_distance() -> None:
+    """Cell interiors take a gradient colour; walls match rasterize()."""
+    grid = WallGrid(3, 1)
+    grid.carve(0, RIGHT)
+    raster = rasterize_distances(grid, [0, 1, -1], scale=4, wall=1)
+    plain = rasterize(grid, scale=4, wall=1)
+    assert (raster.width, raster.height) == (plain.width, plain.height)
+    assert raster.palette == heat_palette()
+    assert len(raster.palette) == 3 + HEAT_LEVELS
+    assert _pixel(raster, 2, 2) == 3
+    assert _pixel(raster, 6, 2) == 3 + HEAT_LEVELS - 1
+    assert _pixel(raster, 10, 2) == BACKGROUND
+    assert _pixel(raster, 4, 2) == 3 + HEAT_LEVELS - 1  # open wall takes a fill
+    assert _pixel(raster, 8, 2) == WALL
+    for x in range(raster.width):
+        assert (_pixel(raster, x, 0) == WALL) == (_pixel(plain, x, 0) == WALL)
+
+
+def test_heatmap_rejects_wrong_length() -> None:
+    """rasterize_distances needs one distance per cell."""
+    with pytest.raises(ValueError):
+        rasterize_distances(WallGrid(2, 2), [0, 1, 2])
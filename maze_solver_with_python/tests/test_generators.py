@@ -0,0 +1,138 @@
+"""Unit tests for the pluggable maze generators."""
+
+import random
+from collections import deque
+
+import pytest
+
+from maze_solver_with_python.core.events import WALL_REMOVED, EventLog
+from maze_solver_with_python.core.generators import GENERATORS, stream_eller
+from maze_solver_with_python.core.grid import BOTTOM, TOP, WallGrid
+from maze_solver_with_python.core.models import Maze, Point
+
+ALL_GENERATORS = ["dfs", *GENERATORS]
+
+
+def _reachable(grid: WallGrid) -> int:
+    """Count the cells reachable from cell 0 through open walls."""
+    seen = {0}
+    queue = deque([0])
+    while queue:
+        for n in grid.open_neighbors(queue.popleft()):
+            if n not in seen:
+                seen.add(n)
+                queue.append(n)
+    return len(seen)
+
+
+@pytest.mark.parametrize("generator", ALL_GENERATORS)
+def test_generator_builds_perfect_maze(generator: str) -> None:
+    """Every cell is reachable and there are exactly cells - 1 passages."""
+    m = Maze(Point(0, 0), 9, 13, 10, 10, seed=3, generator=generator)
+    grid = m._grid
+    # Each passage is counted once from either end.
+    passages = sum(len(grid.open_neighbors(idx)) for idx in range(len(grid)))
+    assert passages == 2 * (len(grid) - 1)
+    assert _reachable(grid) == len(grid)
+
+
+@pytest.mark.parametrize("generator", ALL_GENERATORS)
+def test_generator_keeps_walls_consistent(generator: str) -> None:
+    """Both sides of every interior wall agree."""
+    grid = Maze(Point(0, 0), 9, 13, 10, 10, seed=3, generator=generator)._grid
+    for idx in range(len(grid)):
+        for n in grid.open_neighbors(idx):
+            assert idx in grid.open_neighbors(n)
+
+
+@pytest.mark.parametrize("generator", ALL_GENERATORS)
+def test_generator_keeps_entrance_and_exit(generator: str) -> None:
+    """The entrance and exit openings survive generation."""
+    m = Maze(Point(0, 0), 9, 13, 10, 10, seed=3, generator=generator)
+    assert m._grid.has_wall(0, TOP) is False
+    assert m._grid.has_wall(len(m._grid) - 1, BOTTOM) is False
+
+
+@pytest.mark.parametrize("generator", ALL_GENERATORS)
+def test_generator_honours_seed(generator: str) -> None:
+    """The same seed gives the same layout; a different one usually does not."""
+    first, again, other = (
+        Maze(Point(0, 0), 9, 13, 10, 10, seed=seed, generator=generator)._grid.walls
+        for seed in (11, 11, 12)
+    )
+    assert first == again
+    assert first != other
+
+
+@pytest.mark.parametrize("generator", ALL_GENERATORS)
+def test_generator_degenerate_grids(generator: str) -> None:
+    """Single-row and single-column grids are carved into corridors."""
+    for rows, cols in ((1, 6), (6, 1), (1, 1)):
+        m = Maze(Point(0, 0), rows, cols, 10, 10, seed=3, generator=generator)
+        assert _reachable(m._grid) == rows * cols
+
+
+def test_stream_eller_matches_in_memory_eller() -> None:
+    """Streamed rows equal the rows of the same seeded in-memory maze."""
+    m = Maze(Point(0, 0), 9, 13, 10, 10, seed=21, generator="eller")
+    rows = stream_eller(m.num_cols, m.num_rows, random.Random(21))
+    for j, row in enumerate(rows):
+        assert list(row) == [m._grid.walls[m._grid.index(i, j)] for i in range(13)]
+
+
+def test_maze_unknown_generator() -> None:
+    """Maze raises ValueError for unknown generators."""
+    with pytest.raises(ValueError, match="Unknown generator"):
+        Maze(Point(0, 0), 9, 13, 10, 10, seed=3, generator="teleport")
+
+
+# ---------------------------------------------------------------------------
+# Braiding
+# ---------------------------------------------------------------------------
+
+
+def _passages(grid: WallGrid) -> int:
+    """Count open interior walls."""
+    return sum(len(grid.open_neighbors(idx)) for idx in range(len(grid))) // 2
+
+
+@pytest.mark.parametrize("generator", ["dfs", "kruskal"])
+def test_full_braid_removes_every_dead_end(generator: str) -> None:
+    """braid=1 leaves no dead ends; each opened wall adds one loop."""
+    log = EventLog()
+    m = Maze(Point(0, 0), 9, 13, 10, 10, seed=3, generator=generator, braid=1.0)
+    assert m.dead_end_count() == 0
+    assert _reachable(m._grid) == len(m._grid)
+    perfect = Maze(Point(0, 0), 9, 13, 10, 10, seed=3, generator=generator)
+    opened = _passages(m._grid) - _passages(perfect._grid)
+    assert opened > 0
+    m2 = Maze(
+        Point(0, 0),
+        9,
+        13,
+        10,
+        10,
+        seed=3,
+        generator=generator,
+        braid=1.0,
+        listeners=[log],
+    )
+    assert m2._grid.walls == m._grid.walls
+    assert log.count(WALL_REMOVED) == len(m._grid) - 1 + 2 + opened
+
+
+def test_partial_braid_is_between() -> None:
+    """A partial braid keeps some dead ends and is reproducible."""
+    perfect = Maze(
+        Point(0, 0), 9, 13, 10, 10, seed=3, generator="kruskal"
+    ).dead_end_count()
+    half = Maze(Point(0, 0), 9, 13, 10, 10, seed=3, generator="kruskal", braid=0.5)
+    assert 0 < half.dead_end_count() < perfect
+    again = Maze(Point(0, 0), 9, 13, 10, 10, seed=3, generator="kruskal", braid=0.5)
+    assert again._grid.walls == half._grid.walls
+
+
+def test_braid_out_of_range() -> None:
+    """braid outside [0, 1] raises ValueError."""
+    with pytest.raises(ValueError, match="braid"):
+        Maze(Point(0, 0), 3, 3, 10, 10, braid=1.5)
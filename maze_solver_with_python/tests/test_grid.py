@@ -0,0 +1,107 @@
+"""Unit tests for compact grid storage."""
+
+import pytest
+
+from maze_solver_with_python.core.grid import (
+    ALL_WALLS,
+    BOTTOM,
+    LEFT,
+    RIGHT,
+    TOP,
+    WallConfigs,
+    WallGrid,
+)
+
+# ---------------------------------------------------------------------------
+# WallGrid
+# ---------------------------------------------------------------------------
+
+
+def test_wall_grid_starts_fully_walled() -> None:
+    """Every cell starts with all four walls and unvisited."""
+    grid = WallGrid(3, 4)
+    assert len(grid) == 12
+    assert grid.walls == bytearray([ALL_WALLS]) * 12
+    assert not any(grid.is_visited(idx) for idx in range(12))
+
+
+def test_wall_grid_index_is_column_major() -> None:
+    """index(i, j) is i * num_rows + j."""
+    grid = WallGrid(3, 4)
+    assert grid.index(0, 0) == 0
+    assert grid.index(0, 3) == 3
+    assert grid.index(2, 1) == 9
+
+
+def test_wall_grid_cell_index_checks_bounds() -> None:
+    """cell_index matches index inside the grid and rejects cells outside."""
+    grid = WallGrid(3, 4)
+    assert grid.cell_index(2, 1) == grid.index(2, 1)
+    for i, j in ((0, 4), (3, 0), (-1, 0), (0, -1)):
+        with pytest.raises(IndexError, match="outside the maze"):
+            grid.cell_index(i, j)
+
+
+def test_wall_grid_set_wall() -> None:
+    """set_wall toggles a single bit of a single cell."""
+    grid = WallGrid(2, 2)
+    grid.set_wall(1, TOP, False)
+    assert grid.has_wall(1, TOP) is False
+    assert grid.has_wall(1, BOTTOM) is True
+    assert grid.has_wall(0, TOP) is True
+    grid.set_wall(1, TOP, True)
+    assert grid.walls[1] == ALL_WALLS
+
+
+def test_wall_grid_visited_bitset() -> None:
+    """Visited flags are packed eight to a byte and reset together."""
+    grid = WallGrid(5, 5)
+    assert len(grid.visited) == 4
+    grid.set_visited(0)
+    grid.set_visited(9)
+    grid.set_visited(24)
+    assert [idx for idx in range(25) if grid.is_visited(idx)] == [0, 9, 24]
+    grid.set_visited(9, False)
+    assert grid.is_visited(9) is False
+    grid.reset_visited()
+    assert grid.visited == bytearray(4)
+
+
+def test_set_shared_wall_updates_both_sides() -> None:
+    """A shared wall is added and removed on both cells."""
+    grid = WallGrid(2, 2)
+    assert grid.set_shared_wall(0, RIGHT, False) == 2
+    assert not grid.has_wall(0, RIGHT) and not grid.has_wall(2, LEFT)
+    grid.set_shared_wall(2, LEFT, True)
+    assert grid.walls[0] == grid.walls[2] == ALL_WALLS
+
+
+def test_is_interior() -> None:
+    """Only walls between two cells are interior."""
+    grid = WallGrid(2, 2)
+    assert grid.is_interior(0, RIGHT) and grid.is_interior(0, BOTTOM)
+    assert not grid.is_interior(0, TOP) and not grid.is_interior(0, LEFT)
+    assert not grid.is_interior(3, RIGHT) and not grid.is_interior(3, BOTTOM)
+
+
+# ---------------------------------------------------------------------------
+# WallConfigs
+# ---------------------------------------------------------------------------
+
+
+def test_wall_configs_writes_through() -> None:
+    """Assigning through the view updates the grid's wall mask."""
+    grid = WallGrid(1, 2)
+    configs = WallConfigs(grid, 1)
+    configs["left"] = False
+    assert grid.walls[1] == ALL_WALLS & ~LEFT
+    assert configs == {"left": False, "right": True, "top": True, "bottom": True}
+
+
+def test_wall_configs_rejects_unknown_and_delete() -> None:
+    """Unknown keys raise KeyError and walls cannot be deleted."""
+    configs = WallConfigs(WallGrid(1, 1), 0)
+    with pytest.raises(KeyError):
+        configs["diagonal"] = False
+    with pytest.raises(TypeError):
+        del configs["top"]
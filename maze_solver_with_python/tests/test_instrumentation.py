@@ -0,0 +1,218 @@
+"""Unit tests for per-phase maze instrumentation."""
+
+import sys
+import tracemalloc
+import types
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from maze_solver_with_python.core.animation import AnimationScheduler
+from maze_solver_with_python.core.bench import _NullWindow
+from maze_solver_with_python.core.events import BACKTRACK, CELL_VISITED, MOVE, EventLog
+from maze_solver_with_python.core.instrumentation import Instrumentation
+from maze_solver_with_python.core.models import Maze, Point, Window
+
+ROWS, COLS = 7, 9
+CELLS = ROWS * COLS
+
+
+def build(**kwargs: object) -> Maze:
+    """Return a seeded maze built with *kwargs*."""
+    return Maze(Point(0, 0), ROWS, COLS, 10, 10, seed=3, **kwargs)  # type: ignore[arg-type]
+
+
+# ---------------------------------------------------------------------------
+# Phases
+# ---------------------------------------------------------------------------
+
+
+def test_construction_phases_are_timed_in_order() -> None:
+    """Every construction step runs once, as its own phase."""
+    instrumentation = Instrumentation()
+    build(instrumentation=instrumentation, braid=0.5)
+    assert list(instrumentation.phases) == [
+        "create_cells",
+        "entrance_exit",
+        "generate",
+        "braid",
+        "reset_visited",
+    ]
+    for stats in instrumentation.phases.values():
+        assert stats.calls == 1
+        assert stats.seconds >= 0
+        assert stats.profile is None
+        assert stats.peak_kib == 0
+
+
+def test_solving_phases_accumulate() -> None:
+    """Repeated solves add calls to the same phase."""
+    instrumentation = Instrumentation()
+    maze = build(instrumentation=instrumentation)
+    maze.solve()
+    maze.solve()
+    maze.find_path("astar")
+    assert instrumentation.phases["solve"].calls == 2
+    assert instrumentation.phases["find_path"].calls == 1
+
+
+def test_adopted_grid_is_one_draw_phase() -> None:
+    """Wrapping an existing grid only runs the draw phase."""
+    instrumentation = Instrumentation()
+    grid = build()._grid
+    Maze(Point(0, 0), ROWS, COLS, 10, 10, grid=grid, instrumentation=instrumentation)
+    assert list(instrumentation.phases) == ["draw"]
+
+
+def test_instrumentation_does_not_change_layout() -> None:
+    """An instrumented maze carves and solves exactly like a plain one."""
+    plain, instrumented = build(), build(instrumentation=Instrumentation())
+    assert plain._grid.walls == instrumented._grid.walls
+    assert plain.solve() == instrumented.solve()
+
+
+def test_nested_phases_profile_only_outermost() -> None:
+    """An inner phase does not try to start a second profiler."""
+    instrumentation = Instrumentation(profile=True)
+    with instrumentation.phase("outer"):
+        with instrumentation.phase("inner"):
+            pass
+    assert instrumentation.phases["outer"].profile is not None
+    assert instrumentation.phases["inner"].profile is None
+    assert instrumentation.phases["inner"].calls == 1
+
+
+# ---------------------------------------------------------------------------
+# Counters
+# ---------------------------------------------------------------------------
+
+
+def test_counters_match_event_stream() -> None:
+    """Counters agree with a full event log of the same run."""
+    instrumentation, log = Instrumentation(), EventLog()
+    maze = build(instrumentation=instrumentation, listeners=[log])
+    maze.solve()
+    assert instrumentation.walls_removed == CELLS + 1  # tree edges + 2 openings
+    assert instrumentation.cells_visited == log.count(CELL_VISITED)
+    assert instrumentation.moves == log.count(MOVE)
+    assert instrumentation.backtracks == log.count(BACKTRACK)
+    assert instrumentation.moves - instrumentation.backtracks > 0
+    maze.toggle_wall((0, 0), "right")
+    assert instrumentation.walls_added + instrumentation.walls_removed == (CELLS + 2)
+
+
+def test_draws_counted_only_with_window() -> None:
+    """Headless mazes draw nothing; windowed ones count every draw."""
+    headless = Instrumentation()
+    build(instrumentation=headless).solve()
+    assert headless.draws == 0
+
+    windowed = Instrumentation()
+    maze = build(instrumentation=windowed, win=_NullWindow())
+    # The initial draw, then both cells of every removed interior wall and one
+    # cell per opening.
+    assert windowed.draws == CELLS + 2 * (CELLS - 1) + 2
+    maze.solve()
+    assert windowed.draws == CELLS + 2 * (CELLS - 1) + 2 + (
+        windowed.moves + windowed.backtracks
+    )
+
+
+class _FakeTk:
+    """Just enough of ``tkinter.Tk`` for a :class:`Window`; timers queue up."""
+
+    def __init__(self) -> None:
+        self.timers: list[tuple[Callable[..., object], tuple[Any, ...]]] = []
+
+    def after(self, ms: int, func: Callable[..., object], *args: Any) -> str:
+        """Queue a timer callback."""
+        del ms
+        self.timers.append((func, args))
+        return "after#1"
+
+    def __getattr__(self, name: str) -> Callable[..., None]:
+        return lambda *args, **kwargs: None
+
+
+class _FakeCanvas:
+    """Just enough of ``tkinter.Canvas`` for a :class:`Window`."""
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        self.lines = 0
+
+    def create_line(self, *args: object, **kwargs: object) -> int:
+        """Count a new line item."""
+        self.lines += 1
+        return self.lines
+
+    def __getattr__(self, name: str) -> Callable[..., None]:
+        return lambda *args, **kwargs: None
+
+
+def test_window_times_frames_and_flushes_as_render(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Each played frame and each redraw flush is one render call."""
+    root = _FakeTk()
+    fake = types.SimpleNamespace(Tk=lambda: root, Canvas=_FakeCanvas, BOTH="both")
+    monkeypatch.setitem(sys.modules, "tkinter", fake)
+    instrumentation = Instrumentation()
+    win = Window(100, 100, AnimationScheduler(max_frames=None), instrumentation)
+    build(instrumentation=instrumentation, win=win)
+    assert "render" not in instrumentation.phases
+
+    frames = 0
+    while root.timers:
+        func, args = root.timers.pop(0)
+        func(*args)
+        frames += 1
+    win.redraw()
+    assert frames > 0
+    assert instrumentation.phases["render"].calls == frames + 1
+
+
+# ---------------------------------------------------------------------------
+# Capture
+# ---------------------------------------------------------------------------
+
+
+def test_profile_captures_each_phase() -> None:
+    """Profiling keeps one profile per phase and lists it in the report."""
+    instrumentation = Instrumentation(profile=True)
+    build(instrumentation=instrumentation).find_path("bfs")
+    assert all(s.profile is not None for s in instrumentation.phases.values())
+    report = instrumentation.report(top=2)
+    assert "── generate ──" in report
+    assert "bfs" in report
+
+
+def test_trace_memory_records_peaks() -> None:
+    """Memory tracing records a peak per phase and leaves tracing off."""
+    instrumentation = Instrumentation(trace_memory=True)
+    build(instrumentation=instrumentation)
+    assert instrumentation.phases["create_cells"].peak_kib > 0
+    assert not tracemalloc.is_tracing()
+
+
+def test_trace_memory_keeps_existing_trace_running() -> None:
+    """A trace started by the caller is reused, not stopped."""
+    tracemalloc.start()
+    try:
+        instrumentation = Instrumentation(trace_memory=True)
+        with instrumentation.phase("alloc"):
+            block = bytearray(256 * 1024)
+        assert instrumentation.phases["alloc"].peak_kib >= 256
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+    del block
+
+
+def test_report_lists_phases_and_counters() -> None:
+    """The report has a row per phase and per counter."""
+    instrumentation = Instrumentation()
+    build(instrumentation=instrumentation).solve()
+    report = instrumentation.report()
+    for name in ("create_cells", "generate", "solve", "backtracks", "draws"):
+        assert name in report
@@ -1,8 +1,12 @@
 """Unit tests for maze models."""
 
+import dataclasses
+import random
+
 import pytest
 
-from maze_solver_with_python.core.models import Cell, Maze, Point
+from maze_solver_with_python.core.grid import WallGrid
+from maze_solver_with_python.core.models import Cell, Line, Maze, Point
 
 # ---------------------------------------------------------------------------
 # Point
@@ -16,6 +20,17 @@ def test_point_attributes() -> None:
     assert p.y == 7
 
 
+def test_point_and_line_are_immutable_values() -> None:
+    """Points and lines compare by value, hash, and reject assignment."""
+    assert Point(1, 2) == Point(1, 2)
+    assert len({Point(1, 2), Point(1, 2), Point(2, 1)}) == 2
+    assert Line(Point(0, 0), Point(1, 1)) == Line(Point(0, 0), Point(1, 1))
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        Point(1, 2).x = 5  # type: ignore[misc]
+    assert not hasattr(Point(1, 2), "__dict__")
+    assert not hasattr(Line(Point(0, 0), Point(1, 1)), "__dict__")
+
+
 # ---------------------------------------------------------------------------
 # Cell
 # ---------------------------------------------------------------------------
@@ -58,6 +73,21 @@ def test_cell_center_odd() -> None:
     assert c.y == 7
 
 
+def test_cell_bounds_with_grid_index() -> None:
+    """A standalone view into a larger grid keeps the corners it was given."""
+    cell = Cell(Point(35, 60), Point(45, 80), grid=WallGrid(4, 3), index=7)
+    assert cell.bounds == (35, 60, 45, 80)
+    assert cell.center == Point(40, 70)
+
+
+def test_maze_cell_bounds_follow_layout() -> None:
+    """Maze cells derive their box from the shared layout and their index."""
+    m = Maze(Point(5, 8), num_rows=3, num_cols=4, cell_size_x=10, cell_size_y=20)
+    assert m._cells[2][1].bounds == (25, 28, 35, 48)
+    assert m._cells[-1][-1].center == Point(40, 58)
+    assert m._cells[0][0]._geometry is m._cells[3][2]._geometry
+
+
 def test_cell_repr() -> None:
     """__repr__ includes the corner coordinates."""
     cell = Cell(Point(5, 10), Point(25, 30))
@@ -84,6 +114,27 @@ def test_maze_square_grid() -> None:
     assert len(m._cells[0]) == 4
 
 
+def test_maze_cells_are_views_onto_grid() -> None:
+    """_cells[i][j] reads and writes the maze's compact grid storage."""
+    m = Maze(Point(0, 0), num_rows=3, num_cols=4, cell_size_x=10, cell_size_y=10)
+    cell = m._cells[2][1]
+    cell.configs["right"] = True
+    cell.visited = True
+    assert m._cells[2][1].configs["right"] is True
+    assert m._grid.is_visited(m._grid.index(2, 1))
+    assert m._cells[-1][-1] == m._cells[3][2]
+    assert m._cells[0][0] != m._cells[0][1]
+
+
+def test_maze_cells_index_out_of_range() -> None:
+    """Out-of-range cell access raises IndexError."""
+    m = Maze(Point(0, 0), num_rows=2, num_cols=2, cell_size_x=10, cell_size_y=10)
+    with pytest.raises(IndexError):
+        m._cells[2]  # pylint: disable=pointless-statement
+    with pytest.raises(IndexError):
+        m._cells[0][-3]  # pylint: disable=pointless-statement
+
+
 # ---------------------------------------------------------------------------
 # Maze – entrance and exit
 # ---------------------------------------------------------------------------
@@ -181,6 +232,58 @@ def test_get_opposite_direction_invalid() -> None:
         Maze.get_opposite_direction("diagonal")
 
 
+# ---------------------------------------------------------------------------
+# Maze – generation
+# ---------------------------------------------------------------------------
+
+
+def _layout(m: Maze) -> list[list[dict[str, bool]]]:
+    """Snapshot the wall configuration of every cell in *m*."""
+    return [[dict(cell.configs) for cell in col] for col in m._cells]
+
+
+@pytest.mark.parametrize("seed", [0, 7, 42])
+def test_break_walls_iterative_matches_recursive(seed: int) -> None:
+    """The explicit-stack generator carves the same layout as the recursive one."""
+    m = Maze(
+        Point(0, 0), num_rows=9, num_cols=11, cell_size_x=10, cell_size_y=10, seed=seed
+    )
+
+    m._create_cells()
+    m._break_entrance_and_exit()
+    m._rng.seed(seed)
+    m._break_walls_r(0, 0)
+
+    m_iter = Maze(
+        Point(0, 0), num_rows=9, num_cols=11, cell_size_x=10, cell_size_y=10, seed=seed
+    )
+    assert _layout(m) == _layout(m_iter)
+
+
+def test_maze_leaves_global_random_untouched() -> None:
+    """Seeded generation uses the maze's own RNG, not the global one."""
+    random.seed(1)
+    state = random.getstate()
+    Maze(Point(0, 0), 6, 6, 10, 10, seed=5)
+    Maze(Point(0, 0), 6, 6, 10, 10, seed=5, generator="wilson")
+    assert random.getstate() == state
+
+
+def test_maze_injected_rng_matches_seed() -> None:
+    """An injected ``random.Random`` drives generation like a seed does."""
+    seeded = Maze(Point(0, 0), 7, 5, 10, 10, seed=9)
+    injected = Maze(Point(0, 0), 7, 5, 10, 10, rng=random.Random(9))
+    assert _layout(seeded) == _layout(injected)
+
+
+def test_maze_generation_beyond_recursion_limit() -> None:
+    """A corridor deeper than the recursion limit is generated without error."""
+    m = Maze(Point(0, 0), num_rows=3000, num_cols=1, cell_size_x=1, cell_size_y=1)
+    assert len(m._cells[0]) == 3000
+    assert m._cells[0][1500].configs["top"] is False
+    assert m._cells[0][1500].configs["bottom"] is False
+
+
 # ---------------------------------------------------------------------------
 # Maze – solve
 # ---------------------------------------------------------------------------
@@ -209,3 +312,63 @@ def test_maze_solve_reproducible_with_seed() -> None:
         Point(0, 0), num_rows=5, num_cols=5, cell_size_x=10, cell_size_y=10, seed=7
     )
     assert m1.solve() == m2.solve()
+
+
+class _RecordingWindow:
+    """Stand-in for :class:`Window` that logs every line and cell drawn."""
+
+    def __init__(self) -> None:
+        self.lines: list[tuple[int, int, int, int, str]] = []
+        self.cells: list[tuple[int, int, int, int, int]] = []
+
+    def step(self) -> None:
+        """Do nothing; there is no display."""
+
+    def draw_line(
+        self, line: Line, fill_color: str = "black", visible: bool = True
+    ) -> None:
+        """Record the line's end points and effective colour."""
+        color = fill_color if visible else "white"
+        self.lines.append((line.p1.x, line.p1.y, line.p2.x, line.p2.y, color))
+
+    def draw_cell(self, x1: int, y1: int, x2: int, y2: int, mask: int) -> None:
+        """Record the cell's bounding box and wall mask."""
+        self.cells.append((x1, y1, x2, y2, mask))
+
+
+@pytest.mark.parametrize("seed", [1, 7, 42])
+def test_maze_solve_iterative_matches_recursive(seed: int) -> None:
+    """Both solve methods make the same moves, backtracks included."""
+    moves: dict[str, list[tuple[int, int, int, int, str]]] = {}
+
+    for method in ("recursive", "iterative"):
+        win = _RecordingWindow()
+        m = Maze(Point(0, 0), 8, 8, 10, 10, win=win, seed=seed)  # type: ignore[arg-type]
+        win.lines.clear()
+        assert m.solve(method) is True
+        moves[method] = win.lines
+
+    assert moves["iterative"] == moves["recursive"]
+    assert any(color == "grey" for *_, color in moves["iterative"])
+
+
+def test_cell_draw_passes_wall_mask() -> None:
+    """Drawing a cell hands its box and wall mask to the window."""
+    win = _RecordingWindow()
+    cell = Cell(Point(0, 0), Point(10, 20), win, top=False)  # type: ignore[arg-type]
+    cell.draw()
+    assert win.cells == [(0, 0, 10, 20, 0b1110)]
+    assert not win.lines
+
+
+def test_maze_solve_iterative_beyond_recursion_limit() -> None:
+    """The iterative solver handles paths longer than the recursion limit."""
+    m = Maze(Point(0, 0), num_rows=3000, num_cols=1, cell_size_x=1, cell_size_y=1)
+    assert m.solve() is True
+
+
+def test_maze_solve_unknown_method() -> None:
+    """solve raises ValueError for unknown methods."""
+    m = Maze(Point(0, 0), num_rows=2, num_cols=2, cell_size_x=10, cell_size_y=10)
+    with pytest.raises(ValueError, match="Unknown solve method"):
+        m.solve("teleport")
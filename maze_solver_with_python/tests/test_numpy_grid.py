@@ -0,0 +1,96 @@
+"""Unit tests for the optional NumPy grid backend."""
+
+import subprocess
+import sys
+from typing import TYPE_CHECKING, cast
+
+import pytest
+
+from maze_solver_with_python.core.generators import GENERATORS
+from maze_solver_with_python.core.grid import BOTTOM, TOP
+from maze_solver_with_python.core.models import Maze, Point
+
+if TYPE_CHECKING:
+    from maze_solver_with_python.core.numpy_grid import NumpyWallGrid
+
+np = pytest.importorskip("numpy")
+
+
+def _pair(generator: str = "dfs") -> tuple[Maze, Maze]:
+    """Build the same seeded maze on both backends."""
+    return tuple(  # type: ignore[return-value]
+        Maze(Point(0, 0), 9, 12, 10, 10, seed=4, generator=generator, backend=b)
+        for b in ("python", "numpy")
+    )
+
+
+def _np_grid(m: Maze) -> "NumpyWallGrid":
+    """Return the NumPy grid of a maze built with ``backend="numpy"``."""
+    return cast("NumpyWallGrid", m._grid)
+
+
+@pytest.mark.parametrize("generator", ["dfs", *GENERATORS])
+def test_numpy_backend_matches_python_layout(generator: str) -> None:
+    """Both backends carve the same layout and find the same path."""
+    py_maze, np_maze = _pair(generator)
+    assert np_maze._grid.walls == py_maze._grid.walls
+    assert np_maze.find_path().path == py_maze.find_path().path
+    assert np_maze.solve() is True
+
+
+def test_numpy_open_neighbors_matches_python() -> None:
+    """The table-driven neighbour lookup agrees with the bounds-checked one."""
+    py_maze, np_maze = _pair()
+    for idx in range(len(py_maze._grid)):
+        assert np_maze._grid.open_neighbors(idx) == py_maze._grid.open_neighbors(idx)
+
+
+def test_numpy_views_share_storage() -> None:
+    """The array views are zero-copy windows onto the bytearrays."""
+    _, m = _pair()
+    grid = _np_grid(m)
+    grid.set_wall(5, TOP, True)
+    assert grid.walls_array[5] & TOP
+    grid.set_visited(10)
+    assert grid.visited_flags()[10]
+    assert grid.visited_flags().sum() == 1
+
+
+def test_numpy_batch_queries() -> None:
+    """Batch wall, degree and dead-end queries match per-cell results."""
+    py_maze, np_maze = _pair()
+    py_grid, np_grid = py_maze._grid, _np_grid(np_maze)
+    indices = np.arange(len(np_grid))
+    expected = [py_grid.has_wall(idx, BOTTOM) for idx in range(len(py_grid))]
+    assert np_grid.has_walls(indices, BOTTOM).tolist() == expected
+
+    degrees = [len(py_grid.open_neighbors(idx)) for idx in range(len(py_grid))]
+    assert np_grid.degrees().tolist() == degrees
+    assert np_grid.dead_ends().tolist() == [
+        idx for idx, degree in enumerate(degrees) if degree == 1
+    ]
+
+
+def test_numpy_reset_visited() -> None:
+    """reset_visited clears every flag in one operation."""
+    _, m = _pair()
+    _np_grid(m).visited_array.fill(0xFF)
+    m._reset_cells_visited()
+    assert not _np_grid(m).visited_flags().any()
+
+
+def test_python_backend_does_not_import_numpy() -> None:
+    """The default backend never loads NumPy."""
+    code = (
+        "import sys\n"
+        "from maze_solver_with_python.core.models import Maze, Point\n"
+        "Maze(Point(0, 0), 4, 4, 1, 1).find_path()\n"
+        "assert 'numpy' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_maze_unknown_backend() -> None:
+    """Maze raises ValueError for unknown backends."""
+    with pytest.raises(ValueError, match="Unknown backend"):
+        Maze(Point(0, 0), 2, 2, 1, 1, backend="cuda")
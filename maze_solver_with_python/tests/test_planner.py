@@ -0,0 +1,123 @@
+"""Unit tests for wall mutation and incremental path repair."""
+
+import random
+
+import pytest
+
+from maze_solver_with_python.core.events import WALL_ADDED, WALL_REMOVED, EventLog
+from maze_solver_with_python.core.grid import DIRECTIONS, RIGHT, WallGrid
+from maze_solver_with_python.core.models import Maze, Point
+from maze_solver_with_python.core.planner import LPAStar
+
+# ---------------------------------------------------------------------------
+# Mutation
+# ---------------------------------------------------------------------------
+
+
+def test_set_wall_updates_both_cells() -> None:
+    """Opening or closing a wall changes both cells' configs."""
+    maze = Maze(Point(0, 0), 10, 12, 10, 10, seed=8)
+    maze.set_wall((3, 4), "right", True)
+    assert maze._cells[3][4].configs["right"] is True
+    assert maze._cells[4][4].configs["left"] is True
+    assert maze.set_wall((4, 4), "left", False) is True
+    assert maze._cells[3][4].configs["right"] is False
+    assert maze._cells[4][4].configs["left"] is False
+    assert maze.set_wall((4, 4), "left", False) is False
+
+
+def test_toggle_wall_emits_events() -> None:
+    """Each toggle reports the wall change to listeners."""
+    maze = Maze(Point(0, 0), 10, 12, 10, 10, seed=8)
+    log = EventLog()
+    maze.subscribe(log)
+    before = maze._cells[5][5].configs["bottom"]
+    assert maze.toggle_wall((5, 5), "bottom") is not before
+    assert maze.toggle_wall((5, 5), "bottom") is before
+    assert log.count(WALL_ADDED) == log.count(WALL_REMOVED) == 1
+    assert maze._cells[5][6].configs["top"] is before
+
+
+@pytest.mark.parametrize(
+    ("cell", "direction"), [((0, 0), "top"), ((11, 3), "right"), ((2, 9), "bottom")]
+)
+def test_border_walls_are_fixed(cell: tuple[int, int], direction: str) -> None:
+    """Walls on the outer border cannot be mutated."""
+    with pytest.raises(ValueError, match="Border"):
+        Maze(Point(0, 0), 10, 12, 10, 10, seed=8).toggle_wall(cell, direction)
+
+
+def test_unknown_direction() -> None:
+    """Unrecognised directions raise ValueError."""
+    with pytest.raises(ValueError, match="Unknown direction"):
+        Maze(Point(0, 0), 10, 12, 10, 10, seed=8).set_wall((1, 1), "up", False)
+
+
+# ---------------------------------------------------------------------------
+# LPA*
+# ---------------------------------------------------------------------------
+
+
+def test_initial_plan_is_shortest() -> None:
+    """The first plan matches BFS."""
+    maze = Maze(Point(0, 0), 10, 12, 10, 10, seed=8)
+    planner = maze.plan()
+    assert planner.path == maze.find_path("bfs").path
+    assert planner.distance == len(planner.path) - 1
+
+
+def test_repairs_match_bfs_after_random_mutations() -> None:
+    """After every mutation the repaired path is a shortest path."""
+    maze = Maze(Point(0, 0), 10, 12, 10, 10, seed=8)
+    planner = maze.plan(start=(2, 1), goal=(9, 8))
+    rng = random.Random(3)
+    for _ in range(300):
+        cell = (rng.randrange(12), rng.randrange(10))
+        direction = rng.choice(DIRECTIONS)
+        try:
+            maze.toggle_wall(cell, direction)
+        except ValueError:
+            continue
+        expected = maze.find_path("bfs", start=(2, 1), goal=(9, 8)).path
+        assert len(planner.path) == len(expected)
+        assert planner.distance == len(expected) - 1
+        for a, b in zip(planner.path, planner.path[1:]):
+            assert maze._grid.index(*b) in maze._grid.open_neighbors(
+                maze._grid.index(*a)
+            )
+
+
+def test_repair_expands_fewer_cells_than_a_fresh_plan() -> None:
+    """Opening a shortcut re-expands only part of the maze."""
+    maze = Maze(Point(0, 0), 40, 40, 1, 1, seed=2)
+    planner = maze.plan()
+    first = planner.expanded
+    path = planner.path
+    maze.set_wall(path[len(path) // 2], "right", False)
+    assert planner.expanded - first < first
+
+
+def test_unreachable_and_reconnected_goal() -> None:
+    """Cutting the only corridor empties the path; reopening restores it."""
+    grid = WallGrid(3, 1)
+    grid.carve(0, RIGHT)
+    grid.carve(1, RIGHT)
+    planner = LPAStar(grid, 0, 2)
+    assert planner.distance == 2
+    grid.set_shared_wall(1, RIGHT, True)
+    planner.update(1, 2)
+    assert planner.path == []
+    assert planner.distance == -1
+    grid.set_shared_wall(1, RIGHT, False)
+    planner.update(1, 2)
+    assert planner.path == [(0, 0), (1, 0), (2, 0)]
+
+
+def test_unsubscribed_planner_stops_tracking() -> None:
+    """Planners only follow the maze while subscribed."""
+    maze = Maze(Point(0, 0), 10, 12, 10, 10, seed=8)
+    planner = maze.plan()
+    maze.unsubscribe(planner)
+    expanded = planner.expanded
+    maze.toggle_wall((4, 4), "right")
+    assert planner.expanded == expanded
@@ -0,0 +1,131 @@
+"""Unit tests for batched canvas rendering."""
+
+from maze_solver_with_python.core.grid import ALL_WALLS, BOTTOM, LEFT, RIGHT, TOP
+from maze_solver_with_python.core.rendering import CanvasRenderer
+
+
+class _FakeCanvas:
+    """Canvas stand-in that tracks live items and logs every call."""
+
+    def __init__(self) -> None:
+        self.items: dict[int, tuple[tuple[int, int, int, int], str]] = {}
+        self.calls: list[str] = []
+        self._next = 1
+
+    def create_line(
+        self, x1: int, y1: int, x2: int, y2: int, /, *, fill: str, width: int
+    ) -> int:
+        """Add a line item."""
+        assert width == 2
+        self.calls.append("create")
+        self.items[self._next] = ((x1, y1, x2, y2), fill)
+        self._next += 1
+        return self._next - 1
+
+    def itemconfigure(self, item: int, *, fill: str) -> None:
+        """Recolour a line item."""
+        self.calls.append("configure")
+        self.items[item] = (self.items[item][0], fill)
+
+    def delete(self, item: int) -> None:
+        """Remove a line item."""
+        self.calls.append("delete")
+        del self.items[item]
+
+
+def _segments(canvas: _FakeCanvas) -> dict[tuple[int, int, int, int], str]:
+    """Return the colour of each live segment on *canvas*."""
+    return dict(canvas.items.values())
+
+
+# ---------------------------------------------------------------------------
+# Walls
+# ---------------------------------------------------------------------------
+
+
+def test_set_walls_draws_present_walls_on_flush() -> None:
+    """Only walls whose bits are set get an item, and only on flush."""
+    canvas = _FakeCanvas()
+    renderer = CanvasRenderer(canvas)
+    renderer.set_walls(0, 0, 10, 10, TOP | LEFT)
+    assert not canvas.calls and renderer.dirty == 4
+
+    assert renderer.flush() == 2
+    assert _segments(canvas) == {(0, 0, 10, 0): "black", (0, 0, 0, 10): "black"}
+    assert len(renderer) == 2 and renderer.dirty == 0
+
+
+def test_redrawing_a_cell_between_frames_coalesces() -> None:
+    """Many draws of one cell before a flush cost one update per wall."""
+    canvas = _FakeCanvas()
+    renderer = CanvasRenderer(canvas)
+    for mask in (ALL_WALLS, ALL_WALLS & ~RIGHT, ALL_WALLS, ALL_WALLS & ~BOTTOM):
+        renderer.set_walls(0, 0, 10, 10, mask)
+    renderer.flush()
+    assert canvas.calls == ["create"] * 3
+    assert (0, 10, 10, 10) not in _segments(canvas)
+
+
+def test_removed_wall_deletes_item() -> None:
+    """Removing a wall deletes its item instead of painting over it."""
+    canvas = _FakeCanvas()
+    renderer = CanvasRenderer(canvas)
+    renderer.set_walls(0, 0, 10, 10, ALL_WALLS)
+    renderer.flush()
+    renderer.set_walls(0, 0, 10, 10, ALL_WALLS & ~RIGHT)
+    renderer.flush()
+    assert canvas.calls[-1] == "delete"
+    assert len(canvas.items) == len(renderer) == 3
+
+
+def test_shared_wall_is_one_item() -> None:
+    """Neighbouring cells share the canvas item of their common wall."""
+    canvas = _FakeCanvas()
+    renderer = CanvasRenderer(canvas)
+    renderer.set_walls(0, 0, 10, 10, ALL_WALLS)
+    renderer.set_walls(10, 0, 20, 10, ALL_WALLS)
+    renderer.flush()
+    assert len(canvas.items) == 7
+
+
+def test_item_count_stays_flat_across_frames() -> None:
+    """Redrawing the same grid every frame never adds items."""
+    canvas = _FakeCanvas()
+    renderer = CanvasRenderer(canvas)
+    peak = 0
+    for frame in range(6):
+        mask = ALL_WALLS if frame % 2 else ALL_WALLS & ~LEFT
+        for i in range(4):
+            for j in range(4):
+                renderer.set_walls(i * 10, j * 10, i * 10 + 10, j * 10 + 10, mask)
+        renderer.flush()
+        peak = max(peak, len(canvas.items))
+    assert peak == len(canvas.items) == len(renderer) == 40
+
+
+# ---------------------------------------------------------------------------
+# Segments
+# ---------------------------------------------------------------------------
+
+
+def test_set_segment_recolours_in_place() -> None:
+    """A new colour for an existing segment reconfigures its item."""
+    canvas = _FakeCanvas()
+    renderer = CanvasRenderer(canvas)
+    renderer.set_segment((5, 5, 15, 5), "red")
+    renderer.flush()
+    renderer.set_segment((5, 5, 15, 5), "grey")
+    renderer.flush()
+    renderer.set_segment((5, 5, 15, 5), "grey")
+    assert renderer.flush() == 0
+    assert canvas.calls == ["create", "configure"]
+    assert _segments(canvas) == {(5, 5, 15, 5): "grey"}
+
+
+def test_removing_unknown_segment_is_a_no_op() -> None:
+    """Removing a segment that was never drawn makes no canvas call."""
+    canvas = _FakeCanvas()
+    renderer = CanvasRenderer(canvas)
+    renderer.set_segment((0, 0, 1, 1), None)
+    assert renderer.flush() == 0
+    assert not canvas.calls
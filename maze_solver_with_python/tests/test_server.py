@@ -0,0 +1,305 @@
+"""Unit tests for the asyncio maze service."""
+
+import asyncio
+import json
+from collections.abc import Awaitable, Callable
+
+import pytest
+
+from maze_solver_with_python.__main__ import main
+from maze_solver_with_python.core import server
+from maze_solver_with_python.core.batch import build
+from maze_solver_with_python.core.server import MazeService, fetch
+
+
+def run_with_server(
+    scenario: Callable[[MazeService, int], Awaitable[None]], **kwargs: int
+) -> None:
+    """Run *scenario* against a thread-backed service on a free port."""
+
+    async def main() -> None:
+        service = MazeService(workers=2, executor="thread", **kwargs)
+        listener = await service.start("127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        try:
+            async with listener:
+                await scenario(service, port)
+        finally:
+            service.close()
+
+    asyncio.run(main())
+
+
+# ---------------------------------------------------------------------------
+# Service
+# ---------------------------------------------------------------------------
+
+
+def test_identical_requests_share_one_build() -> None:
+    """Concurrent requests for one maze coalesce into a single build."""
+
+    async def scenario() -> None:
+        service = MazeService(workers=2, executor="thread")
+        try:
+            results = await asyncio.gather(*(service.get(4, 20, 20) for _ in range(5)))
+        finally:
+            service.close()
+        assert all(result is results[0] for result in results)
+        assert service.stats() == {
+            "requests": 5,
+            "hits": 0,
+            "coalesced": 4,
+            "builds": 1,
+            "cached": 1,
+            "inflight": 0,
+            "cached_bytes": len(results[0].layout) + len(results[0].solution),
+        }
+
+    asyncio.run(scenario())
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    """Repeated requests hit the cache until the entry is evicted."""
+
+    async def scenario() -> None:
+        service = MazeService(workers=1, executor="thread", cache_size=2)
+        try:
+            await service.get(1, 5, 5)
+            await service.get(2, 5, 5)
+            await service.get(1, 5, 5)  # hit; seed 2 is now the oldest
+            await service.get(3, 5, 5)  # evicts seed 2
+            await service.get(1, 5, 5)
+            await service.get(2, 5, 5)
+        finally:
+            service.close()
+        assert (service.hits, service.builds) == (2, 4)
+
+    asyncio.run(scenario())
+
+
+def test_cache_is_bounded_by_bytes() -> None:
+    """Old entries are evicted once the cached bytes exceed the budget."""
+    results = [build(seed, 9, 9, "dfs", "bfs") for seed in (1, 2)]
+    budget = sum(len(result.layout) + len(result.solution) for result in results)
+
+    async def scenario() -> None:
+        service = MazeService(workers=1, executor="thread", cache_bytes=budget)
+        try:
+            await service.get(1, 9, 9)
+            await service.get(2, 9, 9)
+            assert service.stats()["cached"] == 2
+            await service.get(3, 9, 9)  # over budget; seed 1 is evicted
+            assert service.stats()["cached_bytes"] <= budget
+            await service.get(1, 9, 9)
+        finally:
+            service.close()
+        assert (service.hits, service.builds) == (0, 4)
+
+    asyncio.run(scenario())
+
+
+def test_oversized_results_are_served_but_not_cached() -> None:
+    """A result larger than the whole byte budget never enters the cache."""
+
+    async def scenario() -> None:
+        service = MazeService(workers=1, executor="thread", cache_bytes=1)
+        try:
+            result = await service.get(1, 5, 5)
+        finally:
+            service.close()
+        assert result.path
+        assert (service.stats()["cached"], service.stats()["cached_bytes"]) == (0, 0)
+
+    asyncio.run(scenario())
+
+
+def test_service_matches_batch_build() -> None:
+    """The service returns exactly what batch.build produces."""
+
+    async def scenario() -> None:
+        service = MazeService(workers=1, executor="thread")
+        try:
+            result = await service.get(7, 9, 11, "kruskal", "astar")
+        finally:
+            service.close()
+        expected = build(7, 9, 11, "kruskal", "astar")
+        assert (result.layout, result.solution) == (expected.layout, expected.solution)
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [
+        ({"num_rows": 0}, "cells"),
+        ({"num_rows": 3000, "num_cols": 3000}, "cells"),
+        ({"generator": "prim"}, "Unknown generator"),
+        ({"solver": "teleport"}, "Unknown solver"),
+    ],
+)
+def test_service_rejects_invalid_requests(
+    kwargs: dict[str, object], message: str
+) -> None:
+    """Invalid parameters raise ValueError before any work is queued."""
+
+    async def scenario() -> None:
+        service = MazeService(workers=1, executor="thread", max_cells=1_000_000)
+        try:
+            with pytest.raises(ValueError, match=message):
+                await service.get(1, **kwargs)  # type: ignore[arg-type]
+        finally:
+            service.close()
+        assert service.builds == 0
+
+    asyncio.run(scenario())
+
+
+def test_service_unknown_executor() -> None:
+    """An unknown executor name raises ValueError."""
+    with pytest.raises(ValueError, match="Unknown executor"):
+        MazeService(executor="gpu")
+
+
+def test_service_rejects_empty_cache_budget() -> None:
+    """A cache budget below one byte raises ValueError."""
+    with pytest.raises(ValueError, match="cache_bytes"):
+        MazeService(executor="thread", cache_bytes=0)
+
+
+# ---------------------------------------------------------------------------
+# HTTP
+# ---------------------------------------------------------------------------
+
+
+def test_maze_endpoint_returns_path() -> None:
+    """/maze answers JSON with the solution path, over one kept-alive socket."""
+
+    async def scenario(service: MazeService, port: int) -> None:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        status, body = await fetch(reader, writer, "/maze?seed=3&rows=6&cols=8")
+        again, _ = await fetch(reader, writer, "/maze?seed=3&rows=6&cols=8")
+        stats_status, stats = await fetch(reader, writer, "/stats", keep_alive=False)
+        writer.close()
+        document = json.loads(body)
+        expected = build(3, 6, 8, "dfs", "bfs").path
+        assert (status, again, stats_status) == (200, 200, 200)
+        assert [tuple(cell) for cell in document["path"]] == expected
+        assert json.loads(stats)["hits"] == 1
+        assert await reader.read() == b""  # closed after Connection: close
+
+    run_with_server(scenario)
+
+
+def test_layout_is_streamed_in_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    """/layout sends the maze file in chunks that reassemble exactly."""
+    monkeypatch.setattr(server, "CHUNK_SIZE", 100)
+
+    async def scenario(service: MazeService, port: int) -> None:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        status, body = await fetch(reader, writer, "/layout?seed=2&rows=40&cols=40")
+        writer.close()
+        assert status == 200
+        assert len(body) > 100
+        assert body == build(2, 40, 40, "dfs", "bfs").layout
+
+    run_with_server(scenario)
+
+
+@pytest.mark.parametrize(
+    ("target", "status"),
+    [
+        ("/maze", 400),
+        ("/maze?seed=x", 400),
+        ("/maze?seed=1&generator=prim", 400),
+        ("/elsewhere", 404),
+    ],
+)
+def test_http_errors(target: str, status: int) -> None:
+    """Bad queries get 400 and unknown paths 404, with a JSON message."""
+
+    async def scenario(service: MazeService, port: int) -> None:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        got, body = await fetch(reader, writer, target, keep_alive=False)
+        writer.close()
+        assert got == status
+        assert "error" in json.loads(body)
+
+    run_with_server(scenario)
+
+
+def test_failed_build_is_a_server_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A build that raises is answered 500 and the connection stays usable."""
+
+    def broken(*args: object) -> None:
+        raise RuntimeError("worker died")
+
+    monkeypatch.setattr(server, "build", broken)
+
+    async def scenario(service: MazeService, port: int) -> None:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        status, body = await fetch(reader, writer, "/maze?seed=1")
+        again, _ = await fetch(reader, writer, "/stats", keep_alive=False)
+        writer.close()
+        assert (status, again) == (500, 200)
+        assert json.loads(body) == {"error": "Maze build failed."}
+
+    run_with_server(scenario)
+
+
+def test_non_get_is_rejected() -> None:
+    """Only GET requests are served."""
+
+    async def scenario(service: MazeService, port: int) -> None:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"POST /maze?seed=1 HTTP/1.1\r\nConnection: close\r\n\r\n")
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        assert response.startswith(b"HTTP/1.1 405 ")
+
+    run_with_server(scenario)
+
+
+@pytest.mark.parametrize(
+    "request_head",
+    [
+        b"POST /maze?seed=1 HTTP/1.1\r\nContent-Length: 37\r\n\r\n",
+        b"GET /maze?seed=1 HTTP/1.1\r\nContent-Length: 37\r\n\r\n",
+        b"GET /stats HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n",
+    ],
+    ids=["post", "get-with-length", "get-chunked"],
+)
+def test_request_bodies_are_not_parsed_as_requests(request_head: bytes) -> None:
+    """A body carrying a request line is never answered as a second request."""
+
+    async def scenario(service: MazeService, port: int) -> None:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        try:
+            writer.write(request_head + b"GET /stats HTTP/1.1\r\nHost: maze\r\n\r\n")
+            await writer.drain()
+            response = await asyncio.wait_for(reader.read(), timeout=5)
+        finally:
+            writer.close()
+        assert response.count(b"HTTP/1.1 ") == 1
+        assert b"Connection: close" in response
+        assert service.stats()["requests"] <= 1
+
+    run_with_server(scenario)
+
+
+# ---------------------------------------------------------------------------
+# Command line
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("option", ["--workers", "--cache-size", "--cache-mb"])
+def test_serve_command_rejects_non_positive_sizes(
+    option: str, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Sizes below 1 are a usage error, reported before the server starts."""
+    with pytest.raises(SystemExit) as excinfo:
+        main(["serve", option, "0"])
+    assert excinfo.value.code == 2
+    captured = capsys.readouterr()
+    assert "at least 1" in captured.err
+    assert captured.out == ""
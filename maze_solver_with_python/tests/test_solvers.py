@@ -0,0 +1,119 @@
+"""Unit tests for the pluggable maze solvers."""
+
+import pytest
+
+from maze_solver_with_python.core.grid import BOTTOM, LEFT, RIGHT, TOP, WallGrid
+from maze_solver_with_python.core.models import Maze, Point
+from maze_solver_with_python.core.solvers import SOLVERS, SolveResult
+
+
+def _open_grid(num_cols: int, num_rows: int) -> WallGrid:
+    """Return a grid with every interior wall removed (many loops)."""
+    grid = WallGrid(num_cols, num_rows)
+    for i in range(num_cols):
+        for j in range(num_rows):
+            idx = grid.index(i, j)
+            if j > 0:
+                grid.set_wall(idx, TOP, False)
+            if j < num_rows - 1:
+                grid.set_wall(idx, BOTTOM, False)
+            if i > 0:
+                grid.set_wall(idx, LEFT, False)
+            if i < num_cols - 1:
+                grid.set_wall(idx, RIGHT, False)
+    return grid
+
+
+def _assert_valid_path(grid: WallGrid, result: SolveResult) -> None:
+    """Every step of *result* moves to an adjacent cell through an open wall."""
+    for (i1, j1), (i2, j2) in zip(result.path, result.path[1:]):
+        assert grid.index(i2, j2) in grid.open_neighbors(grid.index(i1, j1))
+
+
+@pytest.mark.parametrize("name", sorted(SOLVERS))
+def test_solvers_agree_on_perfect_maze(name: str) -> None:
+    """A perfect maze has one path; every solver finds it."""
+    m = Maze(
+        Point(0, 0), num_rows=12, num_cols=15, cell_size_x=10, cell_size_y=10, seed=5
+    )
+    expected = m.find_path("bfs").path
+    result = m.find_path(name)
+    assert result.path == expected
+    assert result.path[0] == (0, 0)
+    assert result.path[-1] == (14, 11)
+    assert 0 < result.expanded <= 15 * 12
+    _assert_valid_path(m._grid, result)
+
+
+@pytest.mark.parametrize("name", sorted(set(SOLVERS) - {"dfs"}))
+def test_solvers_return_shortest_path_with_loops(name: str) -> None:
+    """On a grid with loops, the shortest-path solvers find a Manhattan path."""
+    grid = _open_grid(6, 4)
+    result = SOLVERS[name](grid, grid.index(0, 0), grid.index(5, 3))
+    assert len(result.path) == 5 + 3 + 1
+    _assert_valid_path(grid, result)
+
+
+@pytest.mark.parametrize("name", sorted(SOLVERS))
+def test_solvers_unreachable_goal(name: str) -> None:
+    """A fully walled grid has no path between distinct cells."""
+    grid = WallGrid(3, 3)
+    result = SOLVERS[name](grid, 0, 8)
+    assert result.path == []
+    assert result.found is False
+
+
+@pytest.mark.parametrize("name", sorted(SOLVERS))
+def test_solvers_start_is_goal(name: str) -> None:
+    """Start equal to goal yields a one-cell path."""
+    grid = WallGrid(2, 2)
+    assert SOLVERS[name](grid, 3, 3).path == [(1, 1)]
+
+
+def test_find_path_custom_endpoints_and_repeatable() -> None:
+    """find_path accepts arbitrary endpoints and can be called repeatedly."""
+    m = Maze(Point(0, 0), num_rows=8, num_cols=8, cell_size_x=10, cell_size_y=10)
+    first = m.find_path("astar", start=(3, 4), goal=(7, 0))
+    second = m.find_path("astar", start=(3, 4), goal=(7, 0))
+    assert first == second
+    assert first.path[0] == (3, 4)
+    assert first.path[-1] == (7, 0)
+
+
+def test_find_path_unknown_solver() -> None:
+    """find_path raises ValueError for unregistered solvers."""
+    m = Maze(Point(0, 0), num_rows=2, num_cols=2, cell_size_x=10, cell_size_y=10)
+    with pytest.raises(ValueError, match="Unknown solver"):
+        m.find_path("teleport")
+
+
+def test_entry_points_reject_cells_outside_the_maze() -> None:
+    """A row past the last one must not alias a cell of the next column."""
+    m = Maze(Point(0, 0), num_rows=9, num_cols=4, cell_size_x=10, cell_size_y=10)
+    calls = (
+        lambda: m.find_path(start=(0, 9)),
+        lambda: m.find_path(goal=(4, 0)),
+        lambda: m.fingerprint(start=(0, -1)),
+        lambda: m.distance_field((0, 9)),
+        lambda: m.tree_index((4, 0)),
+        lambda: m.plan(goal=(0, 9)),
+        lambda: m.set_wall((0, 9), "top", True),
+        lambda: m.toggle_wall((5, 5), "left"),
+    )
+    for call in calls:
+        with pytest.raises(IndexError, match="outside the maze"):
+            call()
+
+
+@pytest.mark.parametrize("name", sorted(SOLVERS))
+def test_solvers_on_braided_maze(name: str) -> None:
+    """With loops, DFS finds a valid path and the rest a shortest one."""
+    m = Maze(Point(0, 0), 15, 15, 10, 10, seed=9, generator="kruskal", braid=1.0)
+    shortest = len(m.find_path("bfs").path)
+    result = m.find_path(name)
+    _assert_valid_path(m._grid, result)
+    if name == "dfs":
+        assert len(result.path) >= shortest
+    else:
+        assert len(result.path) == shortest
+    assert m.solve()
@@ -0,0 +1,201 @@
+"""Unit tests for the binary maze file format."""
+
+import io
+import random
+from pathlib import Path
+
+import pytest
+
+from maze_solver_with_python.core.generators import stream_eller
+from maze_solver_with_python.core.grid import WallGrid
+from maze_solver_with_python.core.models import Maze, Point
+from maze_solver_with_python.core.storage import (
+    HEADER,
+    MappedWallGrid,
+    MazeHeader,
+    PackedWalls,
+    dump_grid,
+    iter_rows,
+    load_grid,
+    open_grid,
+    pack_masks,
+    read_header,
+    unpack_masks,
+    write_rows,
+)
+
+# ---------------------------------------------------------------------------
+# Header
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("seed", [None, 0, -5, 2**40])
+def test_header_round_trip(seed: int | None) -> None:
+    """A packed header decodes to the same values."""
+    header = MazeHeader(7, 3, seed, "eller")
+    packed = header.pack()
+    assert len(packed) == HEADER.size == 40
+    assert MazeHeader.unpack(packed) == header
+
+
+def test_header_rejects_bad_magic() -> None:
+    """Data without the magic bytes is rejected."""
+    with pytest.raises(ValueError, match="Not a maze file"):
+        MazeHeader.unpack(b"\0" * HEADER.size)
+
+
+def test_header_rejects_truncated_data() -> None:
+    """Data shorter than a header is rejected."""
+    with pytest.raises(ValueError, match="Truncated"):
+        MazeHeader.unpack(b"MAZE")
+
+
+# ---------------------------------------------------------------------------
+# Nibble packing
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("count", [0, 1, 2, 7, 64])
+def test_pack_unpack_masks_round_trip(count: int) -> None:
+    """Packing then unpacking restores the masks."""
+    masks = bytes(random.Random(count).randrange(16) for _ in range(count))
+    packed = pack_masks(masks)
+    assert len(packed) == (count + 1) // 2
+    assert unpack_masks(packed, count) == masks
+
+
+def test_pack_masks_nibble_order() -> None:
+    """Even masks go in the low nibble, odd masks in the high nibble."""
+    assert pack_masks(bytes([0x1, 0xA, 0x3])) == bytes([0xA1, 0x03])
+
+
+# ---------------------------------------------------------------------------
+# Streaming rows
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("num_cols, num_rows", [(7, 5), (8, 3), (1, 1), (3, 9)])
+def test_write_then_iter_rows(num_cols: int, num_rows: int) -> None:
+    """Rows streamed to a file stream back unchanged."""
+    rng = random.Random(num_cols * num_rows)
+    rows = [bytes(row) for row in stream_eller(num_cols, num_rows, rng)]
+    file = io.BytesIO()
+
+    written = write_rows(file, num_cols, num_rows, rows, seed=3, generator="eller")
+    assert written == len(file.getvalue()) == 40 + (num_cols * num_rows + 1) // 2
+
+    file.seek(0)
+    header = read_header(file)
+    assert header == MazeHeader(num_cols, num_rows, 3, "eller")
+    assert [bytes(row) for row in iter_rows(file, header)] == rows
+
+
+def test_write_rows_rejects_wrong_shape() -> None:
+    """Rows of the wrong length or number are rejected."""
+    with pytest.raises(ValueError, match="num_cols"):
+        write_rows(io.BytesIO(), 3, 1, [b"\x0f\x0f"])
+    with pytest.raises(ValueError, match="num_rows"):
+        write_rows(io.BytesIO(), 2, 2, [b"\x0f\x0f"])
+
+
+def test_iter_rows_truncated_file() -> None:
+    """A body shorter than the header promises is reported."""
+    file = io.BytesIO(MazeHeader(4, 4).pack() + b"\xff")
+    header = read_header(file)
+    with pytest.raises(ValueError, match="Truncated"):
+        list(iter_rows(file, header))
+
+
+# ---------------------------------------------------------------------------
+# In-memory grids
+# ---------------------------------------------------------------------------
+
+
+def test_dump_grid_round_trip() -> None:
+    """A dumped grid loads back with the same walls and header."""
+    maze = Maze(Point(0, 0), 7, 9, 1, 1, seed=3, generator="kruskal")
+    data = dump_grid(maze._grid, 3, "kruskal")
+    header, grid = load_grid(data)
+    assert header == MazeHeader(9, 7, 3, "kruskal")
+    assert grid.walls == maze._grid.walls
+
+
+def test_dump_grid_matches_write_rows() -> None:
+    """Dumping a grid produces the same bytes as streaming its rows."""
+    maze = Maze(Point(0, 0), 5, 3, 1, 1, seed=1)
+    grid = maze._grid
+    rows = [bytes(grid.walls[j :: grid.num_rows]) for j in range(grid.num_rows)]
+    buffer = io.BytesIO()
+    write_rows(buffer, grid.num_cols, grid.num_rows, rows, seed=1, generator="dfs")
+    assert dump_grid(grid, 1, "dfs") == buffer.getvalue()
+
+
+def test_load_grid_rejects_truncated_body() -> None:
+    """Bytes missing part of the body are rejected."""
+    data = dump_grid(Maze(Point(0, 0), 4, 4, 1, 1, seed=0)._grid)
+    with pytest.raises(ValueError, match="Truncated maze file"):
+        load_grid(data[:-1])
+
+
+# ---------------------------------------------------------------------------
+# Memory-mapped loading
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("num_cols, num_rows", [(7, 5), (4, 4), (1, 3)])
+def test_packed_walls_read_and_write_nibbles(num_cols: int, num_rows: int) -> None:
+    """Packed walls decode and update single cells in column-major order."""
+    rng = random.Random(num_cols)
+    walls = bytes(rng.randrange(16) for _ in range(num_cols * num_rows))
+    grid = WallGrid(num_cols, num_rows)
+    grid.walls[:] = walls
+    data = bytearray(dump_grid(grid))
+    packed = PackedWalls(data, HEADER.size, num_cols, num_rows)
+    assert [packed[idx] for idx in range(len(packed))] == list(walls)
+    assert bytes(packed) == walls
+
+    packed[len(packed) - 1] = 0
+    packed[0] = 9
+    assert packed[0] == 9 and packed[len(packed) - 1] == 0
+    assert bytes(packed)[1:-1] == walls[1:-1]
+
+
+def test_save_and_load_round_trip(tmp_path: Path) -> None:
+    """A loaded maze has the saved layout, metadata and solutions."""
+    maze = Maze(Point(0, 0), 9, 12, 1, 1, seed=4, generator="wilson")
+    path = tmp_path / "m.maze"
+    assert maze.save(path) == path.stat().st_size == 40 + 54
+
+    loaded = Maze.load(path)
+    assert isinstance(loaded._grid, MappedWallGrid)
+    assert (loaded.num_cols, loaded.num_rows) == (12, 9)
+    assert (loaded.seed, loaded.generator) == (4, "wilson")
+    assert bytes(loaded._grid.walls) == bytes(maze._grid.walls)
+    assert loaded.find_path("astar").path == maze.find_path("astar").path
+    assert loaded.solve()
+    loaded._grid.close()
+
+
+def test_loaded_maze_never_writes_back(tmp_path: Path) -> None:
+    """Edits to a loaded maze stay private to the process."""
+    path = tmp_path / "m.maze"
+    Maze(Point(0, 0), 5, 5, 1, 1, seed=8).save(path)
+    before = path.read_bytes()
+
+    loaded = Maze.load(path)
+    assert isinstance(loaded._grid, MappedWallGrid)
+    configs = loaded._cells[2][2].configs
+    configs["left"] = not configs["left"]
+    assert loaded.save(tmp_path / "copy.maze") == len(before)
+    loaded._grid.close()
+
+    assert path.read_bytes() == before
+    assert (tmp_path / "copy.maze").read_bytes() != before
+
+
+def test_open_grid_rejects_truncated_file(tmp_path: Path) -> None:
+    """A file shorter than its header promises cannot be opened."""
+    path = tmp_path / "m.maze"
+    path.write_bytes(dump_grid(WallGrid(6, 6))[:-2])
+    with pytest.raises(ValueError, match="Truncated maze file"):
+        open_grid(path)
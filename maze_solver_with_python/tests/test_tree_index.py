@@ -0,0 +1,69 @@
+"""Unit tests for the spanning-tree path index."""
+
+import random
+
+import pytest
+
+from maze_solver_with_python.core.grid import RIGHT, WallGrid
+from maze_solver_with_python.core.models import Maze, Point
+from maze_solver_with_python.core.tree_index import TreeIndex
+
+
+@pytest.mark.parametrize("generator", ["dfs", "kruskal", "wilson"])
+def test_paths_match_bfs(generator: str) -> None:
+    """On a perfect maze, tree paths are the unique BFS paths."""
+    maze = Maze(Point(0, 0), 11, 13, 10, 10, seed=4, generator=generator)
+    index = maze.tree_index()
+    rng = random.Random(1)
+    for _ in range(50):
+        start = (rng.randrange(13), rng.randrange(11))
+        goal = (rng.randrange(13), rng.randrange(11))
+        expected = maze.find_path("bfs", start=start, goal=goal).path
+        assert index.path(start, goal) == expected
+        assert index.distance(start, goal) == len(expected) - 1
+
+
+def test_depths_are_distances_from_root() -> None:
+    """A cell's depth is its distance from the root."""
+    maze = Maze(Point(0, 0), 11, 13, 10, 10, seed=4)
+    index = maze.tree_index(root=(6, 5))
+    for idx in range(len(index)):
+        cell = divmod(idx, 11)
+        assert index.depths[idx] == index.distance((6, 5), cell)
+    assert index.parents[maze._grid.index(6, 5)] == maze._grid.index(6, 5)
+
+
+def test_same_cell() -> None:
+    """A cell is zero steps from itself and is its own ancestor."""
+    index = Maze(Point(0, 0), 11, 13, 10, 10, seed=4).tree_index()
+    assert index.distance((3, 3), (3, 3)) == 0
+    assert index.path((3, 3), (3, 3)) == [(3, 3)]
+    assert index.lca((3, 3), (3, 3)) == (3, 3)
+
+
+def test_lca_of_root_path() -> None:
+    """The root is the common ancestor of the root and any cell."""
+    index = Maze(Point(0, 0), 11, 13, 10, 10, seed=4).tree_index()
+    assert index.lca((0, 0), (12, 10)) == (0, 0)
+    assert index.lca((12, 10), (0, 0)) == (0, 0)
+
+
+def test_disconnected_regions() -> None:
+    """Cells in different regions have no path between them."""
+    grid = WallGrid(3, 1)
+    grid.carve(0, RIGHT)
+    index = TreeIndex(grid)
+    assert index.path((0, 0), (1, 0)) == [(0, 0), (1, 0)]
+    assert index.distance((0, 0), (2, 0)) == -1
+    assert index.path((2, 0), (0, 0)) == []
+    assert index.lca((0, 0), (2, 0)) is None
+    assert index.distance((2, 0), (2, 0)) == 0
+
+
+def test_out_of_range() -> None:
+    """Cells outside the grid raise IndexError."""
+    index = Maze(Point(0, 0), 11, 13, 10, 10, seed=4).tree_index()
+    with pytest.raises(IndexError):
+        index.distance((0, 0), (13, 0))
+    with pytest.raises(IndexError):
+        index.path((-1, 0), (0, 0))
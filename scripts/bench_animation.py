@@ -0,0 +1,131 @@
+"""Report animation steps per second under each scheduler mode.
+
+Generates and solves a maze against a window stand-in whose timer advances a
+virtual clock, so playback time is the scheduled frame time rather than wall
+time. The ``sleep`` row is the former fixed ``time.sleep(0.05)`` per step.
+``peak ops`` is the longest the drawing queue got.
+"""
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+from maze_solver_with_python.core.animation import AnimationScheduler
+from maze_solver_with_python.core.models import Line, Maze, Point
+from maze_solver_with_python.core.rendering import CanvasRenderer
+
+# ── Benchmark matrix ──────────────────────────────────────────────────────────
+SIDE = 60
+CELL = 10
+SEED = 42
+LEGACY_SLEEP = 0.05
+MODES: dict[str, dict[str, Any]] = {
+    "unbounded": {"fps": 60, "steps_per_frame": 1, "max_frames": None},
+    "60 fps x1": {"fps": 60, "steps_per_frame": 1},
+    "60 fps x10": {"fps": 60, "steps_per_frame": 10},
+    "60 fps x100": {"fps": 60, "steps_per_frame": 100},
+    "instant": {"instant": True},
+}
+
+
+class NullCanvas:
+    """Canvas stand-in that accepts every call."""
+
+    def create_line(
+        self, x1: int, y1: int, x2: int, y2: int, /, *, fill: str, width: int
+    ) -> int:
+        """Pretend to add a line."""
+        del x1, y1, x2, y2, fill, width
+        return 0
+
+    def itemconfigure(self, item: int, /, *, fill: str) -> None:
+        """Pretend to recolour a line."""
+
+    def delete(self, item: int, /) -> None:
+        """Pretend to delete a line."""
+
+
+class VirtualTimer:
+    """``Tk.after`` stand-in that runs callbacks on a simulated clock."""
+
+    def __init__(self) -> None:
+        self.elapsed_ms = 0
+        self._queue: list[tuple[int, Callable[..., object], tuple[Any, ...]]] = []
+
+    def after(self, ms: int, func: Callable[..., object], *args: Any) -> None:
+        """Schedule *func* after *ms* simulated milliseconds."""
+        self._queue.append((ms, func, args))
+
+    def run(self) -> None:
+        """Fire callbacks until none are left, advancing the clock."""
+        while self._queue:
+            ms, func, args = self._queue.pop(0)
+            self.elapsed_ms += ms
+            func(*args)
+
+
+class ScheduledWindow:
+    """Window stand-in wired like :class:`Window` to a scheduler."""
+
+    def __init__(self, scheduler: AnimationScheduler) -> None:
+        self.scheduler = scheduler
+        self.renderer = CanvasRenderer(NullCanvas())
+        self.timer = VirtualTimer()
+        self.steps = 0
+        self.peak_ops = 0
+
+    def draw_line(
+        self, line: Line, fill_color: str = "black", visible: bool = True
+    ) -> None:
+        """Queue one segment."""
+        segment = (line.p1.x, line.p1.y, line.p2.x, line.p2.y)
+        color = fill_color if visible else None
+        self.scheduler.push(self.renderer.set_segment, segment, color)
+
+    def draw_cell(self, x1: int, y1: int, x2: int, y2: int, mask: int) -> None:
+        """Queue the cell's walls."""
+        self.scheduler.push(self.renderer.set_walls, x1, y1, x2, y2, mask)
+
+    def step(self) -> None:
+        """End a step and keep playback going."""
+        self.steps += 1
+        self.peak_ops = max(self.peak_ops, len(self.scheduler._queue))
+        self.scheduler.end_step()
+        self.scheduler.play(self.timer.after, self.renderer.flush)
+
+
+def run(scheduler: AnimationScheduler) -> tuple[int, int, float, float]:
+    """Return steps, peak queued ops, compute and simulated playback seconds."""
+    win = ScheduledWindow(scheduler)
+    start = time.perf_counter()
+    maze = Maze(Point(0, 0), SIDE, SIDE, CELL, CELL, win=win, seed=SEED)  # type: ignore[arg-type]
+    maze.solve()
+    compute = time.perf_counter() - start
+    win.timer.run()
+    win.renderer.flush()
+    return win.steps, win.peak_ops, compute, win.timer.elapsed_ms / 1e3
+
+
+def main() -> None:
+    """Print compute and end-to-end steps/sec for each mode."""
+    print(f"{SIDE}x{SIDE} maze, generate + solve")
+    print(
+        f"{'mode':<12} {'steps':>7}  {'peak ops':>8}  {'compute s':>9}"
+        f"  {'playback s':>10}  {'steps/s':>9}"
+    )
+    rows = []
+    for name, settings in MODES.items():
+        steps, peak, compute, playback = run(AnimationScheduler(**settings))
+        rows.append((name, steps, peak, compute, playback))
+    steps = rows[0][1]
+    rows.insert(0, ("sleep 0.05", steps, 0, rows[-1][3], steps * LEGACY_SLEEP))
+    for name, steps, peak, compute, playback in rows:
+        total = compute + playback
+        print(
+            f"{name:<12} {steps:>7,}  {peak:>8,}  {compute:>9.2f}"
+            f"  {playback:>10.1f}  {steps / total:>9,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Measure how batch generation scales with the number of worker processes."""
+
+import os
+import time
+
+from maze_solver_with_python.core.batch import generate_batch
+
+# ── Benchmark matrix ──────────────────────────────────────────────────────────
+SEEDS = range(256)
+SIDE = 60
+GENERATOR = "dfs"
+SOLVER = "bfs"
+
+
+def run(workers: int) -> tuple[float, int]:
+    """Return wall seconds and total result bytes for one batch."""
+    start = time.perf_counter()
+    size = sum(
+        len(result.layout) + len(result.solution)
+        for result in generate_batch(
+            SEEDS, SIDE, SIDE, GENERATOR, SOLVER, workers=workers
+        )
+    )
+    return time.perf_counter() - start, size
+
+
+def main() -> None:
+    """Print mazes/sec and speed-up over one worker per worker count."""
+    cores = os.cpu_count() or 1
+    counts = sorted({1, *(n for n in (2, 4, 8, 16) if n <= cores), cores})
+    print(f"{len(SEEDS)} mazes of {SIDE}x{SIDE}, {cores} cores")
+    print(f"{'workers':>7}  {'mazes/s':>8}  {'speed-up':>8}  {'B/maze':>7}")
+    baseline = 0.0
+    for workers in counts:
+        elapsed, size = run(workers)
+        baseline = baseline or elapsed
+        print(
+            f"{workers:>7}  {len(SEEDS) / elapsed:>8.1f}"
+            f"  {baseline / elapsed:>7.2f}x  {size / len(SEEDS):>7.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Report how solve cost grows as a maze gets more loops.
+
+Each maze is generated with Kruskal's algorithm and then braided, opening
+that share of its dead ends into loops. Loops are counted as passages beyond
+the ``cells - 1`` of a perfect maze.
+"""
+
+import time
+
+from maze_solver_with_python.core.models import Maze, Point
+from maze_solver_with_python.core.solvers import SOLVERS
+
+# ── Benchmark matrix ──────────────────────────────────────────────────────────
+SIDE = 300
+BRAIDS = (0.0, 0.25, 0.5, 0.75, 1.0)
+REPEATS = 3
+SEED = 42
+
+
+def loops(maze: Maze) -> int:
+    """Return the number of passages beyond a spanning tree."""
+    grid = maze._grid
+    passages = sum(len(grid.open_neighbors(idx)) for idx in range(len(grid))) // 2
+    return passages - (len(grid) - 1)
+
+
+def best_ms(maze: Maze, name: str) -> float:
+    """Return the fastest of ``REPEATS`` solves in milliseconds."""
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        maze.find_path(name)
+        times.append(time.perf_counter() - start)
+    return min(times) * 1e3
+
+
+def main() -> None:
+    """Print one row per (braid, solver) pair."""
+    cells = SIDE * SIDE
+    print(f"{SIDE}x{SIDE} maze")
+    print(
+        f"{'braid':>5}  {'loops':>6}  {'dead ends':>9}  {'solver':<14} {'ms':>8}"
+        f"  {'expanded':>9}  {'% grid':>6}  {'path':>5}"
+    )
+    for braid in BRAIDS:
+        maze = Maze(
+            Point(0, 0), SIDE, SIDE, 1, 1, seed=SEED, generator="kruskal", braid=braid
+        )
+        count, dead_ends = loops(maze), maze.dead_end_count()
+        for name in SOLVERS:
+            result = maze.find_path(name)
+            print(
+                f"{braid:>5.2f}  {count:>6}  {dead_ends:>9}  {name:<14}"
+                f" {best_ms(maze, name):>8.1f}  {result.expanded:>9}"
+                f"  {result.expanded / cells:>6.1%}  {len(result.path):>5}"
+            )
+
+
+if __name__ == "__main__":
+    main()
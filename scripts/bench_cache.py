@@ -0,0 +1,68 @@
+"""Compare repeated solves with and without a solve cache.
+
+A hit still hashes the wall layout to build its key, so its cost grows with
+the maze, but only as a single SHA-256 pass over one byte per cell.
+"""
+
+import tempfile
+import time
+from collections.abc import Callable
+
+from maze_solver_with_python.core.cache import SolveCache
+from maze_solver_with_python.core.models import Maze, Point
+
+# ── Benchmark matrix ──────────────────────────────────────────────────────────
+SIDES = (100, 300, 1000)
+SEED = 42
+REPEATS = 5
+
+
+def best(func: Callable[[], object]) -> float:
+    """Return the fastest of ``REPEATS`` calls in milliseconds."""
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1e3
+
+
+def run(side: int) -> tuple[float, ...]:
+    """Return solve, cached solve, BFS, cached BFS, disk and hash times."""
+    maze = Maze(Point(0, 0), side, side, 1, 1, seed=SEED, generator="kruskal")
+    memory = SolveCache()
+    maze.solve(cache=memory)
+    maze.find_path("bfs", cache=memory)
+    with tempfile.TemporaryDirectory() as directory:
+        SolveCache(directory=directory).put(
+            maze.fingerprint() + "-bfs", maze.find_path("bfs")
+        )
+        disk = best(
+            lambda: maze.find_path("bfs", cache=SolveCache(directory=directory))
+        )
+    return (
+        best(maze.solve),
+        best(lambda: maze.solve(cache=memory)),
+        best(lambda: maze.find_path("bfs")),
+        best(lambda: maze.find_path("bfs", cache=memory)),
+        disk,
+        best(maze.fingerprint),
+    )
+
+
+def main() -> None:
+    """Print solve and lookup times per maze size."""
+    print(
+        f"{'cells':>9}  {'solve ms':>9}  {'hit ms':>7}  {'bfs ms':>8}"
+        f"  {'hit ms':>7}  {'disk ms':>8}  {'fingerprint ms':>14}"
+    )
+    for side in SIDES:
+        solve, solve_hit, bfs, bfs_hit, disk, digest = run(side)
+        print(
+            f"{side * side:>9,}  {solve:>9.2f}  {solve_hit:>7.3f}  {bfs:>8.2f}"
+            f"  {bfs_hit:>7.3f}  {disk:>8.3f}  {digest:>14.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Compare one distance-field sweep with a solver call per cell.
+
+The per-cell column solves from the entrance to ``SAMPLE`` random cells and
+scales the time up to the whole maze.
+"""
+
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from maze_solver_with_python.core.models import Maze, Point
+
+# ── Benchmark matrix ──────────────────────────────────────────────────────────
+SIDES = (100, 300, 1000)
+SEED = 42
+SAMPLE = 20
+
+
+def run(side: int) -> tuple[float, ...]:
+    """Return field, per-cell BFS, diameter, dead-end and heatmap seconds."""
+    maze = Maze(Point(0, 0), side, side, 1, 1, seed=SEED, generator="kruskal")
+    rng = random.Random(SEED)
+
+    start = time.perf_counter()
+    field = maze.distance_field()
+    sweep = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(SAMPLE):
+        maze.find_path("bfs", goal=(rng.randrange(side), rng.randrange(side)))
+    per_cell = (time.perf_counter() - start) / SAMPLE * side * side
+
+    start = time.perf_counter()
+    maze.diameter()
+    double = time.perf_counter() - start
+
+    start = time.perf_counter()
+    maze.dead_end_count()
+    dead_ends = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        maze.export(Path(directory) / "heat.png", distances=field)
+        heatmap = time.perf_counter() - start
+    return sweep, per_cell, double, dead_ends, heatmap
+
+
+def main() -> None:
+    """Print the cost of each distance query per maze size."""
+    print(
+        f"{'cells':>9}  {'field s':>8}  {'per-cell bfs s':>14}  {'diameter s':>10}"
+        f"  {'dead ends s':>11}  {'heatmap s':>9}"
+    )
+    for side in SIDES:
+        sweep, per_cell, double, dead_ends, heatmap = run(side)
+        print(
+            f"{side * side:>9,}  {sweep:>8.3f}  {per_cell:>14,.0f}  {double:>10.3f}"
+            f"  {dead_ends:>11.3f}  {heatmap:>9.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Measure what the event stream costs headless generation and solving.
+
+Builds and solves the same maze with no listener, with a no-op listener and
+with an :class:`~maze_solver_with_python.core.events.EventLog`. With nothing
+subscribed no event is produced, so the first row is the baseline.
+"""
+
+import time
+from collections.abc import Callable
+
+from maze_solver_with_python.core.events import EventLog
+from maze_solver_with_python.core.models import Maze, Point
+
+# ── Benchmark matrix ──────────────────────────────────────────────────────────
+SIDES = (100, 300)
+SEED = 42
+REPEATS = 5
+
+
+def _noop(kind: int, a: int, b: int) -> None:
+    """Ignore every event."""
+    del kind, a, b
+
+
+def run(side: int, make_listeners: Callable[[], list]) -> tuple[float, int]:
+    """Return the best seconds over ``REPEATS`` runs and the events seen."""
+    best = float("inf")
+    events = 0
+    for _ in range(REPEATS):
+        listeners = make_listeners()
+        start = time.perf_counter()
+        maze = Maze(Point(0, 0), side, side, 1, 1, seed=SEED, listeners=listeners)
+        maze.solve()
+        best = min(best, time.perf_counter() - start)
+        events = sum(len(lst) for lst in listeners if isinstance(lst, EventLog))
+    return best, events
+
+
+def main() -> None:
+    """Print generate + solve time per listener setup and maze size."""
+    modes: dict[str, Callable[[], list]] = {
+        "none": list,
+        "no-op": lambda: [_noop],
+        "EventLog": lambda: [EventLog()],
+    }
+    print(f"{'cells':>7}  {'listener':<9} {'ms':>8}  {'overhead':>8}  {'events':>9}")
+    for side in SIDES:
+        baseline = 0.0
+        for name, make_listeners in modes.items():
+            elapsed, events = run(side, make_listeners)
+            baseline = baseline or elapsed
+            print(
+                f"{side * side:>7}  {name:<9} {elapsed * 1e3:>8.1f}"
+                f"  {elapsed / baseline - 1:>8.0%}  {events:>9,}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Time headless PNG and PPM export against per-wall drawing.
+
+The ``per-wall`` row paints the same image the way ``scripts/screenshot.py``
+used to, one rectangle per wall of every cell, but into the same bytearray,
+so it measures the draw calls rather than an imaging library.
+"""
+
+import time
+
+from maze_solver_with_python.core.export import (
+    WALL,
+    encode_png,
+    encode_ppm,
+    rasterize,
+)
+from maze_solver_with_python.core.grid import BOTTOM, LEFT, RIGHT, TOP, WallGrid
+from maze_solver_with_python.core.models import Maze, Point
+
+# ── Benchmark matrix ──────────────────────────────────────────────────────────
+SIDES = (100, 500, 1000)
+SCALE = 4
+SEED = 42
+
+
+def per_wall(grid: WallGrid) -> bytearray:
+    """Paint every wall of every cell separately."""
+    size = grid.num_cols * SCALE + 1
+    pixels = bytearray(size * size)
+    line = bytes((WALL,)) * (SCALE + 1)
+    for idx, mask in enumerate(grid.walls):
+        i, j = divmod(idx, grid.num_rows)
+        x, y = i * SCALE, j * SCALE
+        if mask & TOP:
+            pixels[y * size + x : y * size + x + SCALE + 1] = line
+        if mask & BOTTOM:
+            row = (y + SCALE) * size
+            pixels[row + x : row + x + SCALE + 1] = line
+        for bit, col in ((LEFT, x), (RIGHT, x + SCALE)):
+            if mask & bit:
+                for row in range(y * size, (y + SCALE + 1) * size, size):
+                    pixels[row + col] = WALL
+    return pixels
+
+
+def main() -> None:
+    """Print export times per maze size."""
+    print(
+        f"{'cells':>9}  {'pixels':>11}  {'per-wall s':>10}  {'rasterize s':>11}"
+        f"  {'png s':>6}  {'ppm s':>6}  {'png KiB':>8}"
+    )
+    for side in SIDES:
+        maze = Maze(Point(0, 0), side, side, 1, 1, seed=SEED, generator="kruskal")
+        path = maze.find_path().path
+        start = time.perf_counter()
+        per_wall(maze._grid)
+        baseline = time.perf_counter() - start
+        start = time.perf_counter()
+        raster = rasterize(maze._grid, path, scale=SCALE)
+        drawn = time.perf_counter()
+        png = encode_png(raster)
+        encoded = time.perf_counter()
+        encode_ppm(raster)
+        done = time.perf_counter()
+        print(
+            f"{side * side:>9,}  {len(raster.pixels):>11,}  {baseline:>10.3f}"
+            f"  {drawn - start:>11.3f}  {encoded - drawn:>6.3f}"
+            f"  {done - encoded:>6.3f}  {len(png) / 1024:>8,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""Measure headless maze generation time as the grid grows."""
+
+import time
+
+from maze_solver_with_python.core.models import Maze, Point
+
+# ── Benchmark matrix ──────────────────────────────────────────────────────────
+SIDES = (50, 100, 200, 400)  # square grids, side × side cells
+REPEATS = 3
+SEED = 42
+
+
+def time_generation(side: int) -> float:
+    """Return the best wall time in seconds to build a ``side × side`` maze."""
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        Maze(Point(0, 0), side, side, 1, 1, win=None, seed=SEED)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """Print generation time and per-cell cost for each grid size."""
+    print(f"{'cells':>10}  {'seconds':>9}  {'µs/cell':>8}")
+    for side in SIDES:
+        cells = side * side
+        elapsed = time_generation(side)
+        print(f"{cells:>10}  {elapsed:>9.3f}  {elapsed / cells * 1e6:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
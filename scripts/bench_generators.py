@@ -0,0 +1,44 @@
+"""Compare generation algorithms by throughput and peak memory."""
+
+import gc
+import time
+import tracemalloc
+
+from maze_solver_with_python.core.generators import GENERATORS
+from maze_solver_with_python.core.models import Maze, Point
+
+# ── Benchmark matrix ──────────────────────────────────────────────────────────
+SIDES = (100, 300)
+GENERATOR_NAMES = ("dfs", *GENERATORS)
+SEED = 42
+
+
+def run(side: int, generator: str) -> tuple[float, int]:
+    """Return generation seconds and traced peak bytes for one maze."""
+    start = time.perf_counter()
+    Maze(Point(0, 0), side, side, 1, 1, seed=SEED, generator=generator)
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    Maze(Point(0, 0), side, side, 1, 1, seed=SEED, generator=generator)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    """Print cells/sec and peak bytes per cell for each generator and size."""
+    print(f"{'cells':>7}  {'generator':<12} {'cells/s':>10}  {'peak B/cell':>11}")
+    for side in SIDES:
+        cells = side * side
+        for name in GENERATOR_NAMES:
+            elapsed, peak = run(side, name)
+            print(
+                f"{cells:>7}  {name:<12} {cells / elapsed:>10,.0f}"
+                f"  {peak / cells:>11.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
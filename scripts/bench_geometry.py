@@ -0,0 +1,75 @@
+"""Measure what cell views and their pixel geometry cost to create.
+
+Cell views are created on every ``_cells[i][j]`` access by the recursive
+carver, the recursive solver and the renderers. Each view now holds a
+reference to the maze's shared layout tuple instead of four coordinates
+built from two ``Point`` objects, so creating one allocates no geometry.
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+
+from maze_solver_with_python.core.models import Maze, Point
+
+# ── Benchmark matrix ──────────────────────────────────────────────────────────
+SIDE = 300
+ACCESSES = 500_000
+POINTS = 100_000
+SEED = 42
+
+
+def point_bytes() -> float:
+    """Return the traced bytes of one ``Point``, instance dict included."""
+    gc.collect()
+    tracemalloc.start()
+    points = [Point(k, k) for k in range(POINTS)]
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del points
+    return retained / POINTS
+
+
+def access_ns(maze: Maze) -> float:
+    """Return the mean cost of one ``_cells[i][j]`` view in nanoseconds."""
+    column = maze._cells[SIDE // 2]
+    start = time.perf_counter()
+    for k in range(ACCESSES):
+        column[k % SIDE]
+    return (time.perf_counter() - start) / ACCESSES * 1e9
+
+
+def view_bytes(maze: Maze) -> float:
+    """Return the traced bytes per cell of holding a view of every cell."""
+    gc.collect()
+    tracemalloc.start()
+    cells = [list(col) for col in maze._cells]
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del cells
+    return retained / (SIDE * SIDE)
+
+
+def build_ms(recursive_solve: bool) -> float:
+    """Return the time to build and solve one headless maze in milliseconds."""
+    start = time.perf_counter()
+    maze = Maze(Point(0, 0), SIDE, SIDE, 10, 10, seed=SEED)
+    maze.solve("recursive" if recursive_solve else "iterative")
+    return (time.perf_counter() - start) * 1e3
+
+
+def main() -> None:
+    """Print value-type sizes, view costs and headless build times."""
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), SIDE * SIDE * 2))
+    maze = Maze(Point(0, 0), SIDE, SIDE, 10, 10, seed=SEED)
+    print(f"Point           {point_bytes():>6.1f} B")
+    print(f"Cell view       {sys.getsizeof(maze._cells[0][0]):>6} B")
+    print(f"view access     {access_ns(maze):>6.0f} ns")
+    print(f"views held      {view_bytes(maze):>6.1f} B/cell")
+    print(f"build + solve   {min(build_ms(False) for _ in range(3)):>6.1f} ms")
+    print(f"  recursive     {min(build_ms(True) for _ in range(3)):>6.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Report what maze instrumentation costs, off and in each mode.
+
+Off, every phase enters one shared no-op context, so the overhead per maze
+is a handful of ``with`` statements. Counters subscribe a listener and turn
+event emission on; profiling and memory tracing cost far more.
+"""
+
+import time
+from collections.abc import Callable
+from contextlib import nullcontext
+from typing import Optional
+
+from maze_solver_with_python.core.instrumentation import Instrumentation
+from maze_solver_with_python.core.models import Maze, Point
+
+# ── Benchmark matrix ──────────────────────────────────────────────────────────
+SIDES = (50, 200)
+REPEATS = 5
+NULL_PHASES = 1_000_000
+MODES: dict[str, Callable[[], Optional[Instrumentation]]] = {
+    "off": lambda: None,
+    "counters": Instrumentation,
+    "cProfile": lambda: Instrumentation(profile=True),
+    "tracemalloc": lambda: Instrumentation(trace_memory=True),
+}
+
+
+def best_ms(side: int, make: Callable[[], Optional[Instrumentation]]) -> float:
+    """Return the fastest of ``REPEATS`` build-and-solve runs in milliseconds."""
+    times = []
+    for seed in range(REPEATS):
+        start = time.perf_counter()
+        maze = Maze(Point(0, 0), side, side, 1, 1, seed=seed, instrumentation=make())
+        maze.solve()
+        maze.find_path("bfs")
+        times.append(time.perf_counter() - start)
+    return min(times) * 1e3
+
+
+def null_phase_ns() -> float:
+    """Return the cost of entering and leaving the shared no-op phase."""
+    context = nullcontext()
+    start = time.perf_counter()
+    for _ in range(NULL_PHASES):
+        with context:
+            pass
+    return (time.perf_counter() - start) / NULL_PHASES * 1e9
+
+
+def main() -> None:
+    """Print one row per size and mode, then the disabled-phase cost."""
+    print(f"{'side':>5}  {'mode':<12} {'ms':>9}  {'vs off':>7}")
+    for side in SIDES:
+        off = best_ms(side, MODES["off"])
+        for name, make in MODES.items():
+            ms = off if name == "off" else best_ms(side, make)
+            print(f"{side:>5}  {name:<12} {ms:>9.2f}  {ms / off:>6.2f}x")
+    cost = null_phase_ns()
+    phases = 6  # four construction phases, solve and find_path
+    off = best_ms(SIDES[0], MODES["off"]) * 1e6
+    print(
+        f"\ndisabled phase: {cost:.0f} ns each, {phases * cost:.0f} ns per "
+        f"{SIDES[0]}x{SIDES[0]} build and solve ({phases * cost / off:.4%})"
+    )
+
+
+if __name__ == "__main__":
+    main()
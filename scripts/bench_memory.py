@@ -0,0 +1,58 @@
+"""Measure the memory footprint of headless mazes with tracemalloc."""
+
+import gc
+import tracemalloc
+
+from maze_solver_with_python.core.models import Maze, Point
+
+# ── Benchmark matrix ──────────────────────────────────────────────────────────
+SIZES = ((40, 25), (400, 250), (1000, 1000))  # (cols, rows): 1k, 100k, 1M cells
+OBJECT_GRID_LIMIT = 100_000  # skip materialising Cell objects above this
+SEED = 42
+
+
+def measure_maze(cols: int, rows: int) -> tuple[Maze, int, int]:
+    """Build a maze and return it with its retained and peak bytes."""
+    gc.collect()
+    tracemalloc.start()
+    maze = Maze(Point(0, 0), rows, cols, 1, 1, win=None, seed=SEED)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return maze, retained, peak
+
+
+def measure_object_grid(maze: Maze) -> int:
+    """Return the bytes needed to hold one :class:`Cell` object per cell.
+
+    This approximates the old layout, where ``_cells`` was a list of lists
+    of cell objects, each carrying its own state.
+    """
+    gc.collect()
+    tracemalloc.start()
+    cells = [list(col) for col in maze._cells]
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del cells
+    return retained
+
+
+def main() -> None:
+    """Print retained and peak bytes per cell for each maze size."""
+    print(
+        f"{'cells':>9}  {'retained B/cell':>15}  {'peak B/cell':>11}"
+        f"  {'object grid B/cell':>18}"
+    )
+    for cols, rows in SIZES:
+        cells = cols * rows
+        maze, retained, peak = measure_maze(cols, rows)
+        if cells <= OBJECT_GRID_LIMIT:
+            objects = f"{measure_object_grid(maze) / cells:>18.1f}"
+        else:
+            objects = f"{'skipped':>18}"
+        print(
+            f"{cells:>9}  {retained / cells:>15.2f}  {peak / cells:>11.2f}  {objects}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Compare the pure-Python and NumPy grid backends on whole-grid queries."""
+
+import time
+from collections.abc import Callable
+from functools import partial
+
+from maze_solver_with_python.core.grid import BOTTOM, WallGrid
+from maze_solver_with_python.core.models import Maze, Point
+
+# ── Benchmark matrix ──────────────────────────────────────────────────────────
+SIDE = 500
+REPEATS = 5
+SEED = 42
+
+
+def best_of(func: Callable[[], object]) -> float:
+    """Return the best wall time in milliseconds over ``REPEATS`` runs."""
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def python_queries(grid: WallGrid) -> dict[str, Callable[[], object]]:
+    """Return the per-cell loop version of each query."""
+    size = range(len(grid))
+    return {
+        "reset visited": grid.reset_visited,
+        "bottom walls": lambda: [grid.has_wall(idx, BOTTOM) for idx in size],
+        "degrees": lambda: [len(grid.open_neighbors(idx)) for idx in size],
+        "dead ends": lambda: [
+            idx for idx in size if len(grid.open_neighbors(idx)) == 1
+        ],
+    }
+
+
+def numpy_queries(grid: WallGrid) -> dict[str, Callable[[], object]]:
+    """Return the vectorised version of each query."""
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    indices = np.arange(len(grid))
+    return {
+        "reset visited": grid.reset_visited,
+        "bottom walls": lambda: grid.has_walls(indices, BOTTOM),  # type: ignore[attr-defined]
+        "degrees": grid.degrees,  # type: ignore[attr-defined]
+        "dead ends": grid.dead_ends,  # type: ignore[attr-defined]
+    }
+
+
+def main() -> None:
+    """Print per-query timings for both backends and the speed-up."""
+    mazes = {
+        backend: Maze(Point(0, 0), SIDE, SIDE, 1, 1, seed=SEED, backend=backend)
+        for backend in ("python", "numpy")
+    }
+    py_queries = python_queries(mazes["python"]._grid)
+    np_queries = numpy_queries(mazes["numpy"]._grid)
+
+    print(f"{SIDE * SIDE:,} cells")
+    print(f"{'query':<16} {'python ms':>10}  {'numpy ms':>9}  {'speed-up':>8}")
+    for name, func in py_queries.items():
+        py_ms = best_of(func)
+        np_ms = best_of(np_queries[name])
+        print(f"{name:<16} {py_ms:>10.2f}  {np_ms:>9.2f}  {py_ms / np_ms:>7.1f}x")
+
+    for solver in ("bfs", "astar"):
+        py_ms = best_of(partial(mazes["python"].find_path, solver))
+        np_ms = best_of(partial(mazes["numpy"].find_path, solver))
+        name = f"solve {solver}"
+        print(f"{name:<16} {py_ms:>10.2f}  {np_ms:>9.2f}  {py_ms / np_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
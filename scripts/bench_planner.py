@@ -0,0 +1,88 @@
+"""Compare incremental path repair with solving again after each mutation.
+
+Random interior walls are toggled on a maze with a planner subscribed, like
+doors: every other mutation flips a new wall and the next one flips it back.
+A perfect maze has about half its interior walls open, which is the
+threshold where closing walls starts cutting the goal off, so a further
+``LOOPS`` × cells random walls are opened first. Full solves are timed with BFS on the layout after
+every ``FULL_EVERY``-th mutation and averaged.
+"""
+
+import random
+import statistics
+import time
+
+from maze_solver_with_python.core.grid import DIRECTIONS
+from maze_solver_with_python.core.models import Maze, Point
+
+# ── Benchmark matrix ──────────────────────────────────────────────────────────
+SIDES = (100, 300)
+SEED = 42
+MUTATIONS = 10_000
+FULL_EVERY = 500
+LOOPS = 1.0
+
+
+def random_wall(rng: random.Random, side: int) -> tuple[tuple[int, int], str]:
+    """Return a random cell and direction."""
+    return (rng.randrange(side), rng.randrange(side)), rng.choice(DIRECTIONS)
+
+
+def run(side: int) -> tuple[float, float, float, float, float]:
+    """Return repair p50 and p99 µs, BFS µs, cells per repair and path rate."""
+    maze = Maze(Point(0, 0), side, side, 1, 1, seed=SEED, generator="kruskal")
+    rng = random.Random(SEED)
+    for _ in range(int(LOOPS * side * side)):
+        cell, direction = random_wall(rng, side)
+        try:
+            maze.set_wall(cell, direction, False)
+        except ValueError:
+            continue
+    planner = maze.plan()
+    expanded = planner.expanded
+    repairs: list[float] = []
+    full: list[float] = []
+    found = 0
+    door: tuple[tuple[int, int], str] | None = None
+    while len(repairs) < MUTATIONS:
+        cell, direction = door or random_wall(rng, side)
+        start = time.perf_counter()
+        try:
+            maze.toggle_wall(cell, direction)
+        except ValueError:
+            continue
+        repairs.append(time.perf_counter() - start)
+        door = None if door else (cell, direction)
+        found += planner.distance >= 0
+        if len(repairs) % FULL_EVERY == 0:
+            start = time.perf_counter()
+            maze.find_path("bfs")
+            full.append(time.perf_counter() - start)
+    per_repair = (planner.expanded - expanded) / MUTATIONS
+    repairs.sort()
+    return (
+        statistics.median(repairs) * 1e6,
+        repairs[int(len(repairs) * 0.99)] * 1e6,
+        statistics.fmean(full) * 1e6,
+        per_repair,
+        found / MUTATIONS,
+    )
+
+
+def main() -> None:
+    """Print per-mutation repair latency against a full solve."""
+    print(f"{MUTATIONS:,} random wall toggles per maze")
+    print(
+        f"{'cells':>9}  {'repair p50 µs':>13}  {'repair p99 µs':>13}"
+        f"  {'bfs µs':>9}  {'cells/repair':>12}  {'connected':>9}"
+    )
+    for side in SIDES:
+        p50, p99, bfs, cells, found = run(side)
+        print(
+            f"{side * side:>9,}  {p50:>13.1f}  {p99:>13.1f}  {bfs:>9,.0f}"
+            f"  {cells:>12.1f}  {found:>9.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Compare canvas work of per-draw lines with the batched renderer.
+
+Replays the cell and move drawing of generating and solving a maze against a
+counting canvas. The legacy window adds four lines per cell draw, painting
+removed walls white, and never deletes anything; the batched window goes
+through :class:`~maze_solver_with_python.core.rendering.CanvasRenderer`.
+"""
+
+import time
+
+from maze_solver_with_python.core.models import Line, Maze, Point
+from maze_solver_with_python.core.rendering import CanvasRenderer
+
+# ── Benchmark matrix ──────────────────────────────────────────────────────────
+SIDES = (20, 50, 100)
+CELL = 10
+SEED = 42
+
+
+class CountingCanvas:
+    """Canvas stand-in that counts calls and live items."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.live = 0
+        self.peak = 0
+
+    def create_line(
+        self, x1: int, y1: int, x2: int, y2: int, /, *, fill: str, width: int
+    ) -> int:
+        """Count a new item."""
+        del x1, y1, x2, y2, fill, width
+        self.calls += 1
+        self.live += 1
+        self.peak = max(self.peak, self.live)
+        return self.live
+
+    def itemconfigure(self, item: int, /, *, fill: str) -> None:
+        """Count a recolour."""
+        del item, fill
+        self.calls += 1
+
+    def delete(self, item: int, /) -> None:
+        """Count a removed item."""
+        del item
+        self.calls += 1
+        self.live -= 1
+
+
+class LegacyWindow:
+    """Draws every line immediately as a new item, as before batching."""
+
+    def __init__(self, canvas: CountingCanvas) -> None:
+        self.canvas = canvas
+
+    def step(self) -> None:
+        """Nothing is queued."""
+
+    def draw_line(
+        self, line: Line, fill_color: str = "black", visible: bool = True
+    ) -> None:
+        """Add one line item."""
+        color = fill_color if visible else "white"
+        self.canvas.create_line(
+            line.p1.x, line.p1.y, line.p2.x, line.p2.y, fill=color, width=2
+        )
+
+    def draw_cell(self, x1: int, y1: int, x2: int, y2: int, mask: int) -> None:
+        """Add four line items, white for removed walls."""
+        for bit, segment in (
+            (4, (x1, y1, x1, y2)),
+            (8, (x2, y1, x2, y2)),
+            (1, (x1, y1, x2, y1)),
+            (2, (x1, y2, x2, y2)),
+        ):
+            color = "black" if mask & bit else "white"
+            self.canvas.create_line(*segment, fill=color, width=2)
+
+
+class BatchedWindow:
+    """Queues drawing in a renderer and flushes it once per frame."""
+
+    def __init__(self, canvas: CountingCanvas) -> None:
+        self.renderer = CanvasRenderer(canvas)
+
+    def step(self) -> None:
+        """Flush one frame per step."""
+        self.renderer.flush()
+
+    def draw_line(
+        self, line: Line, fill_color: str = "black", visible: bool = True
+    ) -> None:
+        """Queue one segment."""
+        segment = (line.p1.x, line.p1.y, line.p2.x, line.p2.y)
+        self.renderer.set_segment(segment, fill_color if visible else None)
+
+    def draw_cell(self, x1: int, y1: int, x2: int, y2: int, mask: int) -> None:
+        """Queue the cell's walls."""
+        self.renderer.set_walls(x1, y1, x2, y2, mask)
+
+
+def run(side: int, window_cls: type[LegacyWindow | BatchedWindow]) -> tuple:
+    """Return seconds, canvas calls, live items and peak items for one run."""
+    canvas = CountingCanvas()
+    win = window_cls(canvas)
+    start = time.perf_counter()
+    maze = Maze(Point(0, 0), side, side, CELL, CELL, win=win, seed=SEED)  # type: ignore[arg-type]
+    maze.solve()
+    win.step()
+    return time.perf_counter() - start, canvas.calls, canvas.live, canvas.peak
+
+
+def main() -> None:
+    """Print canvas calls and item counts for both windows per maze size."""
+    print(
+        f"{'cells':>7}  {'window':<8} {'ms':>8}  {'canvas calls':>12}"
+        f"  {'items':>7}  {'peak':>7}"
+    )
+    for side in SIDES:
+        for name, window_cls in (("legacy", LegacyWindow), ("batched", BatchedWindow)):
+            elapsed, calls, live, peak = run(side, window_cls)
+            print(
+                f"{side * side:>7}  {name:<8} {elapsed * 1e3:>8.1f}"
+                f"  {calls:>12,}  {live:>7,}  {peak:>7,}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Load-test the maze HTTP service with concurrent keep-alive clients.
+
+Each run starts a fresh service on a free local port with a process pool,
+then every client sends its requests back to back over one connection.
+``unique`` asks for a new seed every time, so each request is a build;
+``hot`` draws seeds from a small pool, the way popular mazes repeat, so
+most requests are coalesced with a build in flight or served from cache.
+"""
+
+import asyncio
+import random
+import time
+
+from maze_solver_with_python.core.bench import percentile
+from maze_solver_with_python.core.server import MazeService, fetch
+
+# ── Benchmark matrix ──────────────────────────────────────────────────────────
+SIDE = 100
+WORKERS = 4
+CLIENTS = (1, 16, 64)
+REQUESTS = 256  # per run, shared between the clients
+HOT_SEEDS = 16
+SEED = 42
+
+
+async def client(
+    port: int, seeds: list[int], latencies: list[float], endpoint: str
+) -> None:
+    """Request every seed in *seeds* over one connection."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    for seed in seeds:
+        start = time.perf_counter()
+        status, _ = await fetch(
+            reader, writer, f"/{endpoint}?seed={seed}&rows={SIDE}&cols={SIDE}"
+        )
+        latencies.append(time.perf_counter() - start)
+        assert status == 200
+    writer.close()
+    await writer.wait_closed()
+
+
+async def run(
+    clients: int, pattern: str, endpoint: str
+) -> tuple[list[float], float, dict[str, int]]:
+    """Run one load test; return latencies, elapsed seconds and counters."""
+    rng = random.Random(SEED)
+    if pattern == "unique":
+        seeds = list(range(REQUESTS))
+    else:
+        seeds = [rng.randrange(HOT_SEEDS) for _ in range(REQUESTS)]
+    service = MazeService(workers=WORKERS)
+    latencies: list[float] = []
+    try:
+        listener = await service.start("127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        await service.get(-1, SIDE, SIDE)  # start the worker processes
+        async with listener:
+            start = time.perf_counter()
+            await asyncio.gather(
+                *(
+                    client(port, seeds[k::clients], latencies, endpoint)
+                    for k in range(clients)
+                )
+            )
+            elapsed = time.perf_counter() - start
+    finally:
+        service.close()
+    return latencies, elapsed, service.stats()
+
+
+def main() -> None:
+    """Print latency percentiles and throughput for each scenario."""
+    print(f"{SIDE}x{SIDE} mazes, {WORKERS} worker processes, {REQUESTS} requests")
+    print(
+        f"{'pattern':<7} {'endpoint':<7} {'clients':>7}  {'p50 ms':>8}  {'p99 ms':>8}"
+        f"  {'req/s':>8}  {'builds':>6}  {'coalesced':>9}  {'hits':>5}"
+    )
+    for pattern in ("unique", "hot"):
+        for endpoint in ("maze", "layout"):
+            for clients in CLIENTS:
+                latencies, elapsed, stats = asyncio.run(run(clients, pattern, endpoint))
+                print(
+                    f"{pattern:<7} {endpoint:<7} {clients:>7}"
+                    f"  {percentile(latencies, 50) * 1e3:>8.2f}"
+                    f"  {percentile(latencies, 99) * 1e3:>8.2f}"
+                    f"  {len(latencies) / elapsed:>8.0f}"
+                    f"  {stats['builds'] - 1:>6}  {stats['coalesced']:>9}"
+                    f"  {stats['hits']:>5}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Compare the recursive and iterative depth-first solvers."""
+
+import sys
+import time
+
+from maze_solver_with_python.core.models import Maze, Point
+
+# ── Benchmark matrix ──────────────────────────────────────────────────────────
+SIDES = (10, 20, 30)  # kept small enough for the recursive solver's stack
+REPEATS = 50
+SEED = 42
+
+
+def time_solve(side: int, method: str) -> float:
+    """Return the mean wall time in seconds to solve a ``side × side`` maze."""
+    maze = Maze(Point(0, 0), side, side, 1, 1, win=None, seed=SEED)
+    total = 0.0
+    for _ in range(REPEATS):
+        maze._reset_cells_visited()
+        start = time.perf_counter()
+        maze.solve(method)
+        total += time.perf_counter() - start
+    return total / REPEATS
+
+
+def main() -> None:
+    """Print mean solve time per method and the iterative speed-up."""
+    sys.setrecursionlimit(10_000)
+    print(f"{'cells':>8}  {'recursive ms':>12}  {'iterative ms':>12}  {'speed-up':>8}")
+    for side in SIDES:
+        recursive = time_solve(side, "recursive")
+        iterative = time_solve(side, "iterative")
+        print(
+            f"{side * side:>8}  {recursive * 1e3:>12.3f}  {iterative * 1e3:>12.3f}"
+            f"  {recursive / iterative:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
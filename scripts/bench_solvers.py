@@ -0,0 +1,43 @@
+"""Compare the registered solvers by wall time and cells expanded."""
+
+import time
+
+from maze_solver_with_python.core.models import Maze, Point
+from maze_solver_with_python.core.solvers import SOLVERS
+
+# ── Benchmark matrix ──────────────────────────────────────────────────────────
+SIDES = (25, 100, 300)
+REPEATS = 5
+SEED = 42
+
+
+def time_solver(maze: Maze, name: str) -> tuple[float, int, int]:
+    """Return best wall time, cells expanded and path length for *name*."""
+    best = float("inf")
+    result = maze.find_path(name)
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = maze.find_path(name)
+        best = min(best, time.perf_counter() - start)
+    return best, result.expanded, len(result.path)
+
+
+def main() -> None:
+    """Print one row per (maze size, solver) pair."""
+    print(
+        f"{'cells':>7}  {'solver':<14} {'ms':>9}  {'expanded':>9}  {'% grid':>6}"
+        f"  {'path':>6}"
+    )
+    for side in SIDES:
+        cells = side * side
+        maze = Maze(Point(0, 0), side, side, 1, 1, win=None, seed=SEED)
+        for name in SOLVERS:
+            elapsed, expanded, length = time_solver(maze, name)
+            print(
+                f"{cells:>7}  {name:<14} {elapsed * 1e3:>9.2f}  {expanded:>9}"
+                f"  {expanded / cells:>6.1%}  {length:>6}"
+            )
+
+
+if __name__ == "__main__":
+    main()
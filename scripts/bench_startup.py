@@ -0,0 +1,59 @@
+"""Measure the cold start of headless runs in fresh interpreters.
+
+Each sample is a new ``python`` process, so module imports are paid every
+time, as in a containerised batch job. The import probe also reports whether
+:mod:`tkinter` was loaded, which fails on interpreters built without Tk.
+"""
+
+import statistics
+import subprocess  # nosec
+import sys
+import time
+
+# ── Benchmark matrix ──────────────────────────────────────────────────────────
+RUNS = 15
+COMMANDS = {
+    "import models": [
+        "-c",
+        "import sys, maze_solver_with_python.core.models;"
+        " print('tkinter' in sys.modules)",
+    ],
+    "import CLI": ["-c", "import maze_solver_with_python.__main__"],
+    "maze solve 10x10": [
+        "-m",
+        "maze_solver_with_python",
+        "solve",
+        "--rows",
+        "10",
+        "--cols",
+        "10",
+        "--seed",
+        "1",
+    ],
+    "bare interpreter": ["-c", "pass"],
+}
+
+
+def sample_ms(args: list[str]) -> tuple[float, str]:
+    """Return the median wall time of ``RUNS`` processes and the last output."""
+    times, out = [], ""
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        done = subprocess.run(  # nosec
+            [sys.executable, *args], capture_output=True, text=True, check=True
+        )
+        times.append(time.perf_counter() - start)
+        out = done.stdout.strip()
+    return statistics.median(times) * 1e3, out
+
+
+def main() -> None:
+    """Print the median start-up time of each command."""
+    print(f"{'command':<18} {'median ms':>9}  output")
+    for name, args in COMMANDS.items():
+        ms, out = sample_ms(args)
+        print(f"{name:<18} {ms:>9.1f}  {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Compare opening a saved maze with regenerating it from its seed."""
+
+import tempfile
+import time
+from pathlib import Path
+
+from maze_solver_with_python.core.models import Maze, Point
+
+# ── Benchmark matrix ──────────────────────────────────────────────────────────
+SIDES = (100, 300, 1000)
+SEED = 42
+
+
+def main() -> None:
+    """Print regenerate, save and load times and the load speed-up."""
+    print(
+        f"{'cells':>9}  {'file KB':>8}  {'regen ms':>9}  {'save ms':>8}"
+        f"  {'load ms':>8}  {'load+solve ms':>13}  {'speed-up':>9}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for side in SIDES:
+            path = Path(tmp) / f"{side}.maze"
+
+            start = time.perf_counter()
+            maze = Maze(Point(0, 0), side, side, 1, 1, seed=SEED)
+            regen = time.perf_counter() - start
+
+            start = time.perf_counter()
+            size = maze.save(path)
+            save = time.perf_counter() - start
+
+            start = time.perf_counter()
+            loaded = Maze.load(path)
+            load = time.perf_counter() - start
+            loaded.find_path("bfs")
+            solved = time.perf_counter() - start
+            loaded._grid.close()  # type: ignore[attr-defined]
+
+            print(
+                f"{side * side:>9,}  {size / 1024:>8.1f}  {regen * 1e3:>9.1f}"
+                f"  {save * 1e3:>8.2f}  {load * 1e3:>8.3f}  {solved * 1e3:>13.1f}"
+                f"  {regen / load:>8.0f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
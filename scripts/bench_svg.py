@@ -0,0 +1,51 @@
+"""Report SVG segment counts and export throughput for large mazes.
+
+``per-cell`` is what drawing each cell's four ``configs`` walls produces:
+one segment per set wall bit, so shared walls appear twice. ``unique`` counts
+each wall once, and ``runs`` is what :func:`write_svg` emits after merging
+collinear neighbours.
+"""
+
+import io
+import os
+import time
+
+from maze_solver_with_python.core.export import wall_runs, write_svg
+from maze_solver_with_python.core.models import Maze, Point
+
+# ── Benchmark matrix ──────────────────────────────────────────────────────────
+SIDES = (500, 2000)
+SEED = 42
+GENERATOR = "kruskal"
+
+_POPCOUNT = bytes(bin(m).count("1") for m in range(256))
+
+
+def main() -> None:
+    """Print segment counts and export speed per maze size."""
+    print(
+        f"{'cells':>9}  {'per-cell':>10}  {'unique':>10}  {'runs':>9}"
+        f"  {'reduction':>9}  {'export s':>8}  {'Mcells/s':>8}  {'MB':>6}"
+    )
+    for side in SIDES:
+        maze = Maze(Point(0, 0), side, side, 1, 1, seed=SEED, generator=GENERATOR)
+        grid = maze._grid
+        path = maze.find_path().path
+        walls = bytes(grid.walls)
+        per_cell = sum(walls.translate(_POPCOUNT))
+        unique = (per_cell + 2 * side) // 2  # border walls are not shared
+        runs = sum(1 for _ in wall_runs(grid))
+        with open(os.devnull, "w", encoding="ascii") as sink:
+            start = time.perf_counter()
+            write_svg(grid, sink, path)
+            elapsed = time.perf_counter() - start
+        size = write_svg(grid, io.StringIO(), path)
+        print(
+            f"{side * side:>9,}  {per_cell:>10,}  {unique:>10,}  {runs:>9,}"
+            f"  {per_cell / runs:>8.1f}x  {elapsed:>8.2f}"
+            f"  {side * side / elapsed / 1e6:>8.1f}  {size / 1e6:>6.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
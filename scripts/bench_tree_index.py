@@ -0,0 +1,67 @@
+"""Compare random path queries on a tree index with one BFS per query.
+
+One million queries are answered from the index. Per-query BFS is timed on a
+sample of ``BFS_SAMPLE`` queries and scaled up, since running a full search a
+million times would take hours.
+"""
+
+import random
+import time
+
+from maze_solver_with_python.core.models import Maze, Point
+
+# ── Benchmark matrix ──────────────────────────────────────────────────────────
+SIDES = (100, 300)
+SEED = 42
+QUERIES = 1_000_000
+PATH_QUERIES = 10_000
+BFS_SAMPLE = 50
+
+
+def run(side: int) -> tuple[float, float, float, float]:
+    """Return build seconds and µs per distance, path and BFS query."""
+    maze = Maze(Point(0, 0), side, side, 1, 1, seed=SEED, generator="kruskal")
+    rng = random.Random(SEED)
+    cells = [(i, j) for i in range(side) for j in range(side)]
+    pairs = [(rng.choice(cells), rng.choice(cells)) for _ in range(QUERIES)]
+
+    start = time.perf_counter()
+    index = maze.tree_index()
+    build = time.perf_counter() - start
+
+    distance = index.distance
+    start = time.perf_counter()
+    for a, b in pairs:
+        distance(a, b)
+    per_distance = (time.perf_counter() - start) / QUERIES
+
+    path = index.path
+    start = time.perf_counter()
+    for a, b in pairs[:PATH_QUERIES]:
+        path(a, b)
+    per_path = (time.perf_counter() - start) / PATH_QUERIES
+
+    start = time.perf_counter()
+    for a, b in pairs[:BFS_SAMPLE]:
+        maze.find_path("bfs", start=a, goal=b)
+    per_bfs = (time.perf_counter() - start) / BFS_SAMPLE
+    return build, per_distance * 1e6, per_path * 1e6, per_bfs * 1e6
+
+
+def main() -> None:
+    """Print build time and per-query cost for each maze size."""
+    print(f"{QUERIES:,} random queries per maze")
+    print(
+        f"{'cells':>9}  {'build s':>8}  {'distance µs':>11}  {'path µs':>8}"
+        f"  {'bfs µs':>9}  {'1M index s':>10}  {'1M bfs s':>9}"
+    )
+    for side in SIDES:
+        build, distance, path, bfs = run(side)
+        print(
+            f"{side * side:>9,}  {build:>8.3f}  {distance:>11.2f}  {path:>8.1f}"
+            f"  {bfs:>9.0f}  {build + distance:>10.1f}  {bfs:>9,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
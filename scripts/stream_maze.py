@@ -0,0 +1,49 @@
+"""Stream a large Eller's maze straight to disk with flat memory use.
+
+Usage::
+
+    uv run python scripts/stream_maze.py 100000 100000 big.maze --seed 1
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+from pathlib import Path
+
+from maze_solver_with_python.core.generators import stream_eller
+from maze_solver_with_python.core.storage import write_rows
+
+
+def main() -> None:
+    """Write the maze and report throughput and traced peak memory."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("cols", type=int)
+    parser.add_argument("rows", type=int)
+    parser.add_argument("output", type=Path)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    with args.output.open("wb") as file:
+        written = write_rows(
+            file,
+            args.cols,
+            args.rows,
+            stream_eller(args.cols, args.rows, random.Random(args.seed)),  # nosec
+            seed=args.seed,
+            generator="eller",
+        )
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    cells = args.cols * args.rows
+    print(f"Saved: {args.output} ({written:,} bytes)")
+    print(f"{cells:,} cells in {elapsed:.2f}s ({cells / elapsed:,.0f} cells/s)")
+    print(f"Peak traced memory: {peak:,} bytes ({peak / args.cols:.1f} B/column)")
+
+
+if __name__ == "__main__":
+    main()